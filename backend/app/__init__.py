@@ -4,7 +4,9 @@ Design decisions:
 - Factory pattern allows creating multiple app instances (useful for testing)
 - Extensions are initialized here but created in extensions.py (avoids circular imports)
 - Blueprints are registered via api/__init__.py (keeps this file focused)
-- Tables are auto-created in dev/test (no migration needed during development)
+- app.json is chosen by Config.JSON_PROVIDER (see json_provider.py)
+- Tables are auto-created in dev/test (no migration needed during development),
+  along with the SQLite full-text search index (see search.py)
 
 Note: The Flask instance is named 'flask_app' (not 'app') to avoid a
 Python naming conflict with the 'app' package itself.
@@ -14,9 +16,13 @@ import os
 import logging
 from flask import Flask
 from app.config import config_by_name
-from app.extensions import db, ma, migrate, cors
+from app.extensions import db, ma, migrate, cors, response_cache
 from app.errors import register_error_handlers
 from app.middleware import register_middleware
+from app.commands import register_commands
+from app.database import build_engine_options, apply_sqlite_pragmas
+from app.json_provider import init_json_provider
+from app.replica import REPLICA_BIND, init_routing
 
 
 def create_app(config_name=None):
@@ -33,17 +39,30 @@ def create_app(config_name=None):
     flask_app.config.from_object(config_by_name[config_name])
 
     # Initialize extensions
+    flask_app.config["SQLALCHEMY_ENGINE_OPTIONS"] = build_engine_options(flask_app.config)
+    if flask_app.config.get("READ_REPLICA_URL"):
+        flask_app.config["SQLALCHEMY_BINDS"] = {
+            **flask_app.config.get("SQLALCHEMY_BINDS", {}),
+            REPLICA_BIND: flask_app.config["READ_REPLICA_URL"],
+        }
     db.init_app(flask_app)
+    # The replica mirrors the primary's tables and has no models of its own;
+    # dropping its empty metadata keeps create_all/drop_all off the replica
+    db.metadatas.pop(REPLICA_BIND, None)
+    init_routing(flask_app, db.session)
     ma.init_app(flask_app)
     migrate.init_app(flask_app, db)
     cors.init_app(flask_app, resources={r"/api/*": {"origins": "*"}})
+    response_cache.init_app(flask_app)
 
     # Configure logging
     _configure_logging(flask_app)
+    init_json_provider(flask_app)
 
     # Register error handlers and middleware
     register_error_handlers(flask_app)
     register_middleware(flask_app)
+    register_commands(flask_app)
 
     # Register API blueprints
     from app.api import register_blueprints
@@ -51,7 +70,15 @@ def create_app(config_name=None):
 
     # Create tables (for development / testing without migrations)
     with flask_app.app_context():
-        from app import models  # noqa: F401 — triggers model registration
+        pragmas = flask_app.config["SQLITE_PRAGMAS"]
+        apply_sqlite_pragmas(db.engine, pragmas)
+        if REPLICA_BIND in db.engines:
+            # The replica is read-only; its journal mode is the primary's business
+            apply_sqlite_pragmas(
+                db.engines[REPLICA_BIND],
+                {k: v for k, v in pragmas.items() if k != "journal_mode"},
+            )
+        from app import models, search  # noqa: F401 — registers models and the FTS5 DDL
         db.create_all()
 
     return flask_app
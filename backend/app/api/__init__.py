@@ -14,9 +14,15 @@ def register_blueprints(app):
     from app.api.deliverables import deliverables_bp
     from app.api.dashboard import dashboard_bp
     from app.api.ai import ai_bp
+    from app.api.search import search_bp
+    from app.api.export import export_bp
+    from app.api.imports import imports_bp
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(clients_bp, url_prefix="/api/clients")
     app.register_blueprint(projects_bp, url_prefix="/api/projects")
     app.register_blueprint(deliverables_bp, url_prefix="/api/deliverables")
     app.register_blueprint(dashboard_bp, url_prefix="/api/dashboard")
     app.register_blueprint(ai_bp, url_prefix="/api/ai")
+    app.register_blueprint(search_bp, url_prefix="/api/search")
+    app.register_blueprint(export_bp, url_prefix="/api/export")
+    app.register_blueprint(imports_bp, url_prefix="/api/import")
@@ -12,7 +12,6 @@ from the AI (or mock results if no API key).
 
 from flask import Blueprint, request, jsonify
 from app.services.ai_engine import AIEngine
-from app.models.client import Client
 from app.models.project import Project
 from app.errors import AppError, NotFoundError
 from app.api.auth_utils import get_current_user_id
@@ -46,16 +45,12 @@ def analyze_risk():
         raise AppError("Missing 'project_id' in request body", code="VALIDATION_ERROR", status_code=400)
     
     # 1. Verify project ownership and fetch context
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
-    )
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", project_id)
     
     # 2. Build context for AI
-    deliverables = project.deliverables.all()
+    deliverables = project.deliverables
     context = {
         "project_title": project.title,
         "deadline": project.deadline.isoformat() if project.deadline else "None",
@@ -82,16 +77,12 @@ def generate_update():
     if not project_id:
         raise AppError("Missing 'project_id' in request body", code="VALIDATION_ERROR", status_code=400)
     
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
-    )
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", project_id)
     
     # Context for writing
-    deliverables = project.deliverables.all()
+    deliverables = project.deliverables
     context = {
         "client_name": project.client.name,
         "company": project.client.company,
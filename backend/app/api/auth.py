@@ -11,6 +11,7 @@ from flask import Blueprint, request, jsonify, current_app
 from app.extensions import db
 from app.models.user import User
 from app.schemas import UserRegistrationSchema, UserLoginSchema, UserResponseSchema
+from app.serializers import serializer
 from app.errors import AppError
 
 auth_bp = Blueprint("auth", __name__)
@@ -18,7 +19,7 @@ auth_bp = Blueprint("auth", __name__)
 # Schema instances
 _registration_schema = UserRegistrationSchema()
 _login_schema = UserLoginSchema()
-_user_response_schema = UserResponseSchema()
+_user_serializer = serializer(UserResponseSchema)
 
 
 def _create_token(user_id):
@@ -58,7 +59,7 @@ def signup():
     token = _create_token(user.id)
 
     return jsonify({
-        "data": _user_response_schema.dump(user),
+        "data": _user_serializer.dump(user),
         "access_token": token
     }), 201
 
@@ -76,6 +77,6 @@ def login():
     token = _create_token(user.id)
 
     return jsonify({
-        "data": _user_response_schema.dump(user),
+        "data": _user_serializer.dump(user),
         "access_token": token
     }), 200
@@ -4,14 +4,21 @@ Used to extract the current user identity from JWT tokens or sessions.
 """
 
 import jwt
-from flask import request, current_app, session
+from flask import g, request, current_app, session
 from app.errors import AppError
 
 def get_current_user_id():
     """Extract user ID from JWT token in Authorization header.
     
     Falls back to session if no Authorization header is present (legacy/test support).
+    The ID is also stored in g.current_user_id (used for read-replica routing).
     """
+    user_id = _resolve_user_id()
+    g.current_user_id = user_id
+    return user_id
+
+
+def _resolve_user_id():
     auth_header = request.headers.get("Authorization")
     
     if not auth_header:
@@ -1,18 +1,28 @@
 """Clients API — full CRUD for managing clients.
 
 Endpoints:
-    GET    /api/clients                       → List all clients (for current user)
+    GET    /api/clients                       → List clients (for current user, paginated)
     POST   /api/clients                       → Create a new client
-    GET    /api/clients/<id>                  → Get a single client
+    GET    /api/clients/<id>                  → Get a single client (?include=projects)
     PUT    /api/clients/<id>                  → Update a client
     DELETE /api/clients/<id>                  → Delete a client
-    GET    /api/clients/<id>/projects         → List projects for this client
+    GET    /api/clients/<id>/projects         → List projects for this client (paginated)
+
+GET endpoints accept ?fields=a,b,c to return (and load) only those fields.
 
 Design decisions:
 - Every request is scoped to the current user (user_id from session).
 - All inputs go through Marshmallow schemas before touching the DB.
 - Responses use a consistent JSON shape: {"data": ...} or {"error": ...}
 - 404 errors use the centralized NotFoundError for consistency.
+- List endpoints use keyset pagination (?limit=&cursor=) and return
+  "next_cursor" next to "data".
+- Sparse fieldsets (?fields=) restrict both the SELECT and the serializer,
+  see api/fieldsets.py.
+- The detail endpoint nests ?include= relationships, loaded with
+  selectinload behind the same ownership check, see api/includes.py.
+- Conditional GET: responses carry a weak ETag and a matching
+  If-None-Match gets a 304 without touching the database, see api/etags.py.
 """
 
 from flask import Blueprint, request, jsonify, session
@@ -21,29 +31,46 @@ from app.models.client import Client
 from app.models.project import Project
 from app.errors import NotFoundError, AppError
 from app.api.auth_utils import get_current_user_id
+from app.api.etags import conditional
+from app.api.fieldsets import get_fields, select_fields
+from app.api.includes import get_includes, load_includes, dump_includes
+from app.api.pagination import get_page_args, paginate
+from app.api.read_models import select_rows
 from app.schemas import (
     ClientCreateSchema,
     ClientUpdateSchema,
     ClientResponseSchema,
     ProjectResponseSchema,
 )
+from app.serializers import serializer
 
 clients_bp = Blueprint("clients", __name__)
 
 # Schema instances (reusable, stateless)
 _create_schema = ClientCreateSchema()
 _update_schema = ClientUpdateSchema()
-_response_schema = ClientResponseSchema()
-_response_list_schema = ClientResponseSchema(many=True)
-_project_response_list_schema = ProjectResponseSchema(many=True)
+_serializer = serializer(ClientResponseSchema)
+
+# Relationships GET /api/clients/<id> can embed via ?include=
+_includes = {"projects": serializer(ProjectResponseSchema, many=True)}
 
 
 @clients_bp.route("", methods=["GET"])
+@conditional()
 def list_clients():
-    """List all clients for the current user."""
+    """List clients for the current user, newest first."""
     user_id = get_current_user_id()
-    clients = Client.query.filter_by(user_id=user_id).order_by(Client.created_at.desc()).all()
-    return jsonify({"data": _response_list_schema.dump(clients)}), 200
+    limit, cursor = get_page_args()
+    fields = get_fields(ClientResponseSchema)
+
+    rows, next_cursor = paginate(
+        select_rows(ClientResponseSchema, fields).where(Client.user_id == user_id),
+        Client, limit, cursor,
+    )
+    return jsonify({
+        "data": serializer(ClientResponseSchema, fields, many=True).dump(rows),
+        "next_cursor": next_cursor,
+    }), 200
 
 
 @clients_bp.route("", methods=["POST"])
@@ -62,18 +89,25 @@ def create_client():
     db.session.add(client)
     db.session.commit()
 
-    return jsonify({"data": _response_schema.dump(client)}), 201
+    return jsonify({"data": _serializer.dump(client)}), 201
 
 
 @clients_bp.route("/<int:client_id>", methods=["GET"])
+@conditional()
 def get_client(client_id):
-    """Get a single client by ID."""
+    """Get a single client by ID, with any ?include= relationships nested."""
     user_id = get_current_user_id()
-    client = Client.query.filter_by(id=client_id, user_id=user_id).first()
+    fields = get_fields(ClientResponseSchema)
+    includes = get_includes(_includes)
+    query = select_fields(
+        Client.query.filter_by(id=client_id, user_id=user_id), ClientResponseSchema, fields
+    )
+    client = load_includes(query, Client, includes, fields).first()
     if not client:
         raise NotFoundError("Client", client_id)
 
-    return jsonify({"data": _response_schema.dump(client)}), 200
+    payload = serializer(ClientResponseSchema, fields).dump(client)
+    return jsonify({"data": dump_includes(payload, client, includes, _includes)}), 200
 
 
 @clients_bp.route("/<int:client_id>", methods=["PUT"])
@@ -97,7 +131,7 @@ def update_client(client_id):
         client.notes = data["notes"]
 
     db.session.commit()
-    return jsonify({"data": _response_schema.dump(client)}), 200
+    return jsonify({"data": _serializer.dump(client)}), 200
 
 
 @clients_bp.route("/<int:client_id>", methods=["DELETE"])
@@ -114,19 +148,23 @@ def delete_client(client_id):
 
 
 @clients_bp.route("/<int:client_id>/projects", methods=["GET"])
+@conditional()
 def list_client_projects(client_id):
-    """List all projects for a specific client (scoped to current user)."""
+    """List projects for a specific client (scoped to current user)."""
     user_id = get_current_user_id()
+    limit, cursor = get_page_args()
+    fields = get_fields(ProjectResponseSchema)
 
     # Verify client belongs to user
     client = Client.query.filter_by(id=client_id, user_id=user_id).first()
     if not client:
         raise NotFoundError("Client", client_id)
 
-    projects = (
-        Project.query
-        .filter_by(client_id=client_id)
-        .order_by(Project.created_at.desc())
-        .all()
+    rows, next_cursor = paginate(
+        select_rows(ProjectResponseSchema, fields).where(Project.client_id == client_id),
+        Project, limit, cursor,
     )
-    return jsonify({"data": _project_response_list_schema.dump(projects)}), 200
+    return jsonify({
+        "data": serializer(ProjectResponseSchema, fields, many=True).dump(rows),
+        "next_cursor": next_cursor,
+    }), 200
@@ -9,87 +9,90 @@ Stats included:
     - pending_deliverable_count: Deliverables with 'planned' or 'in_progress' status
     - overdue_deliverable_count: Deliverables past their due date (not completed)
     - upcoming_deadlines: Next 5 projects/deliverables due soon
+
+Performance: the four counters are read from the user's user_stats row,
+which writes keep up to date (see models/user_stats.py), so they cost one
+primary-key lookup. Milestones are a second statement that joins project
+titles up front instead of lazy-loading them per row. Both are Core
+selects returning Rows; no ORM instance is built unless the stats row
+has to be recomputed.
+
+Caching: the whole payload is cached per (user, data_version) — see
+app/cache.py. Overdue counts and milestones change when the UTC date rolls
+over without any write, so entries never outlive the current UTC day.
+The same version (plus the UTC date) is the response's ETag; a matching
+If-None-Match gets a 304 before the cached payload is looked up, see
+api/etags.py.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from flask import Blueprint, jsonify
 from app.api.auth_utils import get_current_user_id
-from app.extensions import db
-from app.models.client import Client
-from app.models.project import Project, ProjectStatus
+from app.api.etags import conditional
+from app.extensions import db, response_cache
+from app.models.project import Project
 from app.models.deliverable import Deliverable, DeliverableStatus
-from app.errors import AppError
+from app.models.user_stats import UserStats
 
 dashboard_bp = Blueprint("dashboard", __name__)
 
 
-@dashboard_bp.route("", methods=["GET"])
-def get_summary():
-    """Get aggregated dashboard statistics."""
-    user_id = get_current_user_id()
-    now = datetime.now(timezone.utc)
-
-    # 1. Client count
-    client_count = Client.query.filter_by(user_id=user_id).count()
-
-    # 2. Active projects (status='active')
-    active_project_count = (
-        Project.query.join(Client)
-        .filter(Client.user_id == user_id, Project.status == ProjectStatus.ACTIVE)
-        .count()
-    )
-
-    # 3. Pending deliverables (planned or in_progress)
-    pending_deliverable_count = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(
-            Client.user_id == user_id,
-            Deliverable.status.in_([DeliverableStatus.PLANNED, DeliverableStatus.IN_PROGRESS])
+def upcoming_milestones(user_id, now, limit=5):
+    """Next deliverables due, with project titles joined in the same query."""
+    rows = db.session.execute(
+        db.select(
+            Deliverable.id,
+            Deliverable.title,
+            Project.title.label("project_title"),
+            Deliverable.due_date,
         )
-        .count()
-    )
-
-    # 4. Overdue deliverables (due_date < now AND status != completed)
-    overdue_deliverable_count = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(
-            Client.user_id == user_id,
-            Deliverable.due_date < now,
-            Deliverable.status != DeliverableStatus.COMPLETED
-        )
-        .count()
-    )
-
-    # 5. Upcoming milestones (Deliverables or Projects due soon)
-    # Just getting next 5 deliverables due soon for now
-    upcoming = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(
-            Client.user_id == user_id,
+        .join(Project, Deliverable.project_id == Project.id)
+        .where(
+            Deliverable.owner_id == user_id,
             Deliverable.due_date >= now,
-            Deliverable.status != DeliverableStatus.COMPLETED
+            Deliverable.status != DeliverableStatus.COMPLETED,
         )
-        .order_by(Deliverable.due_date.asc())
-        .limit(5)
-        .all()
+        .order_by(Deliverable.due_date.asc(), Deliverable.id.asc())
+        .limit(limit)
     )
 
-    milestones = []
-    for d in upcoming:
-        milestones.append({
+    return [
+        {
             "type": "deliverable",
-            "id": d.id,
-            "title": d.title,
-            "project_title": d.project.title,
-            "due_date": d.due_date.isoformat() if d.due_date else None
-        })
-
-    return jsonify({
-        "data": {
-            "client_count": client_count,
-            "active_project_count": active_project_count,
-            "pending_deliverable_count": pending_deliverable_count,
-            "overdue_deliverable_count": overdue_deliverable_count,
-            "upcoming_milestones": milestones
+            "id": row.id,
+            "title": row.title,
+            "project_title": row.project_title,
+            "due_date": row.due_date.isoformat() if row.due_date else None
         }
-    }), 200
+        for row in rows
+    ]
+
+
+def _seconds_until_utc_midnight(now):
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), timezone.utc)
+    return max(1, int((tomorrow - now).total_seconds()))
+
+
+def build_summary(user_id, now):
+    """Compute the dashboard payload (two queries total)."""
+    summary = UserStats.counts_for(user_id, now)
+    summary["upcoming_milestones"] = upcoming_milestones(user_id, now)
+    return summary
+
+
+@dashboard_bp.route("", methods=["GET"])
+@conditional(daily=True)
+def get_summary():
+    """Get aggregated dashboard statistics."""
+    user_id = get_current_user_id()
+    now = datetime.now(timezone.utc)
+
+    summary = response_cache.get_or_compute(
+        "dashboard",
+        user_id,
+        lambda: build_summary(user_id, now),
+        ttl=_seconds_until_utc_midnight(now),
+    )
+    # Keeps a stats row the summary had to (re)compute; a no-op otherwise
+    db.session.commit()
+    return jsonify({"data": summary}), 200
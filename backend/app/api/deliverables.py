@@ -1,32 +1,55 @@
 """Deliverables API — CRUD and status transitions.
 
 Endpoints:
-    GET    /api/deliverables          → List all deliverables for current user
+    GET    /api/deliverables          → List deliverables for current user (paginated, filterable)
     POST   /api/deliverables          → Create a new deliverable for a project
     GET    /api/deliverables/<id>     → Get deliverable details
     PUT    /api/deliverables/<id>     → Update deliverable metadata
     PATCH  /api/deliverables/<id>/status → Transition status (state machine)
+    PATCH  /api/deliverables/status      → Transition many deliverables at once
     DELETE /api/deliverables/<id>     → Delete a deliverable
 
+GET endpoints accept ?fields=a,b,c to return (and load) only those fields,
+e.g. ?fields=id,title,status,due_date for list views.
+
 Design decisions:
-- User scoping: Joins Deliverable -> Project -> Client to ensure ownership.
-- Status logic: Enforced via PATCH /status only.
+- User scoping: Deliverable.owner_id mirrors the Project -> Client chain,
+  so ownership is a single-table probe (see models/ownership.py).
+- Status logic: Enforced via PATCH /status only. The bulk form validates
+  the state machine set-wise and applies one guarded UPDATE; ids it cannot
+  move are returned in `rejected` (see models/bulk_writes.py).
 - 404/422 errors: Consistent with rest of API.
+- Listing: Keyset pagination (?limit=&cursor=), see api/pagination.py.
+  Filters run in SQL: ?status=a,b&project_id=&client_id=&due_before=
+  &due_after=, ?sort=[-]created_at|[-]due_date, and ?facets=status adds
+  per-status counts (see api/filters.py).
+- Sparse fieldsets (?fields=) restrict both the SELECT and the serializer,
+  see api/fieldsets.py.
+- Conditional GET: responses carry a weak ETag and a matching
+  If-None-Match gets a 304 without touching the database, see api/etags.py.
 """
 
 from flask import Blueprint, request, jsonify, session
 from app.extensions import db
-from app.models.client import Client
 from app.models.project import Project
-from app.models.deliverable import Deliverable
+from app.models.deliverable import Deliverable, DeliverableStatus
 from app.errors import NotFoundError, AppError
 from app.api.auth_utils import get_current_user_id
+from app.api.etags import conditional
+from app.api.fieldsets import get_fields, select_fields
+from app.api.filters import get_list_args, apply_filters, facet_counts
+from app.api.pagination import get_page_args, paginate
+from app.api.read_models import select_rows
+from app.models.bulk_writes import transition_deliverables
 from app.schemas import (
     DeliverableCreateSchema,
     DeliverableUpdateSchema,
     DeliverableStatusSchema,
+    DeliverableBulkStatusSchema,
+    DeliverableListSchema,
     DeliverableResponseSchema,
 )
+from app.serializers import serializer
 
 deliverables_bp = Blueprint("deliverables", __name__)
 
@@ -34,23 +57,47 @@ deliverables_bp = Blueprint("deliverables", __name__)
 _create_schema = DeliverableCreateSchema()
 _update_schema = DeliverableUpdateSchema()
 _status_schema = DeliverableStatusSchema()
-_response_schema = DeliverableResponseSchema()
-_response_list_schema = DeliverableResponseSchema(many=True)
+_bulk_status_schema = DeliverableBulkStatusSchema()
+_serializer = serializer(DeliverableResponseSchema)
+_list_schema = DeliverableListSchema()
+
+# List filters: query parameter → WHERE condition (validated by DeliverableListSchema)
+_filters = {
+    "status": lambda statuses: Deliverable.status.in_(statuses),
+    "project_id": lambda project_id: Deliverable.project_id == project_id,
+    "client_id": lambda client_id: Deliverable.project_id.in_(
+        db.select(Project.id).where(Project.client_id == client_id)
+    ),
+    "due_before": lambda day: Deliverable.due_date < day,
+    "due_after": lambda day: Deliverable.due_date > day,
+}
 
 
 @deliverables_bp.route("", methods=["GET"])
+@conditional()
 def list_deliverables():
-    """List all deliverables for the current user."""
+    """List deliverables for the current user, filtered and sorted (newest first by default)."""
     user_id = get_current_user_id()
+    limit, cursor = get_page_args()
+    fields = get_fields(DeliverableResponseSchema)
+    args = get_list_args(_list_schema)
+    sort = args["sort"]
     
-    # Complex join to ensure full ownership chain
-    deliverables = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(Client.user_id == user_id)
-        .order_by(Deliverable.created_at.desc())
-        .all()
+    owned = select_rows(DeliverableResponseSchema, fields, extra=[sort.lstrip("-")]).where(
+        Deliverable.owner_id == user_id
     )
-    return jsonify({"data": _response_list_schema.dump(deliverables)}), 200
+    rows, next_cursor = paginate(apply_filters(owned, _filters, args), Deliverable, limit, cursor, sort)
+
+    body = {
+        "data": serializer(DeliverableResponseSchema, fields, many=True).dump(rows),
+        "next_cursor": next_cursor,
+    }
+    if "status" in args["facets"]:
+        body["facets"] = {"status": facet_counts(
+            apply_filters(owned, _filters, args, exclude=["status"]),
+            Deliverable.status, DeliverableStatus.ALL,
+        )}
+    return jsonify(body), 200
 
 
 @deliverables_bp.route("", methods=["POST"])
@@ -59,12 +106,8 @@ def create_deliverable():
     user_id = get_current_user_id()
     data = _create_schema.load(request.get_json())
     
-    # Verify the project exists and belongs to the user via client
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == data["project_id"], Client.user_id == user_id)
-        .first()
-    )
+    # Verify the project exists and belongs to the user
+    project = Project.query.filter_by(id=data["project_id"], owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", data["project_id"])
     
@@ -77,23 +120,24 @@ def create_deliverable():
     db.session.add(deliverable)
     db.session.commit()
     
-    return jsonify({"data": _response_schema.dump(deliverable)}), 201
+    return jsonify({"data": _serializer.dump(deliverable)}), 201
 
 
 @deliverables_bp.route("/<int:deliverable_id>", methods=["GET"])
+@conditional()
 def get_deliverable(deliverable_id):
     """Get deliverable details."""
     user_id = get_current_user_id()
+    fields = get_fields(DeliverableResponseSchema)
     
-    deliverable = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(Deliverable.id == deliverable_id, Client.user_id == user_id)
-        .first()
-    )
+    deliverable = select_fields(
+        Deliverable.query.filter_by(id=deliverable_id, owner_id=user_id),
+        DeliverableResponseSchema, fields,
+    ).first()
     if not deliverable:
         raise NotFoundError("Deliverable", deliverable_id)
     
-    return jsonify({"data": _response_schema.dump(deliverable)}), 200
+    return jsonify({"data": serializer(DeliverableResponseSchema, fields).dump(deliverable)}), 200
 
 
 @deliverables_bp.route("/<int:deliverable_id>", methods=["PUT"])
@@ -101,11 +145,7 @@ def update_deliverable(deliverable_id):
     """Update deliverable metadata (title, description, due_date)."""
     user_id = get_current_user_id()
     
-    deliverable = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(Deliverable.id == deliverable_id, Client.user_id == user_id)
-        .first()
-    )
+    deliverable = Deliverable.query.filter_by(id=deliverable_id, owner_id=user_id).first()
     if not deliverable:
         raise NotFoundError("Deliverable", deliverable_id)
     
@@ -119,7 +159,23 @@ def update_deliverable(deliverable_id):
         deliverable.due_date = data["due_date"]
         
     db.session.commit()
-    return jsonify({"data": _response_schema.dump(deliverable)}), 200
+    return jsonify({"data": _serializer.dump(deliverable)}), 200
+
+
+@deliverables_bp.route("/status", methods=["PATCH"])
+def transition_deliverables_status():
+    """Transition many deliverables to one status in a single UPDATE.
+
+    Ids that are missing, not the user's, or not allowed to move to the
+    target status are reported in `rejected`; the rest still transition.
+    """
+    user_id = get_current_user_id()
+    data = _bulk_status_schema.load(request.get_json())
+
+    transitioned, rejected = transition_deliverables(user_id, data["ids"], data["status"])
+
+    db.session.commit()
+    return jsonify({"data": {"transitioned": transitioned, "rejected": rejected}}), 200
 
 
 @deliverables_bp.route("/<int:deliverable_id>/status", methods=["PATCH"])
@@ -127,11 +183,7 @@ def transition_deliverable_status(deliverable_id):
     """Transition deliverable status using the state machine."""
     user_id = get_current_user_id()
     
-    deliverable = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(Deliverable.id == deliverable_id, Client.user_id == user_id)
-        .first()
-    )
+    deliverable = Deliverable.query.filter_by(id=deliverable_id, owner_id=user_id).first()
     if not deliverable:
         raise NotFoundError("Deliverable", deliverable_id)
     
@@ -141,7 +193,7 @@ def transition_deliverable_status(deliverable_id):
     deliverable.transition_status(data["status"])
     
     db.session.commit()
-    return jsonify({"data": _response_schema.dump(deliverable)}), 200
+    return jsonify({"data": _serializer.dump(deliverable)}), 200
 
 
 @deliverables_bp.route("/<int:deliverable_id>", methods=["DELETE"])
@@ -149,11 +201,7 @@ def delete_deliverable(deliverable_id):
     """Delete a deliverable."""
     user_id = get_current_user_id()
     
-    deliverable = (
-        Deliverable.query.join(Project).join(Client)
-        .filter(Deliverable.id == deliverable_id, Client.user_id == user_id)
-        .first()
-    )
+    deliverable = Deliverable.query.filter_by(id=deliverable_id, owner_id=user_id).first()
     if not deliverable:
         raise NotFoundError("Deliverable", deliverable_id)
     
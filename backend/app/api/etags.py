@@ -0,0 +1,60 @@
+"""Conditional GET (ETag / If-None-Match) for read endpoints.
+
+Design decisions:
+- The ETag is derived from the user's data version, plus a hash of the
+  request path and query string. The version is a database row
+  (models/data_version.py) that every committed write to their clients,
+  projects or deliverables replaces in the same transaction, so a write
+  made by any worker or CLI command changes every worker's tags.
+  Computing it is one primary-key read, so a matching If-None-Match is
+  answered with 304 before the view loads or dumps anything.
+- The version is read BEFORE the view runs, as for the response cache:
+  a write committing mid-request leaves the response tagged with the old
+  version, and the next poll simply gets a 200.
+- ETags are weak (W/"..."): the same data may be sent compressed or not,
+  so byte-for-byte identity is not promised.
+- Views whose output changes without a write (the dashboard's overdue
+  counts roll over at UTC midnight) pass daily=True to fold the UTC date
+  into the tag.
+- Tagged responses carry Cache-Control: private, no-cache, so browsers
+  keep them and revalidate on every request; the fetch() caller sees a
+  200 with the cached body.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+from flask import request, make_response
+from app.api.auth_utils import get_current_user_id
+from app.extensions import response_cache
+
+
+def current_etag(user_id, daily=False):
+    """The ETag value a GET of the current URL would carry for this user."""
+    # The id keeps tags per user: users who never wrote share INITIAL_VERSION
+    parts = [str(user_id), response_cache.data_version(user_id), request.full_path]
+    if daily:
+        parts.append(datetime.now(timezone.utc).date().isoformat())
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=12).hexdigest()
+
+
+def conditional(daily=False):
+    """Decorate a GET view to honour If-None-Match and set a weak ETag."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = current_etag(get_current_user_id(), daily)
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,38 @@
+"""Export API — download all of the user's data.
+
+Endpoints:
+    GET /api/export?format=ndjson|csv → Zip of one file per table
+
+The archive starts with manifest.json (format version and each file's
+columns) and is streamed as it is built, so memory use does not grow
+with the size of the account. Layout and value encoding are documented
+in app/export.py.
+"""
+
+from datetime import datetime, timezone
+from flask import Blueprint, Response, request, stream_with_context
+from marshmallow import EXCLUDE
+from app.api.auth_utils import get_current_user_id
+from app.export import stream_export
+from app.schemas import ExportSchema
+
+export_bp = Blueprint("export", __name__)
+
+_export_schema = ExportSchema()
+
+
+@export_bp.route("", methods=["GET"])
+def export_account():
+    """Stream the current user's clients, projects, deliverables and AI runs."""
+    user_id = get_current_user_id()
+    args = _export_schema.load(request.args, unknown=EXCLUDE)
+
+    filename = f"clientpilot-export-{datetime.now(timezone.utc):%Y%m%d}.zip"
+    return Response(
+        stream_with_context(stream_export(user_id, args["format"])),
+        mimetype="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        },
+    )
@@ -0,0 +1,47 @@
+"""Import API — bulk-create clients, projects and deliverables from files.
+
+Endpoints:
+    POST /api/import → multipart upload, imported into the current user
+
+Upload either one file per table, as parts named clients, projects and
+deliverables (.csv, .ndjson or .jsonl), or an export archive from
+GET /api/export as a part named archive. The response reports row counts
+per table and the rows that were skipped:
+
+    {"data": {"tables": {"clients": {"rows": 3, "imported": 2, "failed": 1}, ...},
+              "errors": [{"table": "clients", "line": 3, "key": "acme",
+                          "code": "VALIDATION_ERROR", "message": ..., "details": ...}],
+              "errors_truncated": false}}
+
+Key resolution, validation and chunking are described in app/importer.py.
+"""
+
+from flask import Blueprint, request, jsonify
+from app.api.auth_utils import get_current_user_id
+from app.errors import AppError
+from app.importer import TABLE_NAMES, encoding_for, import_tables, open_archive, read_rows
+
+imports_bp = Blueprint("imports", __name__)
+
+
+@imports_bp.route("", methods=["POST"])
+def import_data():
+    """Import the uploaded files into the current user's account."""
+    user_id = get_current_user_id()
+
+    if "archive" in request.files:
+        sources = open_archive(request.files["archive"].stream)
+    else:
+        sources = {
+            name: read_rows(upload.stream, encoding_for(upload.filename))
+            for name, upload in request.files.items()
+            if name in TABLE_NAMES
+        }
+    if not sources:
+        raise AppError(
+            "Upload an archive or at least one of: " + ", ".join(TABLE_NAMES),
+            code="INVALID_IMPORT",
+            status_code=400,
+        )
+
+    return jsonify({"data": import_tables(user_id, sources)}), 200
@@ -0,0 +1,68 @@
+"""Compound documents (?include=) for detail endpoints.
+
+Design decisions:
+- ?include=deliverables,client nests related rows into the detail
+  payload, so a detail page is one HTTP round-trip and one ownership
+  check instead of one per resource.
+- Each include is loaded with selectinload: one extra SELECT per
+  relationship (WHERE fk IN (...)), however many rows it returns.
+- Endpoints list the relationships they allow with the serializer used
+  to dump each one; anything else is a 400, never a lazy load.
+- Foreign keys a relationship needs are added to a ?fields= load_only,
+  so combining the two parameters does not trigger per-row loads.
+"""
+
+from flask import request
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, selectinload
+from app.errors import AppError
+
+
+def get_includes(allowed):
+    """Read and validate ?include= from the query string.
+
+    Args:
+        allowed: Mapping of relationship name → serializer used to dump it.
+
+    Returns:
+        A frozenset of relationship names (empty when none requested).
+
+    Raises:
+        AppError: If a name is not in `allowed`.
+    """
+    raw = request.args.get("include", "")
+    includes = frozenset(name.strip() for name in raw.split(",") if name.strip())
+    unknown = sorted(includes - set(allowed))
+    if unknown:
+        raise AppError(
+            "Invalid include parameter",
+            code="INVALID_INCLUDE",
+            status_code=400,
+            details={"unknown": unknown, "allowed": sorted(allowed)},
+        )
+    return includes
+
+
+def load_includes(query, model, includes, fields=None):
+    """Eager-load the requested relationships with one SELECT each.
+
+    Pass the ?fields= set (see api/fieldsets.py) when the query is already
+    restricted with load_only, so the relationships' own columns are kept.
+    """
+    if not includes:
+        return query
+    options = [selectinload(getattr(model, name)) for name in sorted(includes)]
+    if fields is not None:
+        relationships = inspect(model).relationships
+        local_columns = sorted({
+            column.key for name in includes for column in relationships[name].local_columns
+        })
+        options.append(load_only(*(getattr(model, key) for key in local_columns)))
+    return query.options(*options)
+
+
+def dump_includes(payload, obj, includes, allowed):
+    """Add each included relationship to a dumped payload, in place."""
+    for name in sorted(includes):
+        payload[name] = allowed[name].dump(getattr(obj, name))
+    return payload
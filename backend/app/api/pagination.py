@@ -0,0 +1,152 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+Design decisions:
+- Pages are keyed on (sort column, id). The default sort, -created_at, is
+  the order every list endpoint already used; endpoints may whitelist
+  other indexed columns (see api/filters.py). Fetching page N is one
+  index range scan, not OFFSET N.
+- Nullable sort columns keep NULLs last in both directions, so undated
+  rows trail the list; the keyset condition spells that out because a
+  row-value comparison with NULL matches nothing.
+- The cursor is opaque to clients (base64 JSON) so we can change its
+  contents later without breaking the API contract. It records the sort
+  it was issued for; reusing it under another sort is an error.
+- We fetch limit + 1 rows to know whether a next page exists without
+  a separate COUNT query.
+- Pages are Core selects returning Rows, not ORM instances (see
+  api/read_models.py).
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from flask import request
+from marshmallow import EXCLUDE
+from sqlalchemy import and_, or_, tuple_
+from app.errors import AppError
+from app.api.read_models import fetch_rows
+from app.schemas import PaginationSchema
+
+DEFAULT_SORT = "-created_at"
+
+_pagination_schema = PaginationSchema()
+
+
+def get_page_args():
+    """Read and validate ?limit= and ?cursor= from the query string.
+
+    Returns:
+        Tuple of (limit, decoded_cursor). decoded_cursor is None on page 1.
+    """
+    args = _pagination_schema.load(request.args, unknown=EXCLUDE)
+    cursor = decode_cursor(args["cursor"]) if args["cursor"] else None
+    return args["limit"], cursor
+
+
+def _invalid_cursor():
+    return AppError("Invalid pagination cursor", code="INVALID_CURSOR", status_code=400)
+
+
+def encode_cursor(sort, value, row_id):
+    """Build an opaque cursor pointing just after the given row."""
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor().
+
+    Returns:
+        Tuple of (sort, raw sort value, id).
+
+    Raises:
+        AppError: If the cursor is malformed or was tampered with.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = json.loads(base64.urlsafe_b64decode(padded))
+        if len(parts) == 2:  # issued before sorting was configurable
+            parts = [DEFAULT_SORT, *parts]
+        sort, value, row_id = parts
+        return str(sort), value, int(row_id)
+    except (ValueError, TypeError, binascii.Error):
+        raise _invalid_cursor()
+
+
+def _cursor_value(column, raw):
+    """Turn a cursor's JSON value back into the sort column's type.
+
+    Raises:
+        AppError: If the value does not fit the column, including null
+            for a non-nullable column, which no page could have issued.
+    """
+    if raw is None:
+        if not column.nullable:
+            raise _invalid_cursor()
+        return None
+    try:
+        python_type = column.type.python_type
+        if python_type is datetime:
+            return datetime.fromisoformat(raw)
+        if python_type is date:
+            return date.fromisoformat(raw)
+        return python_type(raw)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+
+
+def _after(column, id_column, value, row_id, descending, nullable):
+    """Rows strictly after (value, row_id) in ORDER BY column, id NULLS LAST."""
+    if not nullable:
+        if descending:
+            return tuple_(column, id_column) < tuple_(value, row_id)
+        return tuple_(column, id_column) > tuple_(value, row_id)
+    if value is None:
+        return and_(column.is_(None), id_column < row_id if descending else id_column > row_id)
+    beyond = column < value if descending else column > value
+    tie = id_column < row_id if descending else id_column > row_id
+    return or_(beyond, and_(column == value, tie), column.is_(None))
+
+
+def paginate(query, model, limit, cursor=None, sort=DEFAULT_SORT):
+    """Apply keyset pagination over (sort column, id) and fetch one page.
+
+    Args:
+        query: A select already filtered to the rows the user may see,
+            including the sort column (see api/read_models.py).
+        model: The model class whose columns key the page.
+        limit: Maximum number of rows to return.
+        cursor: Decoded (sort, value, id) tuple from the previous page.
+        sort: Column name, prefixed with "-" for descending. Callers
+            validate it against their whitelist.
+
+    Returns:
+        Tuple of (rows, next_cursor). next_cursor is None on the last page.
+    """
+    descending = sort.startswith("-")
+    attribute = getattr(model, sort.lstrip("-"))
+    column = attribute.property.columns[0]
+
+    if cursor is not None:
+        cursor_sort, raw, row_id = cursor
+        if cursor_sort != sort:
+            raise _invalid_cursor()
+        query = query.where(
+            _after(attribute, model.id, _cursor_value(column, raw), row_id, descending, column.nullable)
+        )
+
+    if descending:
+        order = (attribute.desc().nulls_last(), model.id.desc())
+    else:
+        order = (attribute.asc().nulls_last(), model.id.asc())
+    rows = fetch_rows(query.order_by(*order).limit(limit + 1))
+
+    if len(rows) <= limit:
+        return rows, None
+
+    items = rows[:limit]
+    last = items[-1]
+    return items, encode_cursor(sort, getattr(last, column.key), last.id)
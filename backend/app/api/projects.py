@@ -1,31 +1,65 @@
 """Projects API — CRUD and status transitions.
 
 Endpoints:
-    GET    /api/projects          → List all projects for current user
+    GET    /api/projects          → List projects for current user (paginated, filterable)
     POST   /api/projects          → Create a new project for a client
-    GET    /api/projects/<id>     → Get project details
+    GET    /api/projects/<id>     → Get project details (?include=deliverables,client)
     PUT    /api/projects/<id>     → Update project info (not status)
     PATCH  /api/projects/<id>/status → Transition project status (state machine)
+    PATCH  /api/projects/status   → Transition many projects at once
     DELETE /api/projects/<id>     → Delete a project
+    POST   /api/projects/<id>/deliverables/batch → Create many deliverables at once
+
+GET endpoints accept ?fields=a,b,c to return (and load) only those fields.
 
 Design decisions:
 - Status cannot be changed via PUT/POST — must use the PATCH /status endpoint.
 - Every project belongs to a client, which must belong to the current user.
+  Ownership is checked on the denormalized Project.owner_id (no join).
 - PATCH /status uses the model's transition_status() to enforce state machine rules.
+- List endpoints use keyset pagination (?limit=&cursor=), see api/pagination.py.
+- GET /api/projects filters in SQL on ?status=a,b&client_id=&due_before=
+  &due_after= (deadline), sorts on ?sort=[-]created_at|[-]deadline and adds
+  per-status counts with ?facets=status, see api/filters.py.
+- Sparse fieldsets (?fields=) restrict both the SELECT and the serializer,
+  see api/fieldsets.py.
+- The detail endpoint nests ?include= relationships, loaded with
+  selectinload behind the same ownership check, see api/includes.py.
+- Conditional GET: responses carry a weak ETag and a matching
+  If-None-Match gets a 304 without touching the database, see api/etags.py.
+- The batch endpoint is all-or-nothing: every item is validated first
+  (errors are keyed by item index), then all rows go in one executemany
+  INSERT inside a single transaction (see models/bulk_writes.py).
+- Bulk PATCH /status is per-id: one guarded UPDATE moves every id whose
+  current status allows the target; the others come back in `rejected`
+  with the same code/message/details an individual PATCH would return.
 """
 
 from flask import Blueprint, request, jsonify, session
 from app.extensions import db
 from app.models.client import Client
-from app.models.project import Project
+from app.models.project import Project, ProjectStatus
 from app.errors import NotFoundError, AppError
 from app.api.auth_utils import get_current_user_id
+from app.api.etags import conditional
+from app.api.fieldsets import get_fields, select_fields
+from app.api.filters import get_list_args, apply_filters, facet_counts
+from app.api.includes import get_includes, load_includes, dump_includes
+from app.api.pagination import get_page_args, paginate
+from app.api.read_models import select_rows
+from app.models.bulk_writes import insert_deliverables, transition_projects
 from app.schemas import (
+    MAX_BATCH_SIZE,
     ProjectCreateSchema,
     ProjectUpdateSchema,
     ProjectStatusSchema,
+    ProjectBulkStatusSchema,
+    ProjectListSchema,
     ProjectResponseSchema,
+    ClientResponseSchema,
+    DeliverableResponseSchema,
 )
+from app.serializers import serializer
 
 projects_bp = Blueprint("projects", __name__)
 
@@ -33,23 +67,50 @@ projects_bp = Blueprint("projects", __name__)
 _create_schema = ProjectCreateSchema()
 _update_schema = ProjectUpdateSchema()
 _status_schema = ProjectStatusSchema()
-_response_schema = ProjectResponseSchema()
-_response_list_schema = ProjectResponseSchema(many=True)
+_bulk_status_schema = ProjectBulkStatusSchema()
+_serializer = serializer(ProjectResponseSchema)
+_list_schema = ProjectListSchema()
+
+# List filters: query parameter → WHERE condition (validated by ProjectListSchema)
+_filters = {
+    "status": lambda statuses: Project.status.in_(statuses),
+    "client_id": lambda client_id: Project.client_id == client_id,
+    "due_before": lambda day: Project.deadline < day,
+    "due_after": lambda day: Project.deadline > day,
+}
+
+# Relationships GET /api/projects/<id> can embed via ?include=
+_includes = {
+    "client": serializer(ClientResponseSchema),
+    "deliverables": serializer(DeliverableResponseSchema, many=True),
+}
 
 
 @projects_bp.route("", methods=["GET"])
+@conditional()
 def list_projects():
-    """List all projects for the current user."""
+    """List projects for the current user, filtered and sorted (newest first by default)."""
     user_id = get_current_user_id()
+    limit, cursor = get_page_args()
+    fields = get_fields(ProjectResponseSchema)
+    args = get_list_args(_list_schema)
+    sort = args["sort"]
     
-    # We join with Client to ensure we only see projects for clients that belong to this user
-    projects = (
-        Project.query.join(Client)
-        .filter(Client.user_id == user_id)
-        .order_by(Project.created_at.desc())
-        .all()
+    # owner_id mirrors client.user_id, so no join with Client is needed
+    owned = select_rows(ProjectResponseSchema, fields, extra=[sort.lstrip("-")]).where(
+        Project.owner_id == user_id
     )
-    return jsonify({"data": _response_list_schema.dump(projects)}), 200
+    rows, next_cursor = paginate(apply_filters(owned, _filters, args), Project, limit, cursor, sort)
+
+    body = {
+        "data": serializer(ProjectResponseSchema, fields, many=True).dump(rows),
+        "next_cursor": next_cursor,
+    }
+    if "status" in args["facets"]:
+        body["facets"] = {"status": facet_counts(
+            apply_filters(owned, _filters, args, exclude=["status"]), Project.status, ProjectStatus.ALL
+        )}
+    return jsonify(body), 200
 
 
 @projects_bp.route("", methods=["POST"])
@@ -72,23 +133,26 @@ def create_project():
     db.session.add(project)
     db.session.commit()
     
-    return jsonify({"data": _response_schema.dump(project)}), 201
+    return jsonify({"data": _serializer.dump(project)}), 201
 
 
 @projects_bp.route("/<int:project_id>", methods=["GET"])
+@conditional()
 def get_project(project_id):
-    """Get project details."""
+    """Get project details, with any ?include= relationships nested."""
     user_id = get_current_user_id()
+    fields = get_fields(ProjectResponseSchema)
+    includes = get_includes(_includes)
     
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
+    query = select_fields(
+        Project.query.filter_by(id=project_id, owner_id=user_id), ProjectResponseSchema, fields
     )
+    project = load_includes(query, Project, includes, fields).first()
     if not project:
         raise NotFoundError("Project", project_id)
     
-    return jsonify({"data": _response_schema.dump(project)}), 200
+    payload = serializer(ProjectResponseSchema, fields).dump(project)
+    return jsonify({"data": dump_includes(payload, project, includes, _includes)}), 200
 
 
 @projects_bp.route("/<int:project_id>", methods=["PUT"])
@@ -96,11 +160,7 @@ def update_project(project_id):
     """Update project metadata (title, description, deadline)."""
     user_id = get_current_user_id()
     
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
-    )
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", project_id)
     
@@ -114,7 +174,23 @@ def update_project(project_id):
         project.deadline = data["deadline"]
         
     db.session.commit()
-    return jsonify({"data": _response_schema.dump(project)}), 200
+    return jsonify({"data": _serializer.dump(project)}), 200
+
+
+@projects_bp.route("/status", methods=["PATCH"])
+def transition_projects_status():
+    """Transition many projects to one status in a single UPDATE.
+
+    Ids that are missing, not the user's, or not allowed to move to the
+    target status are reported in `rejected`; the rest still transition.
+    """
+    user_id = get_current_user_id()
+    data = _bulk_status_schema.load(request.get_json())
+
+    transitioned, rejected = transition_projects(user_id, data["ids"], data["status"])
+
+    db.session.commit()
+    return jsonify({"data": {"transitioned": transitioned, "rejected": rejected}}), 200
 
 
 @projects_bp.route("/<int:project_id>/status", methods=["PATCH"])
@@ -122,11 +198,7 @@ def transition_project_status(project_id):
     """Transition project status using the state machine."""
     user_id = get_current_user_id()
     
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
-    )
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", project_id)
     
@@ -136,7 +208,7 @@ def transition_project_status(project_id):
     project.transition_status(data["status"])
     
     db.session.commit()
-    return jsonify({"data": _response_schema.dump(project)}), 200
+    return jsonify({"data": _serializer.dump(project)}), 200
 
 
 @projects_bp.route("/<int:project_id>", methods=["DELETE"])
@@ -144,11 +216,7 @@ def delete_project(project_id):
     """Delete a project."""
     user_id = get_current_user_id()
     
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
-    )
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", project_id)
     
@@ -166,11 +234,7 @@ def create_project_deliverable(project_id):
     user_id = get_current_user_id()
 
     # Verify project belongs to user
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
-    )
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", project_id)
 
@@ -186,32 +250,61 @@ def create_project_deliverable(project_id):
     db.session.add(deliverable)
     db.session.commit()
 
-    res_schema = DeliverableResponseSchema()
-    return jsonify({"data": res_schema.dump(deliverable)}), 201
+    return jsonify({"data": serializer(DeliverableResponseSchema).dump(deliverable)}), 201
+
+
+@projects_bp.route("/<int:project_id>/deliverables/batch", methods=["POST"])
+def create_project_deliverables_batch(project_id):
+    """Create a list of deliverables for a project in one transaction."""
+    from app.schemas import DeliverableCreateSchema, DeliverableResponseSchema
+
+    user_id = get_current_user_id()
+
+    # One ownership check for the whole batch
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
+    if not project:
+        raise NotFoundError("Project", project_id)
+
+    payload = request.get_json()
+    if not isinstance(payload, list) or not 1 <= len(payload) <= MAX_BATCH_SIZE:
+        raise AppError(
+            f"Body must be a list of 1 to {MAX_BATCH_SIZE} deliverables",
+            code="INVALID_BATCH",
+            status_code=400,
+        )
+
+    # Raises ValidationError with per-item errors, e.g. {"3": {"title": [...]}}
+    items = DeliverableCreateSchema(many=True).load(payload)
+
+    # One INSERT for the whole batch; counters and stats are kept in step
+    deliverables = insert_deliverables(project, items)
+    data = serializer(DeliverableResponseSchema, many=True).dump(deliverables)
+    db.session.commit()
+
+    return jsonify({"data": data}), 201
 
 
 @projects_bp.route("/<int:project_id>/deliverables", methods=["GET"])
+@conditional()
 def list_project_deliverables(project_id):
-    """List all deliverables for a specific project (scoped to current user)."""
+    """List deliverables for a specific project (scoped to current user)."""
     from app.models.deliverable import Deliverable
     from app.schemas import DeliverableResponseSchema
 
     user_id = get_current_user_id()
+    limit, cursor = get_page_args()
+    fields = get_fields(DeliverableResponseSchema)
 
-    # Verify project belongs to user via client
-    project = (
-        Project.query.join(Client)
-        .filter(Project.id == project_id, Client.user_id == user_id)
-        .first()
-    )
+    # Verify project belongs to user
+    project = Project.query.filter_by(id=project_id, owner_id=user_id).first()
     if not project:
         raise NotFoundError("Project", project_id)
 
-    deliverables = (
-        Deliverable.query
-        .filter_by(project_id=project_id)
-        .order_by(Deliverable.created_at.desc())
-        .all()
+    rows, next_cursor = paginate(
+        select_rows(DeliverableResponseSchema, fields).where(Deliverable.project_id == project_id),
+        Deliverable, limit, cursor,
     )
-    schema = DeliverableResponseSchema(many=True)
-    return jsonify({"data": schema.dump(deliverables)}), 200
+    return jsonify({
+        "data": serializer(DeliverableResponseSchema, fields, many=True).dump(rows),
+        "next_cursor": next_cursor,
+    }), 200
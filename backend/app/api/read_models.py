@@ -0,0 +1,45 @@
+"""Read models: Core selects that feed list endpoints straight into serializers.
+
+Design decisions:
+- List endpoints only read and serialize, so they do not need ORM
+  instances. Building one per row (identity map entry, instance state,
+  instrumented attributes, change tracking) costs more than fetching it.
+  A select of plain table columns executes as Core and returns Row
+  tuples instead.
+- Rows support attribute access (row.title), which is all a compiled
+  serializer (app/serializers.py) needs, so a row dumps exactly like the
+  instance would. Computed fields read their FIELD_COLUMNS, which are
+  selected with the rest.
+- Only the columns the response reads are selected, with or without
+  ?fields= (see api/fieldsets.py), plus the pagination key.
+- fetch_rows() executes on the session's connection. Filters and ORDER BY
+  are written with ORM attributes (Deliverable.status), which would make
+  Session.execute run the statement through the ORM's result layer; the
+  connection returns plain Core rows. The session still chooses the
+  bind, so replica routing applies as for any other read.
+- The selects compose with the existing helpers: filters add WHERE
+  conditions (api/filters.py), keyset pagination adds ORDER BY / LIMIT
+  (api/pagination.py), and facets swap the column list for a GROUP BY.
+- Detail and write endpoints keep the ORM: they load one row, and writes
+  need the unit of work's hooks.
+"""
+
+from app.api.fieldsets import needed_columns, response_schema
+from app.extensions import db
+
+
+def select_rows(schema_cls, fields=None, extra=()):
+    """A select of the columns serializer(schema_cls, fields) reads.
+
+    Add WHERE conditions to it and hand it to paginate(); the page comes
+    back as Rows.
+    """
+    table = response_schema(schema_cls).opts.model.__table__
+    return table.select().with_only_columns(
+        *(table.c[name] for name in needed_columns(schema_cls, fields, extra))
+    )
+
+
+def fetch_rows(stmt):
+    """Execute a read-only select and return all of its Rows."""
+    return db.session.connection(bind_arguments={"clause": stmt}).execute(stmt).all()
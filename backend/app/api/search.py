@@ -0,0 +1,33 @@
+"""Search API — full-text search across the user's data.
+
+Endpoints:
+    GET /api/search?q=&limit= → Ranked clients, projects and deliverables
+
+Each result is {"type", "id", "title", "snippet", "score"}, best match
+first. title and snippet are HTML-escaped, with matched terms wrapped in
+<mark>. The index, ranking and user scoping live in app/search.py.
+"""
+
+from flask import Blueprint, request, jsonify
+from marshmallow import EXCLUDE
+from app.extensions import db
+from app.errors import AppError
+from app.api.auth_utils import get_current_user_id
+from app.schemas import SearchSchema
+from app.search import search
+
+search_bp = Blueprint("search", __name__)
+
+_search_schema = SearchSchema()
+
+
+@search_bp.route("", methods=["GET"])
+def search_all():
+    """Search the current user's clients, projects and deliverables."""
+    user_id = get_current_user_id()
+    args = _search_schema.load(request.args, unknown=EXCLUDE)
+
+    if db.engine.dialect.name != "sqlite":
+        raise AppError("Search requires the SQLite FTS5 index", code="SEARCH_UNAVAILABLE", status_code=501)
+
+    return jsonify({"data": search(user_id, args["q"], args["limit"])}), 200
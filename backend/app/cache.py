@@ -0,0 +1,299 @@
+"""Versioned per-user response cache.
+
+Cached responses are keyed by (namespace, user_id, data_version). Every
+committed write that touches a user's clients, projects or deliverables
+bumps that user's data_version, so stale entries are never read again —
+there is no explicit invalidation, old entries just age out.
+
+Design decisions:
+- The version is stored in the database (models/data_version.py) and
+  replaced in the same transaction as the write, so every worker, and
+  writes made by CLI commands, agree on it; a per-process version would
+  let one worker keep serving what another worker's write changed.
+  Reading it is one primary-key lookup.
+- Versions are random tokens, not counters, so an old entry can never be
+  mistaken for the current one.
+- The version is read BEFORE computing a response. A write that commits
+  mid-computation bumps the version, so the (possibly stale) result is
+  stored under a key nobody reads any more.
+- Backends are pluggable via CACHE_BACKEND:
+    "memory" — in-process LRU with TTL (default; one worker)
+    "sqlite" — a shared SQLite file, so every worker sees the same entries
+- Hit/miss counters are kept by the backend, behind its lock: per
+  process for "memory", in the shared file for "sqlite" (so all workers
+  add to the same totals). `flask cache-stats` prints them, and every
+  CACHE_METRICS_LOG_EVERY lookups a worker logs response_cache_totals.
+  The outcome of each lookup is also in g.cache_status, reported as the
+  X-Cache header and in the request log.
+"""
+
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from flask import current_app, g
+from sqlalchemy import event, inspect
+
+logger = logging.getLogger(__name__)
+
+# Counter name per lookup outcome (g.cache_status / X-Cache)
+COUNTERS = {"hit": "hits", "miss": "misses"}
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._counters = dict.fromkeys(COUNTERS.values(), 0)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def incr(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def counters(self):
+        with self._lock:
+            return dict(self._counters)
+
+
+class SQLiteBackend:
+    """Cache shared between worker processes through a SQLite file.
+
+    Values are stored as JSON. Expired rows are skipped on read and
+    purged opportunistically on write. Hit/miss counters live in the same
+    file; each increment is one atomic upsert, so workers never lose counts.
+    """
+
+    def __init__(self, path, max_entries=10_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_counters ("
+                " name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        row = self._connect().execute(
+            "SELECT value FROM cache_entries"
+            " WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, time.time()),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), now + ttl if ttl is not None else None),
+        )
+        # Keep the file bounded: drop expired rows, then the oldest expiring ones
+        conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        conn.execute(
+            "DELETE FROM cache_entries WHERE key IN ("
+            " SELECT key FROM cache_entries WHERE expires_at IS NOT NULL"
+            " ORDER BY expires_at LIMIT max(0, (SELECT count(*) FROM cache_entries) - ?))",
+            (self.max_entries,),
+        )
+
+    def clear(self):
+        self._connect().execute("DELETE FROM cache_entries")
+
+    def incr(self, counter):
+        self._connect().execute(
+            "INSERT INTO cache_counters (name, value) VALUES (?, 1)"
+            " ON CONFLICT (name) DO UPDATE SET value = value + 1",
+            (counter,),
+        )
+
+    def counters(self):
+        rows = dict(self._connect().execute("SELECT name, value FROM cache_counters"))
+        return {counter: rows.get(counter, 0) for counter in COUNTERS.values()}
+
+
+class ResponseCache:
+    """Flask extension wrapping a cache backend with per-user versioning."""
+
+    def init_app(self, app):
+        app.config.setdefault("CACHE_BACKEND", "memory")
+        app.config.setdefault("CACHE_DEFAULT_TTL", 300)
+        app.config.setdefault("CACHE_MAX_ENTRIES", 1024)
+        app.config.setdefault("CACHE_SQLITE_PATH", None)
+        app.config.setdefault("CACHE_METRICS_LOG_EVERY", 1000)
+
+        backend_name = app.config["CACHE_BACKEND"]
+        if backend_name == "memory":
+            backend = MemoryBackend(app.config["CACHE_MAX_ENTRIES"])
+        elif backend_name == "sqlite":
+            path = app.config["CACHE_SQLITE_PATH"] or os.path.join(
+                app.instance_path, "response_cache.db"
+            )
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            backend = SQLiteBackend(path, app.config["CACHE_MAX_ENTRIES"])
+        else:
+            raise ValueError(f"Unknown CACHE_BACKEND '{backend_name}'")
+
+        app.extensions["response_cache"] = {
+            "backend": backend,
+            # Lookups by this process, to pace the totals log
+            "lookups": itertools.count(1),
+        }
+        _register_session_events()
+
+    @property
+    def backend(self):
+        return current_app.extensions["response_cache"]["backend"]
+
+    def metrics(self):
+        """Hit/miss totals: this process ("memory") or every worker ("sqlite")."""
+        metrics = self.backend.counters()
+        total = metrics["hits"] + metrics["misses"]
+        metrics["hit_ratio"] = round(metrics["hits"] / total, 4) if total else None
+        return metrics
+
+    def _count(self, outcome):
+        g.cache_status = outcome
+        self.backend.incr(COUNTERS[outcome])
+        every = current_app.config["CACHE_METRICS_LOG_EVERY"]
+        if every and next(current_app.extensions["response_cache"]["lookups"]) % every == 0:
+            logger.info("response_cache_totals", extra=self.metrics())
+
+    def data_version(self, user_id):
+        """The user's current data version, read from the database."""
+        from app.models.data_version import read_data_version
+
+        return read_data_version(user_id)
+
+    def bump_version(self, user_id):
+        """Invalidate every cached response for this user when the session commits."""
+        from app.extensions import db
+
+        mark_users_touched(db.session, [user_id])
+
+    def get_or_compute(self, namespace, user_id, compute, ttl=None):
+        """Return the cached value for (namespace, user, version) or compute it.
+
+        Args:
+            namespace: Name of the cached response, e.g. "dashboard".
+            user_id: Owner of the data.
+            compute: Zero-argument callable producing a JSON-serializable value.
+            ttl: Seconds to keep the entry. Defaults to CACHE_DEFAULT_TTL and
+                 is never longer than it.
+        """
+        default_ttl = current_app.config["CACHE_DEFAULT_TTL"]
+        ttl = min(ttl, default_ttl) if ttl is not None else default_ttl
+
+        key = f"{namespace}:{user_id}:{self.data_version(user_id)}"
+
+        value = self.backend.get(key)
+        if value is not None:
+            self._count("hit")
+            return value
+
+        self._count("miss")
+        value = compute()
+        self.backend.set(key, value, ttl)
+        return value
+
+
+def _owners_touched(session):
+    """User ids whose clients, projects or deliverables this flush changes."""
+    from app.models import Client, Project, Deliverable
+
+    owner_attr = {Client: "user_id", Project: "owner_id", Deliverable: "owner_id"}
+    touched = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        attr = owner_attr.get(type(obj))
+        if attr is None:
+            continue
+        # Old and new owners both lose their cached responses on reassignment
+        touched.update(inspect(obj).attrs[attr].history.sum())
+        touched.add(getattr(obj, attr))
+    touched.discard(None)
+    return touched
+
+
+def mark_users_touched(session, user_ids):
+    """Bump these users' data versions as part of the session's commit.
+
+    The flush hook calls this; set-based writes that bypass the unit of
+    work call it directly (see models/bulk_writes.py).
+    """
+    session.info.setdefault("cache_touched_users", set()).update(user_ids)
+
+
+def _collect_touched_users(session, flush_context):
+    mark_users_touched(session, _owners_touched(session))
+
+
+def _bump_touched_users(session):
+    """Write the new versions inside the committing transaction."""
+    from app.models.data_version import bump_data_versions
+
+    # Flush first: the flush hook above is what collects most users
+    session.flush()
+    user_ids = session.info.pop("cache_touched_users", None)
+    if user_ids:
+        bump_data_versions(session, user_ids)
+
+
+def _forget_touched_users(session):
+    session.info.pop("cache_touched_users", None)
+
+
+def _register_session_events():
+    """Bump users' data versions in the transaction of their writes (registered once)."""
+    from app.extensions import db
+
+    for name, listener in (
+        ("after_flush", _collect_touched_users),
+        ("before_commit", _bump_touched_users),
+        ("after_rollback", _forget_touched_users),
+    ):
+        if not event.contains(db.session, name, listener):
+            event.listen(db.session, name, listener)
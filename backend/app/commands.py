@@ -0,0 +1,389 @@
+"""Flask CLI commands for maintenance and data migrations.
+
+Usage:
+    flask backfill-owner-ids
+    flask add-insert-sentinels
+    flask reconcile-user-stats [--dry-run]
+    flask check-project-counters [--fix]
+    flask sync-replica [--interval SECONDS]
+    flask cascade-foreign-keys [--dry-run]
+    flask rebuild-search-index
+    flask cache-stats
+    flask import-data USER_ID [--archive ZIP | --clients F --projects F --deliverables F]
+
+Design decisions:
+- Tables are created with db.create_all() (see app/__init__.py), which
+  never alters existing tables. Commands that introduce a column therefore
+  add it themselves when it is missing, so an existing dev.db can be
+  upgraded in place.
+- Every command is idempotent — running it twice is harmless.
+"""
+
+import time
+import click
+from flask import current_app
+from datetime import datetime, timezone
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateTable
+from app.cache import mark_users_touched
+from app.extensions import db
+
+
+def register_commands(app):
+    """Register all CLI commands on the Flask app."""
+    app.cli.add_command(backfill_owner_ids)
+    app.cli.add_command(add_insert_sentinels)
+    app.cli.add_command(reconcile_user_stats)
+    app.cli.add_command(check_project_counters)
+    app.cli.add_command(sync_replica)
+    app.cli.add_command(cascade_foreign_keys)
+    app.cli.add_command(rebuild_search_index)
+    app.cli.add_command(cache_stats)
+    app.cli.add_command(import_data)
+
+
+def _ensure_column(table, column, ddl):
+    """Add a column to an existing table if it is not there yet."""
+    existing = {c["name"] for c in inspect(db.engine).get_columns(table)}
+    if column not in existing:
+        db.session.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+        return True
+    return False
+
+
+@click.command("backfill-owner-ids")
+def backfill_owner_ids():
+    """Add and backfill the denormalized owner_id on projects and deliverables."""
+    for table in ("projects", "deliverables"):
+        if _ensure_column(table, "owner_id", "INTEGER REFERENCES users(id)"):
+            click.echo(f"Added {table}.owner_id")
+
+    projects = db.session.execute(text(
+        "UPDATE projects SET owner_id = "
+        "(SELECT clients.user_id FROM clients WHERE clients.id = projects.client_id) "
+        "WHERE owner_id IS NULL OR owner_id != "
+        "(SELECT clients.user_id FROM clients WHERE clients.id = projects.client_id)"
+    ))
+    deliverables = db.session.execute(text(
+        "UPDATE deliverables SET owner_id = "
+        "(SELECT projects.owner_id FROM projects WHERE projects.id = deliverables.project_id) "
+        "WHERE owner_id IS NULL OR owner_id != "
+        "(SELECT projects.owner_id FROM projects WHERE projects.id = deliverables.project_id)"
+    ))
+    db.session.commit()
+
+    # create_all() skips existing tables, so their new indexes are created here
+    from app.models import Project, Deliverable
+    for model in (Project, Deliverable):
+        for index in model.__table__.indexes:
+            index.create(db.engine, checkfirst=True)
+
+    click.echo(
+        f"Backfilled owner_id on {projects.rowcount} projects "
+        f"and {deliverables.rowcount} deliverables"
+    )
+
+
+@click.command("add-insert-sentinels")
+def add_insert_sentinels():
+    """Add the _sentinel column batched INSERTs use to order RETURNING ids.
+
+    Only multi-row inserts write it (see models/bulk_writes.py); existing
+    rows keep NULL.
+    """
+    for table in db.metadata.sorted_tables:
+        if "_sentinel" in table.c and _ensure_column(table.name, "_sentinel", "INTEGER"):
+            click.echo(f"Added {table.name}._sentinel")
+    db.session.commit()
+
+
+@click.command("reconcile-user-stats")
+@click.option("--dry-run", is_flag=True, help="Report drift without fixing it.")
+def reconcile_user_stats(dry_run):
+    """Recompute every user's dashboard counters and report any drift."""
+    from app.models import User, UserStats
+    from app.models.user_stats import (
+        COUNTER_FIELDS, compute_user_counts, recompute_user_stats,
+    )
+
+    now = datetime.now(timezone.utc)
+    drifted = 0
+    for user_id in db.session.execute(db.select(User.id)).scalars().all():
+        stats = db.session.get(UserStats, user_id)
+        expected = compute_user_counts(user_id, now)
+        stored = stats.to_dict() if stats else dict.fromkeys(COUNTER_FIELDS)
+        diff = {
+            field: (stored[field], expected[field])
+            for field in COUNTER_FIELDS
+            if stored[field] != expected[field]
+        }
+        if stats is not None and stats.overdue_as_of != now.date():
+            # A stale overdue counter is expected; it is refreshed on read
+            diff.pop("overdue_deliverable_count", None)
+
+        if diff:
+            drifted += 1
+            details = ", ".join(f"{f}: {old} -> {new}" for f, (old, new) in diff.items())
+            click.echo(f"user {user_id}: {details}")
+        if not dry_run:
+            recompute_user_stats(user_id, now)
+            if diff:
+                # The dashboard changes: invalidate cached copies and ETags
+                mark_users_touched(db.session, [user_id])
+
+    if not dry_run:
+        db.session.commit()
+
+    action = "found" if dry_run else "fixed"
+    click.echo(f"Reconciled user_stats: {action} drift for {drifted} user(s)")
+
+
+@click.command("check-project-counters")
+@click.option("--fix", is_flag=True, help="Rewrite drifted counters from real counts.")
+def check_project_counters(fix):
+    """Verify stored deliverable counters on projects against real counts."""
+    from app.models import Project
+    from app.models.project_counters import find_counter_drift, recompute_project_counters
+
+    added = [
+        _ensure_column("projects", column, "INTEGER NOT NULL DEFAULT 0")
+        for column in ("deliverable_total", "deliverable_completed")
+    ]
+    if any(added):
+        click.echo("Added projects.deliverable_total / deliverable_completed")
+        db.session.commit()
+
+    drift = find_counter_drift()
+    for project_id, (stored_total, stored_completed), (total, completed) in drift:
+        click.echo(
+            f"project {project_id}: stored {stored_completed}/{stored_total}, "
+            f"actual {completed}/{total}"
+        )
+
+    if fix and drift:
+        project_ids = [project_id for project_id, _, _ in drift]
+        recompute_project_counters(project_ids)
+        # Progress changes: invalidate the owners' cached copies and ETags
+        mark_users_touched(db.session, db.session.execute(
+            db.select(Project.owner_id).where(Project.id.in_(project_ids)).distinct()
+        ).scalars())
+        db.session.commit()
+
+    if not drift:
+        click.echo("Project counters are consistent")
+    else:
+        action = "fixed" if fix else "found"
+        click.echo(f"Project counters: {action} drift on {len(drift)} project(s)")
+        if not fix:
+            raise SystemExit(1)
+
+
+@click.command("sync-replica")
+@click.option("--interval", type=float, default=None,
+              help="Keep copying every N seconds instead of copying once.")
+def sync_replica(interval):
+    """Copy the primary SQLite database into the READ_REPLICA_URL file."""
+    from flask import current_app
+    from app.replica import sync_sqlite_replica
+
+    url = current_app.config.get("READ_REPLICA_URL")
+    if not url or not url.startswith("sqlite"):
+        raise click.ClickException("READ_REPLICA_URL must point at a SQLite file")
+
+    while True:
+        sync_sqlite_replica(db)
+        click.echo(f"Replica synced at {datetime.now(timezone.utc):%H:%M:%S}")
+        if interval is None:
+            return
+        time.sleep(interval)
+
+
+def _missing_cascades(connection):
+    """Tables whose model declares ON DELETE CASCADE but the database does not.
+
+    Returns:
+        List of (table, [referred tables]) in dependency order.
+    """
+    inspector = inspect(connection)
+    missing = []
+    for table in db.metadata.sorted_tables:
+        wanted = {
+            fk.column.table.name
+            for fk in table.foreign_keys
+            if (fk.ondelete or "").upper() == "CASCADE"
+        }
+        if not wanted or not inspector.has_table(table.name):
+            continue
+        present = {
+            fk["referred_table"]
+            for fk in inspector.get_foreign_keys(table.name)
+            if (fk.get("options", {}).get("ondelete") or "").upper() == "CASCADE"
+        }
+        if wanted - present:
+            missing.append((table, sorted(wanted - present)))
+    return missing
+
+
+def _rebuild_sqlite_table(connection, table, ddl=None):
+    """Recreate a SQLite table from its model definition, keeping its rows.
+
+    SQLite cannot alter a foreign key, so this follows the documented
+    procedure: create the new table, copy, drop the old one, rename, then
+    recreate indexes and triggers (e.g. the search index's, see
+    app/search.py). Must run with foreign_keys=OFF.
+    """
+    ddl = ddl or str(CreateTable(table).compile(connection)).strip()
+    staging = f"_new_{table.name}"
+    existing = {c["name"] for c in inspect(connection).get_columns(table.name)}
+    columns = ", ".join(c.name for c in table.columns if c.name in existing)
+    triggers = connection.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ?", (table.name,)
+    ).scalars().all()
+
+    connection.exec_driver_sql(ddl.replace(f"CREATE TABLE {table.name} ", f"CREATE TABLE {staging} ", 1))
+    connection.exec_driver_sql(f"INSERT INTO {staging} ({columns}) SELECT {columns} FROM {table.name}")
+    connection.exec_driver_sql(f"DROP TABLE {table.name}")
+    connection.exec_driver_sql(f"ALTER TABLE {staging} RENAME TO {table.name}")
+    for index in table.indexes:
+        index.create(connection)
+    for trigger in triggers:
+        connection.exec_driver_sql(trigger)
+
+
+def _recreate_foreign_keys(connection, table):
+    """Swap a table's foreign keys for the model's (server databases)."""
+    inspector = inspect(connection)
+    for fk in inspector.get_foreign_keys(table.name):
+        connection.execute(text(f'ALTER TABLE {table.name} DROP CONSTRAINT "{fk["name"]}"'))
+    for constraint in table.foreign_key_constraints:
+        columns = ", ".join(c.name for c in constraint.columns)
+        referred = ", ".join(e.column.name for e in constraint.elements)
+        ondelete = f" ON DELETE {constraint.ondelete}" if constraint.ondelete else ""
+        connection.execute(text(
+            f"ALTER TABLE {table.name} ADD FOREIGN KEY ({columns}) "
+            f"REFERENCES {constraint.referred_table.name} ({referred}){ondelete}"
+        ))
+
+
+@click.command("cascade-foreign-keys")
+@click.option("--dry-run", is_flag=True, help="List the tables that need migrating.")
+def cascade_foreign_keys(dry_run):
+    """Migrate parent foreign keys to ON DELETE CASCADE.
+
+    Deleting a client or project used to load every child row into the
+    session. The models now rely on the database to cascade, so existing
+    databases need the new constraints. On SQLite the rebuilt tables get
+    the search index's triggers back and the index is repopulated, in the
+    same transaction.
+    """
+    from app.search import create_search_index, rebuild_search_index as rebuild_search
+
+    with db.engine.connect() as connection:
+        missing = _missing_cascades(connection)
+        for table, referred in missing:
+            click.echo(f"{table.name}: ON DELETE CASCADE missing for {', '.join(referred)}")
+        if not missing:
+            click.echo("Foreign keys already cascade")
+            return
+        if dry_run:
+            return
+
+        if connection.dialect.name != "sqlite":
+            for table, _ in missing:
+                _recreate_foreign_keys(connection, table)
+            connection.commit()
+        else:
+            # PRAGMA foreign_keys is a no-op inside a transaction
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            connection.commit()
+            try:
+                connection.exec_driver_sql("BEGIN")
+                for table, _ in missing:
+                    _rebuild_sqlite_table(connection, table)
+                create_search_index(db.metadata, connection)
+                rebuild_search(connection)
+                violations = connection.exec_driver_sql("PRAGMA foreign_key_check").all()
+                if violations:
+                    connection.rollback()
+                    raise click.ClickException(
+                        f"Aborted: {len(violations)} row(s) reference missing parents"
+                    )
+                connection.commit()
+            finally:
+                connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    click.echo(f"Migrated {len(missing)} table(s) to ON DELETE CASCADE")
+
+
+@click.command("rebuild-search-index")
+def rebuild_search_index():
+    """Recreate the full-text search index from its source tables."""
+    from app.search import create_search_index, rebuild_search_index as rebuild
+
+    if db.engine.dialect.name != "sqlite":
+        raise click.ClickException("Full-text search needs SQLite (FTS5)")
+
+    with db.engine.begin() as connection:
+        create_search_index(db.metadata, connection)
+        count = rebuild(connection)
+    click.echo(f"Indexed {count} row(s)")
+
+
+@click.command("cache-stats")
+def cache_stats():
+    """Print the response cache's hit/miss totals."""
+    from app.extensions import response_cache
+
+    metrics = response_cache.metrics()
+    ratio = "n/a" if metrics["hit_ratio"] is None else f"{metrics['hit_ratio']:.1%}"
+    click.echo(f"hits {metrics['hits']}, misses {metrics['misses']}, hit ratio {ratio}")
+    if current_app.config["CACHE_BACKEND"] == "memory":
+        click.echo(
+            "CACHE_BACKEND is memory: these are this process's counters; workers "
+            "log theirs as response_cache_totals"
+        )
+
+
+@click.command("import-data")
+@click.argument("user_id", type=int)
+@click.option("--archive", type=click.File("rb"), help="An export archive (zip).")
+@click.option("--clients", type=click.File("rb"), help="Clients as .csv or .ndjson.")
+@click.option("--projects", type=click.File("rb"), help="Projects as .csv or .ndjson.")
+@click.option("--deliverables", type=click.File("rb"), help="Deliverables as .csv or .ndjson.")
+@click.option("--chunk-size", type=int, default=None, help="Rows per INSERT and commit.")
+def import_data(user_id, archive, chunk_size, **files):
+    """Bulk-import clients, projects and deliverables into a user's account."""
+    from app.errors import AppError
+    from app.importer import DEFAULT_CHUNK_SIZE, encoding_for, import_tables, open_archive, read_rows
+    from app.models import User
+
+    if db.session.get(User, user_id) is None:
+        raise click.ClickException(f"User {user_id} not found")
+    try:
+        if archive is not None:
+            sources = open_archive(archive)
+        else:
+            sources = {
+                name: read_rows(file, encoding_for(file.name))
+                for name, file in files.items()
+                if file is not None
+            }
+    except AppError as exc:
+        raise click.ClickException(exc.message)
+    if not sources:
+        raise click.ClickException("Pass --archive or at least one table file")
+
+    def progress(table, counts):
+        click.echo(f"{table}: {counts['rows']} rows, {counts['imported']} imported, {counts['failed']} failed")
+
+    start = time.perf_counter()
+    report = import_tables(user_id, sources, chunk_size or DEFAULT_CHUNK_SIZE, progress)
+    elapsed = time.perf_counter() - start
+
+    for error in report["errors"]:
+        click.echo(f"{error['table']} line {error['line']}: {error['code']} {error['message']} {error['details'] or ''}")
+    imported = sum(counts["imported"] for counts in report["tables"].values())
+    failed = sum(counts["failed"] for counts in report["tables"].values())
+    click.echo(f"Imported {imported} row(s) in {elapsed:.1f} s; {failed} failed")
+    if failed:
+        raise SystemExit(1)
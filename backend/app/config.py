@@ -5,6 +5,8 @@ Design decisions:
 - In-memory SQLite for testing (fast, isolated)
 - DATABASE_URL env var for production (PostgreSQL expected)
 - Secret key defaults to a dev value but MUST be overridden in production
+- SQLite runs with a WAL/busy_timeout engine profile so several workers
+  can share one file (see app/database.py)
 """
 
 import os
@@ -22,6 +24,55 @@ class Config:
     # Structured logging
     LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 
+    # Response cache (app/cache.py): "memory" is per-process, "sqlite" is
+    # shared by every worker on the host
+    CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+    CACHE_DEFAULT_TTL = int(os.environ.get("CACHE_DEFAULT_TTL", 300))
+    CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", 1024))
+    CACHE_SQLITE_PATH = os.environ.get("CACHE_SQLITE_PATH")
+    # Log hit/miss totals every N lookups per worker (0 = never)
+    CACHE_METRICS_LOG_EVERY = int(os.environ.get("CACHE_METRICS_LOG_EVERY", 1000))
+
+    # JSON encoder for jsonify / request.get_json (app/json_provider.py):
+    # "orjson" (falls back to "stdlib" if orjson is not installed)
+    JSON_PROVIDER = os.environ.get("JSON_PROVIDER", "orjson")
+
+    # Response compression (app/middleware.py): text bodies of at least
+    # COMPRESSION_MIN_SIZE bytes use the best codec the client accepts, in
+    # this order on ties. zstd / br need the optional zstandard / brotli
+    # packages. Set COMPRESSION_LEVELS = {} to turn compression off.
+    COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_LEVELS = {
+        "zstd": int(os.environ.get("COMPRESSION_ZSTD_LEVEL", 3)),
+        "br": int(os.environ.get("COMPRESSION_BR_LEVEL", 4)),
+        "gzip": int(os.environ.get("COMPRESSION_GZIP_LEVEL", 6)),
+    }
+
+    # Engine profile (app/database.py). PRAGMAs run on every new SQLite
+    # connection; set SQLITE_PRAGMAS = {} to use SQLite's defaults.
+    # foreign_keys=ON is always set on top: ON DELETE CASCADE depends on it.
+    SQLITE_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # negative = KiB, i.e. 64 MiB
+        "temp_store": "MEMORY",
+    }
+    # Connection pool for server databases (ignored for SQLite)
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+
+    # Read replica (app/replica.py): safe-method requests read from it, and
+    # a user who just wrote stays on the primary for the sticky window
+    # (tracked in the primary database, so it holds across workers).
+    # A local SQLite replica should be opened read-only, e.g.
+    # sqlite:///file:/path/replica.db?mode=ro&uri=true
+    READ_REPLICA_URL = os.environ.get("READ_REPLICA_URL")
+    READ_REPLICA_STICKY_SECONDS = int(os.environ.get("READ_REPLICA_STICKY_SECONDS", 10))
+
 
 class DevelopmentConfig(Config):
     """Development configuration — SQLite file-based database."""
@@ -0,0 +1,72 @@
+"""Database engine profile.
+
+Plain file SQLite uses a rollback journal: a writer locks out every reader
+and concurrent workers fail with "database is locked". The profile below is
+applied to every engine the app creates:
+
+- SQLite: PRAGMAs from SQLITE_PRAGMAS run on each new connection —
+  WAL (readers never block the writer), synchronous=NORMAL (safe with WAL,
+  no fsync per commit), busy_timeout (wait for the lock instead of failing),
+  plus mmap_size / cache_size / temp_store for read-heavy pages.
+  foreign_keys=ON is not part of the profile: the models rely on
+  ON DELETE CASCADE, so it is set on every connection regardless.
+- Other databases: pool sizing from DB_POOL_SIZE, DB_MAX_OVERFLOW,
+  DB_POOL_TIMEOUT and DB_POOL_RECYCLE, with pre-ping so dropped
+  connections are replaced transparently.
+
+Options set explicitly in SQLALCHEMY_ENGINE_OPTIONS always win.
+"""
+
+from sqlalchemy import event
+
+
+def is_sqlite(uri):
+    return (uri or "").startswith("sqlite")
+
+
+def build_engine_options(config):
+    """Return SQLALCHEMY_ENGINE_OPTIONS with the profile's defaults filled in."""
+    options = dict(config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    if is_sqlite(config.get("SQLALCHEMY_DATABASE_URI")):
+        busy_timeout_ms = config.get("SQLITE_PRAGMAS", {}).get("busy_timeout")
+        if busy_timeout_ms is not None:
+            # The driver's own lock timeout, matched to busy_timeout
+            connect_args = dict(options.get("connect_args") or {})
+            connect_args.setdefault("timeout", busy_timeout_ms / 1000)
+            options["connect_args"] = connect_args
+        return options
+
+    options.setdefault("pool_size", config["DB_POOL_SIZE"])
+    options.setdefault("max_overflow", config["DB_MAX_OVERFLOW"])
+    options.setdefault("pool_timeout", config["DB_POOL_TIMEOUT"])
+    options.setdefault("pool_recycle", config["DB_POOL_RECYCLE"])
+    options.setdefault("pool_pre_ping", True)
+    return options
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Run the given PRAGMAs on every new connection to a SQLite engine.
+
+    foreign_keys=ON always runs last, so an empty or overriding profile
+    cannot turn off the cascades deletes depend on.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.execute("PRAGMA foreign_keys=ON")
+        finally:
+            cursor.close()
+
+
+def sqlite_pragma_values(connection, names):
+    """Read back PRAGMA values on a connection, e.g. to verify the profile."""
+    return {
+        name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+        for name in names
+    }
@@ -0,0 +1,216 @@
+"""Full-account export as a streamed zip of NDJSON or CSV files.
+
+Archive layout:
+    manifest.json       format name, version, encoding and, per table,
+                        its file name and ordered (column, type) list
+    clients.<ext>       one file per table, in EXPORT_TABLES order —
+    projects.<ext>      parents before children, so a reader can
+    deliverables.<ext>  resolve every reference as it goes
+    agent_runs.<ext>
+    step_runs.<ext>
+
+Design decisions:
+- The columns of each table are listed here explicitly, not read from the
+  models. A new model column does not change the export until it is added
+  below (and EXPORT_VERSION bumped if the change is not additive), so the
+  manifest is a stable contract for re-import.
+- Row ids are exported and references (projects.client_id, ...) point at
+  them. They act as external keys: an importer maps them to new ids.
+  Ownership columns (user_id, owner_id) and derived counters
+  (deliverable_total/completed) are left out; they belong to the account
+  the data is imported into.
+- Rows come from Core selects executed with yield_per, so only one chunk
+  of rows is in memory at a time. Each chunk is written straight into the
+  zip entry and the compressed bytes are handed to the response, so the
+  archive is never held in memory or on disk either.
+- All tables are read on one connection in one read transaction, held
+  by the generator, so the files are a consistent snapshot even while
+  the account keeps changing. pysqlite sends no BEGIN before a SELECT,
+  so on SQLite the transaction is begun explicitly; server databases
+  read at REPEATABLE READ.
+- Values: dates and datetimes are ISO 8601 strings, JSON columns are
+  objects in NDJSON and JSON text in CSV, NULL is null in NDJSON and an
+  empty field in CSV.
+"""
+
+import csv
+import io
+import json
+import zipfile
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from app.extensions import db
+from app.models import AgentRun, Client, Deliverable, Project, StepRun
+
+EXPORT_FORMAT = "clientpilot-export"
+EXPORT_VERSION = 1
+ENCODINGS = ("ndjson", "csv")
+
+# (file name, model, exported columns)
+EXPORT_TABLES = (
+    ("clients", Client,
+     ("id", "name", "email", "company", "logo_url", "notes", "created_at", "updated_at")),
+    ("projects", Project,
+     ("id", "client_id", "title", "description", "status", "deadline", "created_at", "updated_at")),
+    ("deliverables", Deliverable,
+     ("id", "project_id", "title", "description", "status", "due_date", "created_at", "updated_at")),
+    ("agent_runs", AgentRun,
+     ("id", "action", "status", "error_message", "started_at", "finished_at")),
+    ("step_runs", StepRun,
+     ("id", "agent_run_id", "step_number", "action", "input_data", "output_data", "created_at")),
+)
+
+_TYPE_NAMES = {int: "integer", str: "string", datetime: "datetime", date: "date", dict: "json"}
+
+
+def _column_type(column):
+    return _TYPE_NAMES.get(column.type.python_type, "string")
+
+
+def manifest(encoding):
+    """Describe the archive: format, version and each file's columns."""
+    return {
+        "format": EXPORT_FORMAT,
+        "version": EXPORT_VERSION,
+        "encoding": encoding,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "tables": [
+            {
+                "name": name,
+                "file": f"{name}.{encoding}",
+                "columns": [
+                    {"name": column, "type": _column_type(model.__table__.c[column])}
+                    for column in columns
+                ],
+            }
+            for name, model, columns in EXPORT_TABLES
+        ],
+    }
+
+
+def _owned_rows(model, columns, user_id):
+    """The user's rows of one table, in an order an index already provides.
+
+    A sort the index cannot provide would make SQLite buffer every row
+    before returning the first one.
+    """
+    table = model.__table__
+    stmt = db.select(*(table.c[column] for column in columns))
+    if model is StepRun:
+        runs = AgentRun.__table__
+        return (
+            stmt.join(runs, runs.c.id == table.c.agent_run_id)
+            .where(runs.c.user_id == user_id)
+            .order_by(runs.c.id, table.c.id)
+        )
+    if "user_id" in table.c:
+        return stmt.where(table.c.user_id == user_id).order_by(table.c.id)
+    # ix_<table>_owner_created
+    return stmt.where(table.c.owner_id == user_id).order_by(table.c.created_at, table.c.id)
+
+
+def _plain(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _encode_ndjson(columns, rows):
+    return "".join(
+        json.dumps(dict(zip(columns, map(_plain, row))), ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def _encode_csv(columns, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for row in rows:
+        writer.writerow([
+            "" if value is None
+            else json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list))
+            else _plain(value)
+            for value in row
+        ])
+    return buffer.getvalue()
+
+
+class _Sink:
+    """A write-only file that hands back whatever was written since the last drain."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+@contextmanager
+def _read_snapshot():
+    """A connection inside a read transaction that sees one snapshot.
+
+    Uses the engine the session reads from (the replica, if routed), but
+    its own connection, so the transaction lasts exactly as long as the
+    export and is always rolled back.
+    """
+    engine = db.session.get_bind()
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as connection:
+            # Without it each SELECT would see the database as of its own
+            # start. An in-memory database shares one connection, which
+            # may already be in a transaction.
+            began = not connection.connection.dbapi_connection.in_transaction
+            if began:
+                connection.exec_driver_sql("BEGIN")
+            try:
+                yield connection
+            finally:
+                if began:
+                    connection.rollback()
+    else:
+        with engine.connect().execution_options(isolation_level="REPEATABLE READ") as connection:
+            with connection.begin() as transaction:
+                yield connection
+                transaction.rollback()
+
+
+def _archive_chunks(user_id, encoding, chunk_size):
+    encode = _encode_csv if encoding == "csv" else _encode_ndjson
+    sink = _Sink()
+    # The sink cannot seek, so zipfile writes sizes after each entry's data
+    with _read_snapshot() as connection, \
+            zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("manifest.json", json.dumps(manifest(encoding), indent=2))
+        yield sink.drain()
+
+        for name, model, columns in EXPORT_TABLES:
+            with archive.open(f"{name}.{encoding}", "w", force_zip64=True) as entry:
+                if encoding == "csv":
+                    entry.write(_encode_csv(columns, [columns]).encode())
+                result = connection.execute(
+                    _owned_rows(model, columns, user_id).execution_options(yield_per=chunk_size)
+                )
+                for rows in result.partitions():
+                    entry.write(encode(columns, rows).encode())
+                    yield sink.drain()
+            yield sink.drain()
+    yield sink.drain()
+
+
+def stream_export(user_id, encoding="ndjson", chunk_size=1000):
+    """Yield the user's export archive as a sequence of byte chunks.
+
+    Must run inside an app context (see flask.stream_with_context).
+    """
+    for chunk in _archive_chunks(user_id, encoding, chunk_size):
+        if chunk:
+            yield chunk
@@ -9,8 +9,11 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
 from flask_migrate import Migrate
 from flask_cors import CORS
+from app.cache import ResponseCache
+from app.replica import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 ma = Marshmallow()
 migrate = Migrate()
 cors = CORS()
+response_cache = ResponseCache()
@@ -0,0 +1,247 @@
+"""Chunked bulk import of clients, projects and deliverables.
+
+Input is one CSV or NDJSON file per table, or an export archive (see
+app/export.py), whose manifest names the files. Every row may carry an
+external key in its `id` column; projects refer to clients, and
+deliverables to projects, by that key in `client_id` / `project_id`:
+
+    clients.csv        id,name,email
+                       acme,Acme Corp,ops@acme.com
+    projects.ndjson    {"id": "site", "client_id": "acme", "title": "Website"}
+
+Design decisions:
+- Files are parsed as streams, row by row, and rows are inserted in
+  chunks of `chunk_size`: one executemany INSERT and one commit per
+  chunk (models/bulk_writes.py keeps counters, stats and caches in
+  step). Memory is bounded by the chunk size plus the key → id maps.
+- Rows are validated with the API's create schemas, so an import accepts
+  exactly what POST would. Columns the schema does not know (an export's
+  status, created_at, ...) are ignored: imported projects start active
+  and deliverables planned, like any new row.
+- Keys only resolve to rows created by the same import, never to
+  existing ids, so an import cannot attach rows to another account's
+  data. Tables are imported parents first.
+- A bad row is reported (table, line, key, error envelope fields) and
+  skipped; it never aborts the import. Rows referring to a skipped
+  parent are reported too. If a chunk's INSERT fails in the database,
+  that chunk is retried row by row to isolate the failing rows.
+- Agent runs are not imported: they are an audit log of what the AI did
+  for the original account.
+"""
+
+import csv
+import io
+import json
+import logging
+import zipfile
+from marshmallow import EXCLUDE, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from app.errors import AppError
+from app.export import EXPORT_FORMAT, EXPORT_VERSION
+from app.extensions import db
+from app.models.bulk_writes import insert_clients, insert_owned_deliverables, insert_projects
+from app.schemas import ClientCreateSchema, DeliverableCreateSchema, ProjectCreateSchema
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+ENCODINGS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+# (table, create schema, (reference column, parent table) or None, bulk insert)
+IMPORT_TABLES = (
+    ("clients", ClientCreateSchema(), None, insert_clients),
+    ("projects", ProjectCreateSchema(), ("client_id", "clients"), insert_projects),
+    ("deliverables", DeliverableCreateSchema(), ("project_id", "projects"), insert_owned_deliverables),
+)
+TABLE_NAMES = tuple(name for name, _, _, _ in IMPORT_TABLES)
+
+
+def _invalid_import(message, details=None):
+    """The upload as a whole cannot be imported (not a single bad row)."""
+    return AppError(message, code="INVALID_IMPORT", status_code=400, details=details)
+
+
+def encoding_for(filename):
+    """Pick csv or ndjson from a file name's extension."""
+    for extension, encoding in ENCODINGS.items():
+        if (filename or "").lower().endswith(extension):
+            return encoding
+    raise _invalid_import(
+        f"Cannot tell the format of {filename!r}",
+        details={"allowed_extensions": sorted(ENCODINGS)},
+    )
+
+
+def read_rows(stream, encoding):
+    """Yield (line number, row dict) from a binary CSV or NDJSON stream.
+
+    A line that cannot be parsed is yielded as (line number, ValueError).
+    Empty CSV fields are dropped, so optional columns can be left blank.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if encoding == "csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, {k: v for k, v in row.items() if k is not None and v != ""}
+        return
+
+    for line_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_number, ValueError(f"Invalid JSON: {exc}")
+            continue
+        if not isinstance(row, dict):
+            row = ValueError("Each line must be a JSON object")
+        yield line_number, row
+
+
+def open_archive(stream):
+    """Return {table: rows} for the importable files of an export archive."""
+    try:
+        archive = zipfile.ZipFile(stream)
+        manifest = json.loads(archive.read("manifest.json"))
+    except (zipfile.BadZipFile, KeyError, ValueError):
+        raise _invalid_import("Not an export archive: manifest.json is missing or unreadable")
+    if manifest.get("format") != EXPORT_FORMAT or manifest.get("version", 0) > EXPORT_VERSION:
+        raise _invalid_import(
+            "Unsupported export archive",
+            details={"format": manifest.get("format"), "version": manifest.get("version")},
+        )
+    return {
+        table["name"]: read_rows(archive.open(table["file"]), manifest["encoding"])
+        for table in manifest.get("tables", [])
+        if table.get("name") in TABLE_NAMES
+    }
+
+
+class _Report:
+    """Counts per table plus the first MAX_REPORTED_ERRORS row errors."""
+
+    def __init__(self):
+        self.tables = {name: {"rows": 0, "imported": 0, "failed": 0} for name in TABLE_NAMES}
+        self.errors = []
+        self.error_count = 0
+
+    def fail(self, table, line, key, code, message, details=None):
+        self.tables[table]["failed"] += 1
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({
+                "table": table, "line": line, "key": key,
+                "code": code, "message": message, "details": details,
+            })
+
+    def to_dict(self):
+        return {
+            "tables": self.tables,
+            "errors": self.errors,
+            "errors_truncated": self.error_count > len(self.errors),
+        }
+
+
+def _insert_chunk(table, insert, user_id, chunk, keys, report):
+    """Insert and commit one chunk; record new ids under their keys."""
+    try:
+        ids = insert(user_id, [item for _, _, item in chunk])
+        db.session.commit()
+    except SQLAlchemyError as exc:
+        db.session.rollback()
+        if len(chunk) == 1:
+            line, key, _ = chunk[0]
+            report.fail(table, line, key, "INSERT_FAILED", str(getattr(exc, "orig", None) or exc))
+            return
+        logger.warning("import_chunk_failed", extra={"table": table, "error": str(exc)})
+        for row in chunk:
+            _insert_chunk(table, insert, user_id, [row], keys, report)
+        return
+
+    report.tables[table]["imported"] += len(ids)
+    for (_, key, _), new_id in zip(chunk, ids):
+        if key is not None:
+            keys[key] = new_id
+
+
+def _import_table(user_id, table, schema, reference, insert, rows, keys, report, chunk_size, progress):
+    own_keys = keys[table]
+    seen = set()
+    chunk = []
+    for line, row in rows:
+        report.tables[table]["rows"] += 1
+        if isinstance(row, Exception):
+            report.fail(table, line, None, "INVALID_ROW", str(row))
+            continue
+
+        key = row.pop("id", None)
+        key = None if key is None else str(key)
+        if key is not None and key in seen:
+            report.fail(table, line, key, "DUPLICATE_KEY", f"Key {key!r} appears twice in {table}")
+            continue
+        if key is not None:
+            seen.add(key)
+
+        if reference is not None:
+            column, parent = reference
+            parent_key = row.get(column)
+            parent_id = keys[parent].get(str(parent_key)) if parent_key is not None else None
+            if parent_id is None:
+                report.fail(
+                    table, line, key, "INVALID_REFERENCE",
+                    f"{column} {parent_key!r} does not match a {parent[:-1]} imported with this file",
+                )
+                continue
+            row[column] = parent_id
+
+        try:
+            item = schema.load(row, unknown=EXCLUDE)
+        except ValidationError as err:
+            report.fail(table, line, key, "VALIDATION_ERROR", "Input validation failed", err.messages)
+            continue
+
+        chunk.append((line, key, item))
+        if len(chunk) >= chunk_size:
+            _insert_chunk(table, insert, user_id, chunk, own_keys, report)
+            chunk = []
+            if progress:
+                progress(table, report.tables[table])
+    if chunk:
+        _insert_chunk(table, insert, user_id, chunk, own_keys, report)
+    if progress:
+        progress(table, report.tables[table])
+
+
+def import_tables(user_id, sources, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Import rows for one user, parents first, in chunked transactions.
+
+    Args:
+        user_id: The account the rows are created in.
+        sources: {table: iterable of (line, row)} — see read_rows().
+        chunk_size: Rows per INSERT and commit.
+        progress: Optional callback(table, counts) run after every chunk.
+
+    Returns:
+        {"tables": {table: {rows, imported, failed}}, "errors": [...],
+        "errors_truncated": bool}
+    """
+    unknown = sorted(set(sources) - set(TABLE_NAMES))
+    if unknown:
+        raise _invalid_import(
+            "Unknown import tables", details={"unknown": unknown, "allowed": list(TABLE_NAMES)}
+        )
+
+    report = _Report()
+    keys = {name: {} for name in TABLE_NAMES}
+    for table, schema, reference, insert in IMPORT_TABLES:
+        if table in sources:
+            _import_table(
+                user_id, table, schema, reference, insert, sources[table],
+                keys, report, chunk_size, progress,
+            )
+    logger.info(
+        "import_completed",
+        extra={"user_id": user_id, "tables": report.tables, "errors": report.error_count},
+    )
+    return report.to_dict()
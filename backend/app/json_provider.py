@@ -0,0 +1,105 @@
+"""JSON providers for app.json (jsonify, request.get_json).
+
+Config.JSON_PROVIDER selects one:
+    "orjson" — the orjson encoder/decoder (default; needs the package)
+    "stdlib" — Python's json module, Flask's DefaultJSONProvider
+
+Design decisions:
+- Both providers produce byte-identical output for API payloads, so the
+  choice is invisible to clients: sorted keys, compact separators
+  (indent 2 in debug), non-ASCII text as UTF-8 instead of \\u escapes,
+  and date / datetime as ISO 8601 — the format the schemas use — rather
+  than Flask's default RFC 822. tests/test_json_provider.py checks this
+  for every response schema.
+- Floats use the shortest round-trip digits in both; exponent notation
+  differs (1e-05 vs 1e-5), which only affects values below 1e-4 or above
+  1e16, and NaN / Infinity are null in orjson. API floats (search
+  scores, cache hit ratios) are finite and rounded to four places.
+- A payload orjson cannot encode (integers beyond 64 bits, keys that are
+  not strings) is retried with the stdlib encoder, so it never turns
+  into a 500. If orjson is not installed, "orjson" falls back to stdlib
+  with a warning.
+"""
+
+import json
+import logging
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional at runtime; listed in requirements.txt
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _iso_default(obj):
+    """Flask's extra types, except dates are ISO 8601 like the schemas'."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Python's json module, configured to match OrjsonProvider byte for byte."""
+
+    default = staticmethod(_iso_default)
+    ensure_ascii = False
+    sort_keys = True
+
+
+class OrjsonProvider(StdlibJSONProvider):
+    """orjson for dumps/loads; stdlib for options orjson does not support."""
+
+    # Without OPT_NON_STR_KEYS, so int keys take the stdlib path: orjson
+    # would sort them as strings ("10" < "2"), json numerically
+    _options = orjson.OPT_SORT_KEYS if orjson else 0
+
+    def _dumpb(self, obj, indent=None):
+        try:
+            return orjson.dumps(
+                obj, default=self.default,
+                option=self._options | (orjson.OPT_INDENT_2 if indent else 0),
+            )
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError
+            separators = None if indent else (",", ":")
+            return super().dumps(obj, indent=indent, separators=separators).encode()
+
+    def dumps(self, obj, **kwargs):
+        # orjson only writes compact output or two-space indents
+        if kwargs == {"separators": (",", ":")}:
+            return self._dumpb(obj).decode()
+        if kwargs == {"indent": 2}:
+            return self._dumpb(obj, indent=2).decode()
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decide, e.g. integers orjson cannot hold
+            return json.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Like the stdlib provider's, without a bytes → str → bytes round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if (self.compact is None and self._app.debug) or self.compact is False else None
+        return self._app.response_class(self._dumpb(obj, indent) + b"\n", mimetype=self.mimetype)
+
+
+PROVIDERS = {"orjson": OrjsonProvider, "stdlib": StdlibJSONProvider}
+
+
+def init_json_provider(app):
+    """Install the provider named by JSON_PROVIDER as app.json."""
+    name = app.config.get("JSON_PROVIDER", "orjson")
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown JSON_PROVIDER '{name}'")
+    if name == "orjson" and orjson is None:
+        logger.warning("orjson is not installed; using the stdlib JSON provider")
+        name = "stdlib"
+    app.json = PROVIDERS[name](app)
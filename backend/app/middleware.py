@@ -4,35 +4,266 @@ Every request gets:
 - A unique request ID (X-Request-ID header) for tracing
 - Duration timing for performance monitoring
 - Structured log entry on completion
+- X-Cache: HIT|MISS when the response cache was consulted
+- SQL query count and total DB time (X-Query-Count and Server-Timing
+  headers, query_count / db_time_ms in the request log)
+- Response compression negotiated from Accept-Encoding (see below), with
+  the codec, sizes, ratio and CPU time in the request log
 
 This provides observability without cluttering route logic.
+
+Compression:
+- Text-like bodies (JSON, NDJSON, CSV, text/*) of at least
+  COMPRESSION_MIN_SIZE bytes are compressed with the codec the client
+  rates highest; ties go to the order of COMPRESSION_LEVELS (zstd, br,
+  gzip). zstd and br need the optional zstandard / brotli packages and
+  are skipped when those are not installed; gzip is always available.
+  COMPRESSION_LEVELS = {} turns compression off.
+- Streamed responses are compressed chunk by chunk and flushed after
+  each chunk, so bytes still leave as they are produced. Their sizes are
+  only known at the end, so they are logged as "response_compressed"
+  when the stream finishes.
+- Already-compressed types (e.g. the export zip) are left alone, and
+  Vary: Accept-Encoding is set on every compressible response.
 """
 
 import uuid
 import time
 import logging
-from flask import g, request
+import zlib
+from flask import g, request, has_request_context, current_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
+COMPRESSIBLE_TYPES = {"application/json", "application/x-ndjson", "application/javascript"}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_times")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    if has_request_context() and "query_count" in g:
+        g.query_count += 1
+        g.db_time += elapsed
+
+
+def _register_query_hooks():
+    """Time every statement on every engine (registered once per process)."""
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
+
+
+class _GzipStream:
+    def __init__(self, level):
+        # wbits=31: deflate inside a gzip container
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class _ZstdStream:
+    def __init__(self, level):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def flush(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+CODECS = {
+    "zstd": _ZstdStream if zstandard else None,
+    "br": _BrotliStream if brotli else None,
+    "gzip": _GzipStream,
+}
+
+
+def negotiate_encoding(accept_encodings, levels):
+    """Pick the codec the client rates highest among the configured ones.
+
+    Args:
+        accept_encodings: The request's parsed Accept-Encoding header.
+        levels: COMPRESSION_LEVELS — codec name → level, in preference order.
+
+    Returns:
+        A codec name, or None to send the body as is.
+    """
+    best, best_quality = None, 0
+    for name in levels:
+        quality = accept_encodings.quality(name)
+        if CODECS.get(name) is not None and quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def _compressible(response):
+    return (
+        200 <= response.status_code < 300
+        and response.status_code != 204
+        and "Content-Encoding" not in response.headers
+        and not response.direct_passthrough
+        and (response.mimetype in COMPRESSIBLE_TYPES or response.mimetype.startswith("text/"))
+    )
+
+
+def _compress_stream(response, encoding, stream):
+    """Replace a streamed body with its compressed form, chunk by chunk."""
+    original = response.response
+    chunks = response.iter_encoded()
+    request_id = g.request_id
+
+    def generate():
+        size_in = size_out = 0
+        cpu = 0.0
+        try:
+            for chunk in chunks:
+                start = time.thread_time()
+                out = stream.compress(chunk) + stream.flush()
+                cpu += time.thread_time() - start
+                size_in += len(chunk)
+                size_out += len(out)
+                if out:
+                    yield out
+            start = time.thread_time()
+            out = stream.finish()
+            cpu += time.thread_time() - start
+            size_out += len(out)
+            yield out
+        finally:
+            if hasattr(original, "close"):
+                original.close()
+            logger.info("response_compressed", extra={
+                "request_id": request_id,
+                **_compression_stats(encoding, size_in, size_out, cpu),
+            })
+
+    response.response = generate()
+    response.headers.pop("Content-Length", None)
+
+
+def _compression_stats(encoding, size_in, size_out, cpu):
+    return {
+        "compression": encoding,
+        "bytes_in": size_in,
+        "bytes_out": size_out,
+        "compression_ratio": round(size_in / size_out, 2) if size_out else None,
+        "compress_cpu_ms": round(cpu * 1000, 2),
+    }
+
+
+def compress_response(response):
+    """Compress the response body in place if the client accepts it.
+
+    Returns:
+        Stats for the request log, or None if the body was left as is.
+    """
+    levels = current_app.config["COMPRESSION_LEVELS"]
+    if not levels or not _compressible(response):
+        return None
+    response.vary.add("Accept-Encoding")
+    encoding = negotiate_encoding(request.accept_encodings, levels)
+    if encoding is None:
+        return None
+    stream = CODECS[encoding](levels[encoding])
+
+    if response.is_streamed:
+        _compress_stream(response, encoding, stream)
+        response.headers["Content-Encoding"] = encoding
+        return {"compression": encoding}
+
+    data = response.get_data()
+    if len(data) < current_app.config["COMPRESSION_MIN_SIZE"]:
+        return None
+    start = time.thread_time()
+    body = stream.compress(data) + stream.finish()
+    cpu = time.thread_time() - start
+    if len(body) >= len(data):
+        return None
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    return _compression_stats(encoding, len(data), len(body), cpu)
+
 
 def register_middleware(app):
     """Register before/after request hooks."""
+    _register_query_hooks()
 
     @app.before_request
     def before_request():
         """Attach request ID and start timer for every request."""
         g.request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
         g.start_time = time.time()
+        g.query_count = 0
+        g.db_time = 0.0
 
     @app.after_request
     def after_request(response):
-        """Log request details and attach request ID to response."""
+        """Compress, log request details and attach request ID to response."""
+        compression = compress_response(response) or {}
         duration_ms = round((time.time() - g.start_time) * 1000, 2)
+        db_time_ms = round(g.db_time * 1000, 2)
 
         # Attach request ID to response for traceability
         response.headers["X-Request-ID"] = g.request_id
 
+        response.headers["X-Query-Count"] = str(g.query_count)
+        response.headers["Server-Timing"] = (
+            f'db;dur={db_time_ms};desc="{g.query_count} queries", total;dur={duration_ms}'
+        )
+        if "compress_cpu_ms" in compression:
+            response.headers["Server-Timing"] += (
+                f', compress;dur={compression["compress_cpu_ms"]};desc="{compression["compression"]}"'
+            )
+
+        cache_status = g.get("cache_status")
+        if cache_status:
+            response.headers["X-Cache"] = cache_status.upper()
+
         # Structured request log
         logger.info(
             "request_completed",
@@ -42,6 +273,10 @@ def register_middleware(app):
                 "path": request.path,
                 "status": response.status_code,
                 "duration_ms": duration_ms,
+                "query_count": g.query_count,
+                "db_time_ms": db_time_ms,
+                "cache": cache_status,
+                **compression,
             },
         )
 
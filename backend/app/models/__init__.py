@@ -5,10 +5,16 @@ from app.models.client import Client
 from app.models.project import Project, ProjectStatus
 from app.models.deliverable import Deliverable, DeliverableStatus
 from app.models.agent_run import AgentRun, StepRun
+from app.models.user_stats import UserStats
+from app.models.data_version import UserDataVersion
+from app.models.primary_pin import PrimaryPin
+from app.models import ownership  # noqa: F401 — registers owner_id sync hooks
+from app.models import project_counters  # noqa: F401 — registers counter hooks
 
 __all__ = [
     "User", "Client",
     "Project", "ProjectStatus",
     "Deliverable", "DeliverableStatus",
     "AgentRun", "StepRun",
+    "UserStats", "UserDataVersion", "PrimaryPin",
 ]
@@ -41,7 +41,8 @@ class AgentRun(db.Model):
     # Relationships
     steps = db.relationship(
         "StepRun", backref="agent_run", lazy="dynamic",
-        cascade="all, delete-orphan", order_by="StepRun.step_number"
+        cascade="all, delete-orphan", passive_deletes=True,
+        order_by="StepRun.step_number"
     )
 
     def mark_completed(self):
@@ -66,7 +67,7 @@ class StepRun(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     agent_run_id = db.Column(
-        db.Integer, db.ForeignKey("agent_runs.id"), nullable=False, index=True
+        db.Integer, db.ForeignKey("agent_runs.id", ondelete="CASCADE"), nullable=False, index=True
     )
     step_number = db.Column(db.Integer, nullable=False)
     action = db.Column(db.String(80), nullable=False)  # e.g. "call_gemini"
@@ -0,0 +1,271 @@
+"""Set-based writes that keep derived data in step.
+
+The unit of work maintains owner_id, project counters, user_stats, cache
+versions and replica stickiness through session hooks (ownership.py,
+project_counters.py, user_stats.py, app/cache.py, app/replica.py). A
+set-based statement bypasses those hooks, so every function here does the
+same bookkeeping explicitly, inside the caller's transaction:
+
+    insert_clients(user_id, items)       → one batched INSERT of clients
+    insert_projects(owner_id, items)     → one batched INSERT of projects
+    insert_deliverables(project, items)  → one batched INSERT for a project
+    insert_owned_deliverables(owner_id, items) → the same across projects
+    transition_deliverables(owner_id, ids, target) → one UPDATE for many ids
+    transition_projects(owner_id, ids, target)     → one UPDATE for many ids
+
+Callers commit (or roll back) as usual.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from sqlalchemy import inspect, insert, select, update
+from app.cache import mark_users_touched
+from app.errors import ConflictError, NotFoundError, StateTransitionError
+from app.extensions import db
+from app.replica import mark_session_wrote
+from app.models.client import Client
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.project import Project, ProjectStatus
+from app.models.project_counters import apply_counter_deltas
+from app.models.user_stats import apply_stats_deltas, deliverable_counts
+
+
+def _record_bulk_write(session, owner_ids):
+    mark_users_touched(session, owner_ids)
+    mark_session_wrote(session)
+
+
+def _insert_rows(model, rows):
+    """One executemany INSERT; returns the new ids in the order of `rows`."""
+    table = model.__table__
+    # RETURNING order is not guaranteed, nor are ids assigned in VALUES
+    # order on every database; SQLAlchemy matches rows to parameter sets,
+    # on SQLite through the table's _sentinel column, in the same statement
+    result = db.session.execute(
+        insert(table).returning(table.c.id, sort_by_parameter_order=True), rows
+    )
+    return result.scalars().all()
+
+
+def insert_clients(user_id, items):
+    """Insert clients for one user with a single executemany.
+
+    Args:
+        user_id: The owning user.
+        items: Dicts loaded by ClientCreateSchema.
+
+    Returns:
+        The new client ids, in the order of `items`.
+    """
+    rows = [
+        {
+            "user_id": user_id,
+            "name": item["name"],
+            "email": item["email"],
+            "company": item.get("company"),
+            "logo_url": item.get("logo_url"),
+            "notes": item.get("notes"),
+        }
+        for item in items
+    ]
+    ids = _insert_rows(Client, rows)
+    apply_stats_deltas(db.session, {user_id: {"client_count": len(rows)}})
+    _record_bulk_write(db.session, {user_id})
+    return ids
+
+
+def insert_projects(owner_id, items):
+    """Insert projects for one owner with a single executemany.
+
+    Args:
+        owner_id: The owning user; every client_id must belong to them.
+        items: Dicts loaded by ProjectCreateSchema.
+
+    Returns:
+        The new project ids, in the order of `items`.
+    """
+    rows = [
+        {
+            "client_id": item["client_id"],
+            "owner_id": owner_id,
+            "title": item["title"],
+            "description": item.get("description"),
+            "deadline": item.get("deadline"),
+            "status": ProjectStatus.ACTIVE,
+        }
+        for item in items
+    ]
+    ids = _insert_rows(Project, rows)
+    apply_stats_deltas(db.session, {owner_id: {"active_project_count": len(rows)}})
+    _record_bulk_write(db.session, {owner_id})
+    return ids
+
+
+def insert_owned_deliverables(owner_id, items):
+    """Insert deliverables across many of one owner's projects at once.
+
+    Args:
+        owner_id: The owning user; every project_id must belong to them.
+        items: Dicts with project_id, title and optional description / due_date.
+
+    Returns:
+        The new deliverable ids, in the order of `items`.
+    """
+    session = db.session
+    rows = [
+        {
+            "project_id": item["project_id"],
+            "owner_id": owner_id,
+            "title": item["title"],
+            "description": item.get("description"),
+            "due_date": item.get("due_date"),
+            "status": DeliverableStatus.PLANNED,
+        }
+        for item in items
+    ]
+    ids = _insert_rows(Deliverable, rows)
+
+    now = datetime.now(timezone.utc)
+    stats = {"pending_deliverable_count": 0, "overdue_deliverable_count": 0}
+    counters = defaultdict(int)
+    for row in rows:
+        for field, n in deliverable_counts(row["status"], row["due_date"], now.date()).items():
+            stats[field] += n
+        counters[row["project_id"]] += 1
+    apply_counter_deltas(session, {project_id: (n, 0) for project_id, n in counters.items()})
+    apply_stats_deltas(session, {owner_id: stats}, now=now)
+    _record_bulk_write(session, {owner_id})
+    return ids
+
+
+def insert_deliverables(project, items):
+    """Insert deliverables for one project with a single executemany.
+
+    Args:
+        project: The (already ownership-checked) parent Project.
+        items: Dicts with title and optional description / due_date.
+
+    Returns:
+        The new Deliverable instances, in the order of `items`.
+    """
+    ids = insert_owned_deliverables(
+        project.owner_id, [{**item, "project_id": project.id} for item in items]
+    )
+    # Ids need not ascend in input order; map them back instead of sorting
+    by_id = {d.id: d for d in Deliverable.query.filter(Deliverable.id.in_(ids))}
+    return [by_id[i] for i in ids]
+
+
+def _rejection(identifier, error):
+    """One entry of a bulk response's `rejected` list, shaped like an error envelope."""
+    return {"id": identifier, "code": error.code, "message": error.message, "details": error.details}
+
+
+def _transition(model, status_cls, owner_id, ids, target, *columns):
+    """Move the owner's `ids` to `target` with one guarded UPDATE.
+
+    The state machine is checked set-wise: one SELECT reads the current
+    statuses to explain rejections, and the UPDATE only matches rows whose
+    status is still one of the allowed sources, so a row changed by a
+    concurrent writer in between is rejected rather than forced through.
+
+    Returns:
+        (moved, rejected): the pre-update rows (id, status, *columns) that
+        transitioned, and rejection entries, both in request order.
+    """
+    session = db.session
+    table = model.__table__
+    ids = list(dict.fromkeys(ids))
+    sources = status_cls.sources(target)
+
+    current = {
+        row.id: row
+        for row in session.execute(
+            select(table.c.id, table.c.status, *columns)
+            .where(table.c.id.in_(ids), table.c.owner_id == owner_id)
+        )
+    }
+    eligible, rejected = [], {}
+    for identifier in ids:
+        row = current.get(identifier)
+        if row is None:
+            rejected[identifier] = _rejection(identifier, NotFoundError(model.__name__, identifier))
+        elif row.status not in sources:
+            rejected[identifier] = _rejection(identifier, StateTransitionError(
+                current_status=row.status,
+                target_status=target,
+                valid_transitions=sorted(status_cls.TRANSITIONS.get(row.status, set())),
+            ))
+        else:
+            eligible.append(identifier)
+
+    updated = set()
+    if eligible:
+        result = session.execute(
+            update(table)
+            .where(table.c.id.in_(eligible), table.c.owner_id == owner_id, table.c.status.in_(sources))
+            .values(status=target)
+            .returning(table.c.id)
+        )
+        updated = {row.id for row in result}
+    for identifier in eligible:
+        if identifier not in updated:
+            rejected[identifier] = _rejection(identifier, ConflictError(
+                f"{model.__name__} {identifier} changed status concurrently"
+            ))
+        else:
+            # Loaded instances re-read the new status on next access
+            instance = session.identity_map.get(inspect(model).identity_key_from_primary_key((identifier,)))
+            if instance is not None:
+                session.expire(instance, ["status", "updated_at"])
+
+    moved = [current[identifier] for identifier in eligible if identifier in updated]
+    return moved, [rejected[identifier] for identifier in ids if identifier in rejected]
+
+
+def transition_deliverables(owner_id, ids, target):
+    """Transition many of the owner's deliverables to `target` at once.
+
+    Returns:
+        (transitioned ids, rejected entries), both in request order.
+    """
+    session = db.session
+    table = Deliverable.__table__
+    moved, rejected = _transition(
+        Deliverable, DeliverableStatus, owner_id, ids, target, table.c.project_id, table.c.due_date
+    )
+    if moved:
+        now = datetime.now(timezone.utc)
+        stats = {"pending_deliverable_count": 0, "overdue_deliverable_count": 0}
+        counters = defaultdict(int)
+        for row in moved:
+            before = deliverable_counts(row.status, row.due_date, now.date())
+            after = deliverable_counts(target, row.due_date, now.date())
+            for field in stats:
+                stats[field] += after[field] - before[field]
+            counters[row.project_id] += (
+                int(target == DeliverableStatus.COMPLETED)
+                - int(row.status == DeliverableStatus.COMPLETED)
+            )
+        apply_counter_deltas(session, {pid: (0, n) for pid, n in counters.items() if n})
+        apply_stats_deltas(session, {owner_id: stats}, now=now)
+        _record_bulk_write(session, {owner_id})
+    return [row.id for row in moved], rejected
+
+
+def transition_projects(owner_id, ids, target):
+    """Transition many of the owner's projects to `target` at once.
+
+    Returns:
+        (transitioned ids, rejected entries), both in request order.
+    """
+    session = db.session
+    moved, rejected = _transition(Project, ProjectStatus, owner_id, ids, target)
+    if moved:
+        active = sum(
+            int(target == ProjectStatus.ACTIVE) - int(row.status == ProjectStatus.ACTIVE)
+            for row in moved
+        )
+        apply_stats_deltas(session, {owner_id: {"active_project_count": active}})
+        _record_bulk_write(session, {owner_id})
+    return [row.id for row in moved], rejected
@@ -9,6 +9,7 @@ Relationships:
 """
 
 from datetime import datetime, timezone
+from sqlalchemy import insert_sentinel
 from app.extensions import db
 
 
@@ -16,10 +17,17 @@ class Client(db.Model):
     """A client that the freelancer works with."""
 
     __tablename__ = "clients"
+    __table_args__ = (
+        # Backs keyset pagination: WHERE user_id = ? ORDER BY created_at, id
+        db.Index("ix_clients_user_created", "user_id", "created_at", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
+    # Lets a batched INSERT .. RETURNING match new ids to its rows on
+    # SQLite (see models/bulk_writes.py); never selected
+    _sentinel = insert_sentinel("_sentinel")
     user_id = db.Column(
-        db.Integer, db.ForeignKey("users.id"), nullable=False, index=True
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     name = db.Column(db.String(120), nullable=False)
     email = db.Column(db.String(254), nullable=False)
@@ -37,8 +45,12 @@ class Client(db.Model):
     )
 
     # Relationships
+    # The database deletes projects (and their deliverables) with the client.
+    # A plain collection (not lazy="dynamic") so ?include= can selectinload it.
     projects = db.relationship(
-        "Project", backref="client", lazy="dynamic", cascade="all, delete-orphan"
+        "Project", backref="client",
+        cascade="all, delete-orphan", passive_deletes=True,
+        order_by="[Project.created_at.desc(), Project.id.desc()]",
     )
 
     def __repr__(self):
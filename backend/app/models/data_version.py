@@ -0,0 +1,56 @@
+"""UserDataVersion model — a durable per-user change token.
+
+Every committed write to a user's clients, projects or deliverables
+replaces the user's token inside the same transaction (see app/cache.py).
+Because the token lives in the database, every web worker and every CLI
+command sees the same current value; ETags (api/etags.py) and response
+cache keys (app/cache.py) are derived from it.
+
+Design decisions:
+- Tokens are random, not counters, so a token from a recreated database
+  can never match one a client or a shared cache still holds.
+- A user who has never written has no row and reads INITIAL_VERSION;
+  reads never insert.
+- The bump is an upsert, so concurrent first writes cannot collide.
+
+Relationships:
+    User → has one → UserDataVersion
+"""
+
+import uuid
+from app.extensions import db
+from app.models.upsert import upsert
+
+INITIAL_VERSION = "initial"
+
+
+class UserDataVersion(db.Model):
+    """The current data version of one user."""
+
+    __tablename__ = "user_data_versions"
+
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    version = db.Column(db.String(32), nullable=False)
+
+    def __repr__(self):
+        return f"<UserDataVersion {self.user_id}: {self.version}>"
+
+
+def read_data_version(user_id):
+    """The user's current version: one primary-key read."""
+    version = db.session.execute(
+        db.select(UserDataVersion.version).where(UserDataVersion.user_id == user_id)
+    ).scalar()
+    return version or INITIAL_VERSION
+
+
+def bump_data_versions(session, user_ids):
+    """Give each user a new version, in the session's current transaction."""
+    table = UserDataVersion.__table__
+    for user_id in sorted(user_ids):
+        stmt = upsert(table).values(user_id=user_id, version=uuid.uuid4().hex)
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=[table.c.user_id], set_={"version": stmt.excluded.version}
+        ))
@@ -12,9 +12,12 @@ State diagram:
 
 Relationships:
     Project → has many → Deliverables
+
+owner_id duplicates project.owner_id so ownership checks hit one table.
 """
 
 from datetime import datetime, timezone
+from sqlalchemy import insert_sentinel
 from app.extensions import db
 from app.errors import StateTransitionError
 
@@ -36,16 +39,37 @@ class DeliverableStatus:
         COMPLETED: set(),  # Terminal state
     }
 
+    @classmethod
+    def sources(cls, target):
+        """Statuses that may transition to `target`."""
+        return {status for status, targets in cls.TRANSITIONS.items() if target in targets}
+
 
 class Deliverable(db.Model):
     """A deliverable within a project."""
 
     __tablename__ = "deliverables"
+    __table_args__ = (
+        # Backs keyset pagination: WHERE project_id = ? ORDER BY created_at, id
+        db.Index("ix_deliverables_project_created", "project_id", "created_at", "id"),
+        # Backs single-table ownership checks and the per-user deliverable list
+        db.Index("ix_deliverables_owner_created", "owner_id", "created_at", "id"),
+        # Backs the dashboard's upcoming milestones (owner_id = ? ORDER BY due_date)
+        # and the list's ?sort=due_date / ?due_before= / ?due_after=
+        db.Index("ix_deliverables_owner_due", "owner_id", "due_date"),
+        # Backs ?status= and the status facet counts (covering GROUP BY)
+        db.Index("ix_deliverables_owner_status", "owner_id", "status"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
+    # Lets a batched INSERT .. RETURNING match new ids to its rows on
+    # SQLite (see models/bulk_writes.py); never selected
+    _sentinel = insert_sentinel("_sentinel")
     project_id = db.Column(
-        db.Integer, db.ForeignKey("projects.id"), nullable=False, index=True
+        db.Integer, db.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
     )
+    # Denormalized copy of project.owner_id, maintained by models/ownership.py
+    owner_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
     status = db.Column(
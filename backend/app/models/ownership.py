@@ -0,0 +1,106 @@
+"""Keeps the denormalized owner_id on Project and Deliverable consistent.
+
+Ownership used to be checked by joining Deliverable → Project → Client on
+every request. Instead, Project and Deliverable carry an owner_id copied
+from their parent, so a lookup is a single-table probe:
+
+    Deliverable.query.filter_by(id=deliverable_id, owner_id=user_id)
+
+A before_flush hook is the single place that writes owner_id:
+- New Project     → owner_id = client.user_id
+- New Deliverable → owner_id = project.owner_id
+- Reassignment (client.user_id, project.client_id or deliverable.project_id
+  changes) → owner_id is re-derived and pushed down to the children.
+
+Callers never set owner_id themselves.
+"""
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import attributes
+from app.extensions import db
+from app.models.client import Client
+from app.models.project import Project
+from app.models.deliverable import Deliverable
+
+
+def _changed(obj, *attrs):
+    """True if any of attrs was modified on obj since it was loaded."""
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+def _parent(session, obj, relationship, model, fk_attr):
+    """Return the parent object obj points at, as of this flush.
+
+    An assigned relationship wins (its FK is only synced during the flush);
+    otherwise the FK is resolved through the identity map.
+    """
+    if _changed(obj, relationship):
+        parent = getattr(obj, relationship)
+        if parent is not None:
+            return parent
+    fk_value = getattr(obj, fk_attr)
+    if fk_value is None:
+        return None
+    with session.no_autoflush:
+        return session.get(model, fk_value)
+
+
+def _push_owner_to_deliverables(session, project_ids, owner_id):
+    """Re-stamp owner_id on every deliverable of the given projects."""
+    session.connection().execute(
+        Deliverable.__table__.update()
+        .where(Deliverable.__table__.c.project_id.in_(project_ids))
+        .values(owner_id=owner_id)
+    )
+    # Keep already-loaded deliverables in step without marking them dirty
+    for obj in session.identity_map.values():
+        if isinstance(obj, Deliverable) and obj.project_id in project_ids:
+            attributes.set_committed_value(obj, "owner_id", owner_id)
+
+
+@event.listens_for(db.session, "before_flush")
+def sync_owner_ids(session, flush_context, instances):
+    """Derive owner_id for new or reassigned projects and deliverables."""
+    # Projects first: new deliverables may read their project's owner_id
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, Project):
+            continue
+        is_new = obj in session.new
+        if not is_new and not _changed(obj, "client_id", "client"):
+            continue
+        client = _parent(session, obj, "client", Client, "client_id")
+        if client is None or obj.owner_id == client.user_id:
+            continue
+        obj.owner_id = client.user_id
+        if not is_new:
+            _push_owner_to_deliverables(session, [obj.id], client.user_id)
+
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Deliverable):
+            if obj not in session.new and not _changed(obj, "project_id", "project"):
+                continue
+            project = _parent(session, obj, "project", Project, "project_id")
+            if project is not None:
+                obj.owner_id = project.owner_id
+
+        elif isinstance(obj, Client) and obj not in session.new:
+            if not _changed(obj, "user_id"):
+                continue
+            projects = Project.__table__
+            project_ids = [
+                row.id for row in session.connection().execute(
+                    db.select(projects.c.id).where(projects.c.client_id == obj.id)
+                )
+            ]
+            if not project_ids:
+                continue
+            session.connection().execute(
+                projects.update()
+                .where(projects.c.id.in_(project_ids))
+                .values(owner_id=obj.user_id)
+            )
+            for loaded in session.identity_map.values():
+                if isinstance(loaded, Project) and loaded.id in project_ids:
+                    attributes.set_committed_value(loaded, "owner_id", obj.user_id)
+            _push_owner_to_deliverables(session, project_ids, obj.user_id)
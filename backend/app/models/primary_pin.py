@@ -0,0 +1,54 @@
+"""PrimaryPin model — read-your-writes when reads go to a replica.
+
+After a request commits a write, its user's reads stay on the primary
+until `until` (see app/replica.py), so the user never reads a replica
+that has not caught up with their own write.
+
+Design decisions:
+- The pin is a row in the primary database, written in the same
+  transaction as the write, so every worker sees it as soon as the write
+  is visible. A per-process or evictable cache could send the user's
+  next request, served by another worker, to a lagging replica.
+- Checking it is one primary-key read on the primary, done once per
+  request and only when a replica is configured.
+- Pinning is an upsert that moves `until` forward; expired rows are
+  simply ignored and overwritten by the user's next write.
+
+Relationships:
+    User → has one → PrimaryPin
+"""
+
+from app.extensions import db
+from app.models.upsert import upsert
+
+
+class PrimaryPin(db.Model):
+    """Until when one user's reads must use the primary."""
+
+    __tablename__ = "primary_pins"
+
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    until = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<PrimaryPin {self.user_id} until {self.until}>"
+
+
+def pin_user(session, user_id, until):
+    """Keep the user on the primary until `until`, in the session's transaction."""
+    table = PrimaryPin.__table__
+    stmt = upsert(table).values(user_id=user_id, until=until)
+    session.execute(stmt.on_conflict_do_update(
+        index_elements=[table.c.user_id], set_={"until": stmt.excluded.until}
+    ))
+
+
+def is_pinned(session, engine, user_id, now):
+    """Whether the user is pinned at `now`, read from `engine` (the primary)."""
+    table = PrimaryPin.__table__
+    return session.execute(
+        db.select(table.c.user_id).where(table.c.user_id == user_id, table.c.until > now),
+        bind_arguments={"bind": engine},
+    ).first() is not None
@@ -12,9 +12,14 @@ State diagram:
 
 Relationships:
     Client → has many → Projects → has many → Deliverables
+
+owner_id duplicates client.user_id so ownership checks hit one table.
+deliverable_total / deliverable_completed are stored counts so that
+progress_percentage never queries (see models/project_counters.py).
 """
 
 from datetime import datetime, timezone
+from sqlalchemy import insert_sentinel
 from app.extensions import db
 from app.errors import StateTransitionError
 
@@ -35,22 +40,52 @@ class ProjectStatus:
         COMPLETED: set(),  # Terminal state — no transitions allowed
     }
 
+    @classmethod
+    def sources(cls, target):
+        """Statuses that may transition to `target`."""
+        return {status for status, targets in cls.TRANSITIONS.items() if target in targets}
+
+
+def compute_progress(total, completed):
+    """Percentage of completed deliverables, rounded down. 0 when empty."""
+    if total == 0:
+        return 0
+    return int((completed / total) * 100)
+
 
 class Project(db.Model):
     """A project belonging to a client."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # Backs keyset pagination: WHERE client_id = ? ORDER BY created_at, id
+        db.Index("ix_projects_client_created", "client_id", "created_at", "id"),
+        # Backs single-table ownership checks and the per-user project list
+        db.Index("ix_projects_owner_created", "owner_id", "created_at", "id"),
+        # Backs the list's ?sort=deadline / ?due_before= / ?due_after=
+        db.Index("ix_projects_owner_deadline", "owner_id", "deadline"),
+        # Backs ?status= and the status facet counts (covering GROUP BY)
+        db.Index("ix_projects_owner_status", "owner_id", "status"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
+    # Lets a batched INSERT .. RETURNING match new ids to its rows on
+    # SQLite (see models/bulk_writes.py); never selected
+    _sentinel = insert_sentinel("_sentinel")
     client_id = db.Column(
-        db.Integer, db.ForeignKey("clients.id"), nullable=False, index=True
+        db.Integer, db.ForeignKey("clients.id", ondelete="CASCADE"), nullable=False, index=True
     )
+    # Denormalized copy of client.user_id, maintained by models/ownership.py
+    owner_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
     status = db.Column(
         db.String(20), nullable=False, default=ProjectStatus.ACTIVE
     )
     deadline = db.Column(db.Date, nullable=True)
+    # Stored deliverable counts, maintained by models/project_counters.py
+    deliverable_total = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    deliverable_completed = db.Column(db.Integer, nullable=False, default=0, server_default="0")
     created_at = db.Column(
         db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
     )
@@ -62,13 +97,19 @@ class Project(db.Model):
     )
 
     # Relationships
+    # The database deletes deliverables with the project (ON DELETE CASCADE).
+    # A plain collection (not lazy="dynamic") so ?include= can selectinload it.
     deliverables = db.relationship(
-        "Deliverable", backref="project", lazy="dynamic", cascade="all, delete-orphan"
+        "Deliverable", backref="project",
+        cascade="all, delete-orphan", passive_deletes=True,
+        order_by="[Deliverable.created_at.desc(), Deliverable.id.desc()]",
     )
 
     def __init__(self, **kwargs):
         """Set default status at creation time (not just at DB commit)."""
         kwargs.setdefault("status", ProjectStatus.ACTIVE)
+        kwargs.setdefault("deliverable_total", 0)
+        kwargs.setdefault("deliverable_completed", 0)
         super().__init__(**kwargs)
 
     def transition_status(self, new_status):
@@ -107,19 +148,14 @@ class Project(db.Model):
     @property
     def progress_percentage(self):
         """Calculate project progress based on completed deliverables.
-        
+
+        Pure arithmetic on the stored counters — no queries.
+
         Returns:
             Integer representing the percentage of completed deliverables.
             Returns 0 if there are no deliverables.
         """
-        total = self.deliverables.count()
-        if total == 0:
-            return 0
-        
-        # Using the DeliverableStatus.COMPLETED literal directly since we don't
-        # want to import Deliverable here to avoid circular imports if any.
-        completed = self.deliverables.filter_by(status="completed").count()
-        return int((completed / total) * 100)
+        return compute_progress(self.deliverable_total, self.deliverable_completed)
 
     def __repr__(self):
         return f"<Project {self.id}: {self.title} [{self.status}]>"
@@ -0,0 +1,158 @@
+"""Keeps Project.deliverable_total / deliverable_completed in sync.
+
+progress_percentage used to run two COUNT queries per project. The counts
+are now stored on the project row and adjusted by an after_flush hook,
+in the same transaction as the deliverable write:
+
+    Deliverable created            → total + 1 (completed + 1 if completed)
+    Deliverable deleted/orphaned   → total - 1 (completed - 1 if completed)
+    transition_status to/from completed → completed ± 1
+    Deliverable moved to another project → both projects adjusted
+
+Adjustments are relative SQL updates (SET total = total + 1), so two
+concurrent writers cannot lose each other's increments.
+
+`flask check-project-counters` compares the stored values with real
+counts and, with --fix, rewrites them.
+"""
+
+from collections import defaultdict
+from sqlalchemy import bindparam, event, inspect
+from app.extensions import db
+from app.models.project import Project
+from app.models.deliverable import Deliverable, DeliverableStatus
+
+
+def _old_value(obj, attr):
+    history = inspect(obj).attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, attr)
+
+
+def _collect_deltas(session):
+    """Map project_id → [total delta, completed delta] for this flush."""
+    deltas = defaultdict(lambda: [0, 0])
+    deleted_projects = {p.id for p in session.deleted if isinstance(p, Project)}
+
+    def apply(project_id, status, sign):
+        deltas[project_id][0] += sign
+        deltas[project_id][1] += sign * int(status == DeliverableStatus.COMPLETED)
+
+    for obj in session.new:
+        if isinstance(obj, Deliverable):
+            apply(obj.project_id, obj.status, +1)
+
+    for obj in session.deleted:
+        if isinstance(obj, Deliverable):
+            apply(_old_value(obj, "project_id"), _old_value(obj, "status"), -1)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Deliverable):
+            continue
+        old_project, old_status = _old_value(obj, "project_id"), _old_value(obj, "status")
+        if (old_project, old_status) == (obj.project_id, obj.status):
+            continue
+        apply(old_project, old_status, -1)
+        apply(obj.project_id, obj.status, +1)
+
+    return {
+        project_id: delta
+        for project_id, delta in deltas.items()
+        if project_id is not None
+        and project_id not in deleted_projects
+        and delta != [0, 0]
+    }
+
+
+def apply_counter_deltas(session, deltas):
+    """Add {project_id: (total delta, completed delta)} to the stored counters.
+
+    Called by the flush hook below, and directly by set-based writes that
+    bypass the unit of work (see models/bulk_writes.py). All projects are
+    updated by one executemany of a single compiled UPDATE.
+    """
+    if not deltas:
+        return
+    projects = Project.__table__
+    session.connection().execute(
+        projects.update()
+        .where(projects.c.id == bindparam("project_id"))
+        .values(
+            deliverable_total=projects.c.deliverable_total + bindparam("total_delta"),
+            deliverable_completed=projects.c.deliverable_completed + bindparam("completed_delta"),
+        ),
+        [
+            {"project_id": project_id, "total_delta": total, "completed_delta": completed}
+            for project_id, (total, completed) in deltas.items()
+        ],
+    )
+    for project_id in deltas:
+        # Loaded instances re-read the new values on next access
+        project = session.identity_map.get(inspect(Project).identity_key_from_primary_key((project_id,)))
+        if project is not None:
+            session.expire(project, ["deliverable_total", "deliverable_completed"])
+
+
+@event.listens_for(db.session, "after_flush")
+def update_project_counters(session, flush_context):
+    """Apply deliverable counter deltas to the affected project rows."""
+    apply_counter_deltas(session, _collect_deltas(session))
+
+
+def real_counts_query():
+    """SELECT project_id, total, completed from the deliverables table."""
+    return (
+        db.select(
+            Deliverable.project_id,
+            db.func.count(Deliverable.id).label("total"),
+            db.func.sum(
+                db.case((Deliverable.status == DeliverableStatus.COMPLETED, 1), else_=0)
+            ).label("completed"),
+        )
+        .group_by(Deliverable.project_id)
+    )
+
+
+def find_counter_drift():
+    """Compare stored counters with real counts.
+
+    Returns:
+        List of (project_id, (stored_total, stored_completed),
+        (real_total, real_completed)) for every project that disagrees.
+    """
+    real = real_counts_query().subquery()
+    rows = db.session.execute(
+        db.select(
+            Project.id,
+            Project.deliverable_total,
+            Project.deliverable_completed,
+            db.func.coalesce(real.c.total, 0),
+            db.func.coalesce(real.c.completed, 0),
+        )
+        .outerjoin(real, real.c.project_id == Project.id)
+        .where(db.or_(
+            Project.deliverable_total != db.func.coalesce(real.c.total, 0),
+            Project.deliverable_completed != db.func.coalesce(real.c.completed, 0),
+        ))
+        .order_by(Project.id)
+    )
+    return [(pid, (st, sc), (rt, rc)) for pid, st, sc, rt, rc in rows]
+
+
+def recompute_project_counters(project_ids=None):
+    """Rewrite stored counters from real counts (all projects by default)."""
+    deliverables = Deliverable.__table__
+    projects = Project.__table__
+    completed = deliverables.c.status == DeliverableStatus.COMPLETED
+    stmt = projects.update().values(
+        deliverable_total=db.select(db.func.count())
+        .where(deliverables.c.project_id == projects.c.id)
+        .scalar_subquery(),
+        deliverable_completed=db.select(db.func.count())
+        .where(deliverables.c.project_id == projects.c.id, completed)
+        .scalar_subquery(),
+    )
+    if project_ids is not None:
+        stmt = stmt.where(projects.c.id.in_(project_ids))
+    db.session.execute(stmt)
@@ -0,0 +1,16 @@
+"""INSERT ... ON CONFLICT for the databases the app runs on.
+
+SQLite and PostgreSQL both support upserts with the same SQLAlchemy API
+(on_conflict_do_update / on_conflict_do_nothing), but each through its
+own dialect's insert(). Upserts replace "read, then INSERT if missing",
+which races: two requests can both miss and the second INSERT fails.
+"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+
+
+def upsert(table):
+    """An insert() on the primary's dialect that supports ON CONFLICT clauses."""
+    dialect = postgresql if db.engine.dialect.name == "postgresql" else sqlite
+    return dialect.insert(table)
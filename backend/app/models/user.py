@@ -27,7 +27,8 @@ class User(db.Model):
 
     # Relationships
     clients = db.relationship(
-        "Client", backref="user", lazy="dynamic", cascade="all, delete-orphan"
+        "Client", backref="user", lazy="dynamic",
+        cascade="all, delete-orphan", passive_deletes=True
     )
 
     def set_password(self, password):
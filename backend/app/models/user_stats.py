@@ -0,0 +1,335 @@
+"""UserStats model — incrementally maintained dashboard counters.
+
+GET /api/dashboard used to aggregate over every deliverable a user owns.
+Instead, one user_stats row per user holds the counters and is kept up to
+date by an after_flush hook, inside the same transaction as the write:
+
+    Client created/deleted              → client_count ± 1
+    Project created/deleted/transitions → active_project_count ± 1
+    Deliverable created/deleted/
+      transitions/due_date changes      → pending/overdue counts ± 1
+
+Rare or bulk changes (deleting a client or project, moving rows between
+users) mark the user for a full recompute instead of a delta — one
+aggregate statement — so cascades can never leave the counters stale.
+
+Overdue is time-dependent: a deliverable becomes overdue when the date
+rolls over, with no write at all. The row records overdue_as_of, and a
+read on a later day recomputes the counters before returning them.
+
+`flask reconcile-user-stats` recomputes every row from scratch and reports
+any drift.
+
+Relationships:
+    User → has one → UserStats
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from sqlalchemy import event, inspect
+from app.extensions import db
+from app.models.upsert import upsert
+from app.models.client import Client
+from app.models.project import Project, ProjectStatus
+from app.models.deliverable import Deliverable, DeliverableStatus
+
+PENDING_STATUSES = (DeliverableStatus.PLANNED, DeliverableStatus.IN_PROGRESS)
+
+COUNTER_FIELDS = (
+    "client_count",
+    "active_project_count",
+    "pending_deliverable_count",
+    "overdue_deliverable_count",
+)
+
+
+class UserStats(db.Model):
+    """Precomputed dashboard counters for one user."""
+
+    __tablename__ = "user_stats"
+
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    client_count = db.Column(db.Integer, nullable=False, default=0)
+    active_project_count = db.Column(db.Integer, nullable=False, default=0)
+    pending_deliverable_count = db.Column(db.Integer, nullable=False, default=0)
+    overdue_deliverable_count = db.Column(db.Integer, nullable=False, default=0)
+    # The UTC date overdue_deliverable_count was computed for
+    overdue_as_of = db.Column(db.Date, nullable=False)
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def to_dict(self):
+        """The counters in the shape the dashboard returns."""
+        return {field: getattr(self, field) for field in COUNTER_FIELDS}
+
+    @classmethod
+    def for_user(cls, user_id, now=None):
+        """Return the user's stats row, creating or refreshing it if needed.
+
+        The common case is a primary-key read. The row is recomputed when it
+        does not exist yet or when the UTC date has rolled over since the
+        overdue counter was last computed. The recomputed row is written in
+        the session's transaction; the caller commits it.
+        """
+        now = now or datetime.now(timezone.utc)
+        stats = db.session.get(cls, user_id)
+        if stats is None or stats.overdue_as_of != now.date():
+            stats = recompute_user_stats(user_id, now)
+        return stats
+
+    @classmethod
+    def counts_for(cls, user_id, now=None):
+        """The user's counters as a dict (see to_dict), read without the ORM.
+
+        One Core select of the row's columns; a missing or stale row goes
+        through for_user() to be recomputed.
+        """
+        now = now or datetime.now(timezone.utc)
+        table = cls.__table__
+        row = db.session.execute(
+            db.select(*(table.c[field] for field in COUNTER_FIELDS), table.c.overdue_as_of)
+            .where(table.c.user_id == user_id)
+        ).first()
+        if row is None or row.overdue_as_of != now.date():
+            return cls.for_user(user_id, now).to_dict()
+        return {field: getattr(row, field) for field in COUNTER_FIELDS}
+
+    def __repr__(self):
+        return f"<UserStats {self.user_id}>"
+
+
+def _count_where(condition):
+    """SUM(CASE WHEN condition THEN 1 ELSE 0 END), 0 when there are no rows."""
+    return db.func.coalesce(db.func.sum(db.case((condition, 1), else_=0)), 0)
+
+
+def compute_user_counts(user_id, now):
+    """Compute every dashboard counter from scratch in a single SQL statement.
+
+    Clients and active projects are scalar subqueries; both deliverable
+    counters come from one pass over the user's deliverables using
+    conditional aggregation. It reads the primary even in a GET: the
+    counts are written back, and a lagging replica would make them stale.
+    """
+    deliverable_counts = (
+        db.select(
+            _count_where(Deliverable.status.in_(PENDING_STATUSES)).label("pending"),
+            _count_where(db.and_(
+                Deliverable.due_date < now,
+                Deliverable.status != DeliverableStatus.COMPLETED,
+            )).label("overdue"),
+        )
+        .where(Deliverable.owner_id == user_id)
+        .subquery()
+    )
+
+    row = db.session.execute(
+        db.select(
+            db.select(db.func.count(Client.id))
+            .where(Client.user_id == user_id)
+            .scalar_subquery()
+            .label("client_count"),
+            db.select(db.func.count(Project.id))
+            .where(Project.owner_id == user_id, Project.status == ProjectStatus.ACTIVE)
+            .scalar_subquery()
+            .label("active_project_count"),
+            deliverable_counts.c.pending,
+            deliverable_counts.c.overdue,
+        ),
+        bind_arguments={"bind": db.engine},
+    ).one()
+
+    return {
+        "client_count": row.client_count,
+        "active_project_count": row.active_project_count,
+        "pending_deliverable_count": row.pending,
+        "overdue_deliverable_count": row.overdue,
+    }
+
+
+def recompute_user_stats(user_id, now=None):
+    """Overwrite (or create) a user's stats row from real counts.
+
+    The row is written with one upsert, not "get, then add if missing":
+    two requests that both find no row (say, a user's first dashboard
+    loads, in parallel) would otherwise both INSERT and one would fail
+    on the primary key.
+
+    Returns:
+        The UserStats instance, refreshed from the row; not committed.
+    """
+    now = now or datetime.now(timezone.utc)
+    values = {**compute_user_counts(user_id, now), "overdue_as_of": now.date(), "updated_at": now}
+    db.session.execute(
+        upsert(UserStats.__table__)
+        .values(user_id=user_id, **values)
+        .on_conflict_do_update(index_elements=["user_id"], set_=values)
+    )
+    # From the primary, where the upsert ran; a replica may not have the row
+    return db.session.get(
+        UserStats, user_id, populate_existing=True, bind_arguments={"bind": db.engine}
+    )
+
+
+# ── Incremental maintenance ──────────────────────────────────
+
+def _is_overdue(status, due_date, today):
+    # Matches compute_user_counts: a date compares below "now" once its day starts
+    return (
+        due_date is not None
+        and due_date <= today
+        and status != DeliverableStatus.COMPLETED
+    )
+
+
+def _old_value(obj, attr):
+    """The value attr had when obj was loaded (or its current value if unchanged)."""
+    history = inspect(obj).attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(obj, attr)
+
+
+def deliverable_counts(status, due_date, today):
+    """How one deliverable contributes to the pending/overdue counters."""
+    return {
+        "pending_deliverable_count": int(status in PENDING_STATUSES),
+        "overdue_deliverable_count": int(_is_overdue(status, due_date, today)),
+    }
+
+
+def _collect_changes(session, today):
+    """Turn the pending flush into per-user counter deltas.
+
+    Returns:
+        Tuple of (deltas, recompute) where deltas maps user_id → field → ±n
+        and recompute is the set of user_ids that need a full recompute.
+    """
+    deltas = defaultdict(lambda: defaultdict(int))
+    recompute = set()
+
+    def apply(user_id, counts, sign):
+        for field, value in counts.items():
+            deltas[user_id][field] += sign * value
+
+    for obj in session.new:
+        if isinstance(obj, Client):
+            apply(obj.user_id, {"client_count": 1}, +1)
+        elif isinstance(obj, Project):
+            apply(obj.owner_id, {"active_project_count": int(obj.status == ProjectStatus.ACTIVE)}, +1)
+        elif isinstance(obj, Deliverable):
+            apply(obj.owner_id, deliverable_counts(obj.status, obj.due_date, today), +1)
+
+    for obj in session.deleted:
+        if isinstance(obj, Client):
+            recompute.add(obj.user_id)
+        elif isinstance(obj, Project):
+            recompute.add(obj.owner_id)
+        elif isinstance(obj, Deliverable):
+            apply(obj.owner_id, deliverable_counts(obj.status, obj.due_date, today), -1)
+
+    for obj in session.dirty:
+        if isinstance(obj, Client):
+            if _old_value(obj, "user_id") != obj.user_id:
+                recompute.update({_old_value(obj, "user_id"), obj.user_id})
+        elif isinstance(obj, Project):
+            old_owner = _old_value(obj, "owner_id")
+            if old_owner != obj.owner_id:
+                recompute.update({old_owner, obj.owner_id})
+                continue
+            old_status = _old_value(obj, "status")
+            apply(obj.owner_id, {"active_project_count": int(old_status == ProjectStatus.ACTIVE)}, -1)
+            apply(obj.owner_id, {"active_project_count": int(obj.status == ProjectStatus.ACTIVE)}, +1)
+        elif isinstance(obj, Deliverable):
+            old_owner = _old_value(obj, "owner_id")
+            if old_owner != obj.owner_id:
+                recompute.update({old_owner, obj.owner_id})
+                continue
+            old = deliverable_counts(_old_value(obj, "status"), _old_value(obj, "due_date"), today)
+            apply(obj.owner_id, old, -1)
+            apply(obj.owner_id, deliverable_counts(obj.status, obj.due_date, today), +1)
+
+    return deltas, recompute
+
+
+def apply_stats_deltas(session, deltas, recompute=(), now=None):
+    """Add {user_id: {field: ±n}} to users' stats rows.
+
+    Users in `recompute`, and users without a row yet, are queued for a
+    full recompute at commit instead. Called by the flush hook below, and
+    directly by set-based writes that bypass the unit of work (see
+    models/bulk_writes.py).
+    """
+    now = now or datetime.now(timezone.utc)
+    recompute = set(recompute)
+    recompute.discard(None)
+
+    stats = UserStats.__table__
+    connection = session.connection()
+    for user_id, fields in deltas.items():
+        if user_id is None or user_id in recompute:
+            continue
+        changes = {field: n for field, n in fields.items() if n}
+        if not changes:
+            continue
+
+        values = {
+            field: getattr(stats.c, field) + n
+            for field, n in changes.items()
+            if field != "overdue_deliverable_count"
+        }
+        if "overdue_deliverable_count" in changes:
+            # A stale overdue counter is recomputed on read; don't patch it
+            values["overdue_deliverable_count"] = db.case(
+                (stats.c.overdue_as_of == now.date(),
+                 stats.c.overdue_deliverable_count + changes["overdue_deliverable_count"]),
+                else_=stats.c.overdue_deliverable_count,
+            )
+        if values:
+            updated = connection.execute(
+                stats.update().where(stats.c.user_id == user_id).values(**values)
+            )
+            if updated.rowcount == 0:
+                recompute.add(user_id)
+
+    if recompute:
+        _pending_recompute(session).update(recompute)
+
+
+@event.listens_for(db.session, "after_flush")
+def update_user_stats(session, flush_context):
+    """Apply counter deltas for everything this flush wrote."""
+    now = datetime.now(timezone.utc)
+    deltas, recompute = _collect_changes(session, now.date())
+    apply_stats_deltas(session, deltas, recompute, now)
+
+
+def _pending_recompute(session):
+    return session.info.setdefault("user_stats_recompute", set())
+
+
+@event.listens_for(db.session, "before_commit")
+def flush_pending_recomputes(session):
+    """Recompute users whose counters could not be patched incrementally."""
+    # commit() fires this hook before its own flush; flush now so the
+    # deltas (and the users needing a recompute) are known
+    session.flush()
+    user_ids = session.info.pop("user_stats_recompute", None)
+    if not user_ids:
+        return
+    now = datetime.now(timezone.utc)
+    for user_id in user_ids:
+        recompute_user_stats(user_id, now)
+
+
+@event.listens_for(db.session, "after_rollback")
+def discard_pending_recomputes(session):
+    session.info.pop("user_stats_recompute", None)
@@ -0,0 +1,161 @@
+"""Read-replica routing.
+
+When READ_REPLICA_URL is set, a second bind ("replica") is configured and
+safe-method requests (GET/HEAD/OPTIONS) read from it automatically:
+
+- RoutingSession.get_bind sends a statement to the replica only when the
+  request is safe, the statement is a read, and the session has not
+  written anything in the current transaction. Flushes, DML and the
+  before/after-flush hooks always run on the primary.
+- Read-your-writes: a request that writes pins its user to the primary
+  for READ_REPLICA_STICKY_SECONDS. The pin is a row in the primary
+  database (models/primary_pin.py), written in the write's own
+  transaction, so every worker honours it; the check reads the primary.
+  ETags are derived from a version read through the same routing, so a
+  pinned user's ETags and bodies both come from the primary.
+- A read that decides a write in a GET passes the primary explicitly
+  (bind_arguments={"bind": db.engine}), e.g. UserStats recomputing its
+  counters.
+
+Locally (and in tests) the replica can be a SQLite file that is copied
+from the primary with SQLite's online backup API: sync_sqlite_replica()
+copies once, `flask sync-replica` keeps copying on an interval.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql.dml import UpdateBase
+
+REPLICA_BIND = "replica"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def is_pinned_to_primary(user_id):
+    """Whether the user wrote within the stickiness window (read on the primary)."""
+    from app.models.primary_pin import is_pinned
+
+    db = current_app.extensions["sqlalchemy"]
+    return is_pinned(db.session, db.engine, user_id, datetime.now(timezone.utc))
+
+
+def _request_may_use_replica():
+    if not has_request_context() or request.method not in SAFE_METHODS:
+        return False
+    if g.get("request_wrote"):
+        return False
+    # The user is known once the route has authenticated; memoize per user
+    user_id = g.get("current_user_id")
+    cached = g.get("replica_route")
+    if cached is None or cached[0] != user_id:
+        allowed = user_id is None or not is_pinned_to_primary(user_id)
+        g.replica_route = cached = (user_id, allowed)
+    return cached[1]
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that sends safe-request reads to the replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        replica = self._db.engines.get(REPLICA_BIND) if bind is None else None
+        if (
+            replica is None
+            or engine is not self._db.engines.get(None)
+            or self._flushing
+            or self.info.get("replica_wrote")
+            or isinstance(clause, UpdateBase)
+            or not _request_may_use_replica()
+        ):
+            return engine
+        return replica
+
+
+# ── Session events ───────────────────────────────────────────
+
+def mark_session_wrote(session):
+    """Keep the rest of the transaction (and the writer) on the primary."""
+    session.info["replica_wrote"] = True
+
+
+def _record_write(session, flush_context):
+    if session.new or session.dirty or session.deleted:
+        mark_session_wrote(session)
+
+
+def _pin_writer(session):
+    """Pin the writing user to the primary, in the write's transaction."""
+    if not has_request_context() or not current_app.config.get("READ_REPLICA_URL"):
+        return
+    window = current_app.config["READ_REPLICA_STICKY_SECONDS"]
+    user_id = g.get("current_user_id")
+    if window <= 0 or user_id is None:
+        return
+    # commit() flushes after this hook; flush now to learn whether it writes
+    session.flush()
+    if session.info.get("replica_wrote"):
+        from app.models.primary_pin import pin_user
+
+        pin_user(session, user_id, datetime.now(timezone.utc) + timedelta(seconds=window))
+
+
+def _read_own_writes(session):
+    if session.info.pop("replica_wrote", False) and has_request_context():
+        # The rest of this request reads its own writes too
+        g.request_wrote = True
+
+
+def _forget_write(session):
+    session.info.pop("replica_wrote", None)
+
+
+def _reset_request_routing():
+    # g can outlive a request (e.g. an app context pushed around the test
+    # client), so routing state is cleared at the start of each request
+    for name in ("request_wrote", "replica_route", "current_user_id"):
+        g.pop(name, None)
+
+
+def init_routing(app, session):
+    """Reset routing per request; track writes and pin writers to the primary."""
+    app.before_request(_reset_request_routing)
+    for name, listener in (
+        ("after_flush", _record_write),
+        ("before_commit", _pin_writer),
+        ("after_commit", _read_own_writes),
+        ("after_rollback", _forget_write),
+    ):
+        if not event.contains(session, name, listener):
+            event.listen(session, name, listener)
+
+
+# ── Local SQLite replica ─────────────────────────────────────
+
+def sqlite_path(uri):
+    """Filesystem path of a sqlite:/// URL (plain or file: URI form)."""
+    path = uri.split(":///", 1)[1]
+    if path.startswith("file:"):
+        path = urlparse(path).path
+    return path.split("?", 1)[0]
+
+
+def sync_sqlite_replica(db):
+    """Copy the primary database into the replica file with the backup API.
+
+    Must run inside an app context. Readers on the replica keep their
+    connections; SQLite locks the file for the duration of the copy.
+    """
+    target = sqlite_path(current_app.config["READ_REPLICA_URL"])
+    source = db.engines[None].raw_connection()
+    try:
+        destination = sqlite3.connect(target)
+        try:
+            source.driver_connection.backup(destination)
+        finally:
+            destination.close()
+    finally:
+        source.close()
+
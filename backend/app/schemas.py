@@ -1,4 +1,4 @@
-"""Marshmallow schemas for input validation and serialization.
+"""Marshmallow schemas for input validation and response shapes.
 
 Design decisions:
 - Every API input passes through a schema BEFORE touching the database.
@@ -7,6 +7,9 @@ Design decisions:
 - Sensitive fields like password_hash are load_only (accepted on input)
   but never returned in API responses.
 - Each schema validates: required fields, string lengths, email format.
+- Response schemas define what each resource returns, but responses are
+  dumped by serializers compiled from them (app/serializers.py), so
+  marshmallow only runs on input.
 
 This is the "Interface Safety" layer — guards against invalid data
 at the API boundary so the database never sees bad input.
@@ -19,6 +22,20 @@ from app.models.client import Client
 from app.models.project import Project, ProjectStatus
 from app.models.deliverable import Deliverable, DeliverableStatus
 from app.models.agent_run import AgentRun, StepRun
+from app.export import ENCODINGS
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_BATCH_SIZE = 500
+
+
+class CommaSeparated(fields.List):
+    """A list sent as one comma-separated query-string value (?status=a,b)."""
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(",") if item.strip()]
+        return super()._deserialize(value, attr, data, **kwargs)
 
 
 # ── User Schemas ──────────────────────────────────────────────
@@ -130,12 +147,54 @@ class ProjectStatusSchema(ma.Schema):
     )
 
 
+class ProjectBulkStatusSchema(ma.Schema):
+    """Schema for a bulk status transition — many ids, one target status."""
+
+    ids = fields.List(
+        fields.Integer(strict=True),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_BATCH_SIZE),
+    )
+    status = fields.String(
+        required=True,
+        validate=validate.OneOf(sorted(ProjectStatus.ALL)),
+    )
+
+
+class ProjectListSchema(ma.Schema):
+    """Schema for GET /api/projects filters — every option maps to an indexed column."""
+
+    status = CommaSeparated(fields.String(validate=validate.OneOf(sorted(ProjectStatus.ALL))))
+    client_id = fields.Integer()
+    due_before = fields.Date()  # deadline < date
+    due_after = fields.Date()  # deadline > date
+    sort = fields.String(
+        load_default="-created_at",
+        validate=validate.OneOf(["created_at", "-created_at", "deadline", "-deadline"]),
+    )
+    facets = CommaSeparated(fields.String(validate=validate.OneOf(["status"])), load_default=[])
+
+
 class ProjectResponseSchema(ma.SQLAlchemyAutoSchema):
-    """Schema for returning project data."""
+    """Schema for returning project data.
+
+    Progress and deliverable counts come from stored counters on the
+    project row, so dumping a list of projects issues no extra queries.
+    """
+
+    progress_percentage = fields.Integer(dump_only=True)
+    deliverable_count = fields.Integer(attribute="deliverable_total", dump_only=True)
+    completed_deliverable_count = fields.Integer(
+        attribute="deliverable_completed", dump_only=True
+    )
+
+    # Columns read by computed fields, for ?fields= (see api/fieldsets.py)
+    FIELD_COLUMNS = {"progress_percentage": ("deliverable_total", "deliverable_completed")}
 
     class Meta:
         model = Project
         include_fk = True
+        exclude = ("owner_id", "deliverable_total", "deliverable_completed")
         dump_only = ("id", "status", "progress_percentage", "created_at", "updated_at")
 
 
@@ -170,15 +229,83 @@ class DeliverableStatusSchema(ma.Schema):
     )
 
 
+class DeliverableBulkStatusSchema(ma.Schema):
+    """Schema for a bulk status transition — many ids, one target status."""
+
+    ids = fields.List(
+        fields.Integer(strict=True),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_BATCH_SIZE),
+    )
+    status = fields.String(
+        required=True,
+        validate=validate.OneOf(sorted(DeliverableStatus.ALL)),
+    )
+
+
+class DeliverableListSchema(ma.Schema):
+    """Schema for GET /api/deliverables filters — every option maps to an indexed column."""
+
+    status = CommaSeparated(fields.String(validate=validate.OneOf(sorted(DeliverableStatus.ALL))))
+    project_id = fields.Integer()
+    client_id = fields.Integer()
+    due_before = fields.Date()  # due_date < date
+    due_after = fields.Date()  # due_date > date
+    sort = fields.String(
+        load_default="-created_at",
+        validate=validate.OneOf(["created_at", "-created_at", "due_date", "-due_date"]),
+    )
+    facets = CommaSeparated(fields.String(validate=validate.OneOf(["status"])), load_default=[])
+
+
 class DeliverableResponseSchema(ma.SQLAlchemyAutoSchema):
     """Schema for returning deliverable data."""
 
     class Meta:
         model = Deliverable
         include_fk = True
+        exclude = ("owner_id",)
         dump_only = ("id", "status", "created_at", "updated_at")
 
 
+# ── Pagination Schemas ───────────────────────────────────────
+
+class PaginationSchema(ma.Schema):
+    """Schema for list query params — page size and opaque cursor."""
+
+    limit = fields.Integer(
+        load_default=DEFAULT_PAGE_SIZE,
+        validate=validate.Range(min=1, max=MAX_PAGE_SIZE),
+    )
+    cursor = fields.String(load_default=None)
+
+
+# ── Search Schemas ───────────────────────────────────────────
+
+class SearchSchema(ma.Schema):
+    """Schema for search query params — free text and result count."""
+
+    q = fields.String(
+        required=True,
+        validate=validate.Length(min=1, max=200),
+    )
+    limit = fields.Integer(
+        load_default=20,
+        validate=validate.Range(min=1, max=MAX_PAGE_SIZE),
+    )
+
+
+# ── Export Schemas ───────────────────────────────────────────
+
+class ExportSchema(ma.Schema):
+    """Schema for export query params — file encoding inside the zip."""
+
+    format = fields.String(
+        load_default="ndjson",
+        validate=validate.OneOf(ENCODINGS),
+    )
+
+
 # ── AgentRun Schemas ─────────────────────────────────────────
 
 class AgentRunResponseSchema(ma.SQLAlchemyAutoSchema):
@@ -0,0 +1,174 @@
+"""Full-text search over clients, projects and deliverables (SQLite FTS5).
+
+Design decisions:
+- One FTS5 table, search_index, holds every searchable row:
+      clients      → title = name,  body = company + notes
+      projects     → title = title, body = description
+      deliverables → title = title, body = description
+  rowid = id * 4 + kind code, so a source row maps to exactly one index
+  row and triggers update/delete it by rowid.
+- Triggers on the source tables keep the index in sync, so ORM writes,
+  set-based writes (models/bulk_writes.py) and ON DELETE CASCADE all stay
+  indexed without Python hooks.
+- Results are scoped in the MATCH itself: the owner column holds a token
+  ("u42") that every query ANDs with, so other users' rows are never
+  scored. User input is reduced to quoted terms, so FTS5 query syntax
+  cannot be injected; a trailing * on a term keeps prefix matching.
+- Terms are stemmed (porter), so "rocket" finds "Rockets". Prefixes are
+  opt-in because a prefix term materializes its whole doclist, across
+  all users, on every query (see benchmarks/bench_search.py).
+- Ranking is BM25 with titles weighted above bodies; the owner column
+  has weight 0. Highlights are marked with control characters in SQL and
+  turned into <mark> only after the text has been HTML-escaped.
+- The DDL hangs off metadata create_all/drop_all. A database that predates
+  the index gets it, fully populated, on the next create_all;
+  `flask rebuild-search-index` repopulates it on demand.
+- FTS5 is SQLite-only; on other databases search is unavailable.
+"""
+
+import html
+import re
+from sqlalchemy import event, text
+from app.extensions import db
+
+KINDS = {"client": 1, "project": 2, "deliverable": 3}
+_KIND_BY_CODE = {code: kind for kind, code in KINDS.items()}
+
+# bm25() weights, in column order: owner, title, body
+_WEIGHTS = "0.0, 10.0, 1.0"
+_MARK_OPEN, _MARK_CLOSE = "\x02", "\x03"
+
+# (kind, table, owner column, title expression, body expression)
+_SOURCES = (
+    ("client", "clients", "user_id", "{row}.name",
+     "coalesce({row}.company, '') || char(10) || coalesce({row}.notes, '')"),
+    ("project", "projects", "owner_id", "{row}.title", "coalesce({row}.description, '')"),
+    ("deliverable", "deliverables", "owner_id", "{row}.title", "coalesce({row}.description, '')"),
+)
+
+
+def _values(kind, owner_column, title, body, row):
+    return (
+        f"{row}.id * 4 + {KINDS[kind]}, 'u' || {row}.{owner_column}, "
+        f"{title.format(row=row)}, {body.format(row=row)}"
+    )
+
+
+def _triggers():
+    for kind, table, owner_column, title, body in _SOURCES:
+        columns = ", ".join(
+            dict.fromkeys([owner_column] + re.findall(r"\{row\}\.(\w+)", f"{title} {body}"))
+        )
+        yield (
+            f"CREATE TRIGGER IF NOT EXISTS search_{table}_insert AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO search_index (rowid, owner, title, body) "
+            f"VALUES ({_values(kind, owner_column, title, body, 'new')}); END"
+        )
+        yield (
+            f"CREATE TRIGGER IF NOT EXISTS search_{table}_delete AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM search_index WHERE rowid = old.id * 4 + {KINDS[kind]}; END"
+        )
+        yield (
+            f"CREATE TRIGGER IF NOT EXISTS search_{table}_update AFTER UPDATE OF {columns} ON {table} BEGIN "
+            f"DELETE FROM search_index WHERE rowid = old.id * 4 + {KINDS[kind]}; "
+            f"INSERT INTO search_index (rowid, owner, title, body) "
+            f"VALUES ({_values(kind, owner_column, title, body, 'new')}); END"
+        )
+
+
+def _index_exists(connection):
+    return connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+    ).first() is not None
+
+
+def rebuild_search_index(connection):
+    """Repopulate search_index from the source tables.
+
+    Returns:
+        The number of indexed rows.
+    """
+    connection.exec_driver_sql("DELETE FROM search_index")
+    for kind, table, owner_column, title, body in _SOURCES:
+        connection.exec_driver_sql(
+            f"INSERT INTO search_index (rowid, owner, title, body) "
+            f"SELECT {_values(kind, owner_column, title, body, table)} FROM {table}"
+        )
+    connection.exec_driver_sql("INSERT INTO search_index (search_index) VALUES ('optimize')")
+    return connection.exec_driver_sql("SELECT count(*) FROM search_index").scalar()
+
+
+@event.listens_for(db.metadata, "after_create")
+def create_search_index(metadata, connection, **kw):
+    """Create the FTS5 table and its triggers; populate it if it is new."""
+    if connection.dialect.name != "sqlite":
+        return
+    exists = _index_exists(connection)
+    connection.exec_driver_sql(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+        "owner, title, body, tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    for trigger in _triggers():
+        connection.exec_driver_sql(trigger)
+    if not exists:
+        rebuild_search_index(connection)
+
+
+@event.listens_for(db.metadata, "before_drop")
+def drop_search_index(metadata, connection, **kw):
+    """Drop the FTS5 table with the rest of the schema."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS search_index")
+
+
+def match_expression(user_id, query):
+    """Turn free text into a safe FTS5 MATCH scoped to one user.
+
+    Returns:
+        The MATCH string, or None if the text has no searchable terms.
+    """
+    terms = re.findall(r"(\w+)(\*?)", query)
+    if not terms:
+        return None
+    phrases = [f'"{term}"{star}' for term, star in terms]
+    return f"owner:u{int(user_id)} AND {{title body}}: ({' AND '.join(phrases)})"
+
+
+def _marked(fragment):
+    return (
+        html.escape(fragment or "")
+        .replace(_MARK_OPEN, "<mark>")
+        .replace(_MARK_CLOSE, "</mark>")
+    )
+
+
+def search(user_id, query, limit):
+    """Return the user's best-matching rows, best first.
+
+    Each result is {"type", "id", "title", "snippet", "score"}; title and
+    snippet are HTML-escaped with matches wrapped in <mark>.
+    """
+    match = match_expression(user_id, query)
+    if match is None:
+        return []
+    rows = db.session.execute(
+        text(
+            "SELECT rowid, "
+            "highlight(search_index, 1, :open, :close) AS title, "
+            "snippet(search_index, 2, :open, :close, '…', 12) AS snippet, "
+            f"bm25(search_index, {_WEIGHTS}) AS score "
+            "FROM search_index WHERE search_index MATCH :match "
+            "ORDER BY score LIMIT :limit"
+        ),
+        {"open": _MARK_OPEN, "close": _MARK_CLOSE, "match": match, "limit": limit},
+    )
+    return [
+        {
+            "type": _KIND_BY_CODE[row.rowid % 4],
+            "id": row.rowid // 4,
+            "title": _marked(row.title),
+            "snippet": _marked(row.snippet),
+            "score": round(-row.score, 4),
+        }
+        for row in rows
+    ]
@@ -0,0 +1,8 @@
+"""Micro-benchmarks for ClientPilot hot paths.
+
+Run from backend/, e.g.:
+    python -m benchmarks.bench_dashboard
+
+Benchmarks are plain scripts (not part of the pytest suite) that seed a
+throwaway SQLite database and print timings.
+"""
@@ -0,0 +1,64 @@
+"""Deleting a client with 50k deliverables: ORM-loaded cascade (what
+`cascade="all, delete-orphan"` without passive_deletes did) vs the
+database's ON DELETE CASCADE.
+
+Usage:
+    python -m benchmarks.bench_cascade_delete [--deliverables 50000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from app.extensions import db
+from app.models import Client
+from benchmarks.common import make_app, seed_user
+
+
+def orm_cascade_delete(client):
+    """Load every project and deliverable, then delete them one by one."""
+    for project in client.projects:
+        for deliverable in project.deliverables:
+            db.session.delete(deliverable)
+        db.session.delete(project)
+    db.session.delete(client)
+    db.session.commit()
+
+
+def database_cascade_delete(client):
+    """One DELETE; SQLite removes the children via ON DELETE CASCADE."""
+    db.session.delete(client)
+    db.session.commit()
+
+
+def run(label, delete, n_deliverables):
+    app = make_app()
+    with app.app_context():
+        user_id = seed_user(n_deliverables, n_clients=1)
+        client = Client.query.filter_by(user_id=user_id).one()
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        delete(client)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"  {label:<28} {elapsed * 1000:10.1f} ms   peak memory {peak / 2**20:7.1f} MiB")
+        db.session.remove()
+        db.drop_all()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deliverables", type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"Deleting one client with {args.deliverables:,} deliverables")
+    orm = run("ORM-loaded cascade", orm_cascade_delete, args.deliverables)
+    database = run("ON DELETE CASCADE", database_cascade_delete, args.deliverables)
+    print(f"  speedup {orm / database:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
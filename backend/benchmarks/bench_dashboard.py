@@ -0,0 +1,78 @@
+"""Dashboard latency: legacy five-query summary vs single-pass aggregation
+vs the incrementally maintained user_stats row.
+
+Usage:
+    python -m benchmarks.bench_dashboard
+"""
+
+from datetime import datetime, timezone
+from app.extensions import db
+from app.models import Client, Project, ProjectStatus, Deliverable, DeliverableStatus, UserStats
+from app.models.user_stats import compute_user_counts
+from app.api.dashboard import upcoming_milestones
+from benchmarks.common import make_app, seed_user, report
+
+SIZES = (10_000, 100_000)
+
+
+def legacy_summary(user_id):
+    """The original get_summary body: four join-heavy counts + lazy-loaded milestones."""
+    now = datetime.now(timezone.utc)
+    Client.query.filter_by(user_id=user_id).count()
+    Project.query.join(Client).filter(
+        Client.user_id == user_id, Project.status == ProjectStatus.ACTIVE
+    ).count()
+    Deliverable.query.join(Project).join(Client).filter(
+        Client.user_id == user_id,
+        Deliverable.status.in_([DeliverableStatus.PLANNED, DeliverableStatus.IN_PROGRESS]),
+    ).count()
+    Deliverable.query.join(Project).join(Client).filter(
+        Client.user_id == user_id,
+        Deliverable.due_date < now,
+        Deliverable.status != DeliverableStatus.COMPLETED,
+    ).count()
+    upcoming = (
+        Deliverable.query.join(Project).join(Client)
+        .filter(
+            Client.user_id == user_id,
+            Deliverable.due_date >= now,
+            Deliverable.status != DeliverableStatus.COMPLETED,
+        )
+        .order_by(Deliverable.due_date.asc())
+        .limit(5)
+        .all()
+    )
+    result = [d.project.title for d in upcoming]
+    db.session.expunge_all()
+    return result
+
+
+def single_pass_summary(user_id):
+    now = datetime.now(timezone.utc)
+    compute_user_counts(user_id, now)
+    upcoming_milestones(user_id, now)
+
+
+def stored_summary(user_id):
+    now = datetime.now(timezone.utc)
+    UserStats.for_user(user_id, now).to_dict()
+    upcoming_milestones(user_id, now)
+    db.session.expunge_all()
+
+
+def main():
+    for size in SIZES:
+        app = make_app()
+        with app.app_context():
+            user_id = seed_user(size)
+            print(f"{size:,} deliverables for one user")
+            legacy = report("legacy (5 queries + lazy loads)", lambda: legacy_summary(user_id))
+            single = report("single-pass aggregation", lambda: single_pass_summary(user_id))
+            stored = report("stored user_stats counters", lambda: stored_summary(user_id))
+            print(f"  speedup {legacy / single:.1f}x (aggregation), {legacy / stored:.1f}x (stored)\n")
+            db.session.remove()
+            db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
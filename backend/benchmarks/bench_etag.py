@@ -0,0 +1,43 @@
+"""Repeated polling of unchanged data, with and without If-None-Match.
+
+A client polls each endpoint the way the frontend does. Without ETags
+every poll runs the queries and serializes the page again; with them the
+server answers 304 from the user's data version alone.
+
+Usage:
+    python -m benchmarks.bench_etag [--deliverables 10000]
+"""
+
+import argparse
+from benchmarks.common import make_app, seed_user, report
+
+ENDPOINTS = (
+    "/api/clients",
+    "/api/projects?limit=200",
+    "/api/deliverables?limit=200",
+    "/api/dashboard",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deliverables", type=int, default=10_000)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        user_id = seed_user(args.deliverables)
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = user_id
+
+    for path in ENDPOINTS:
+        first = client.get(path)
+        etag = first.headers["ETag"]
+        print(f"{path} ({len(first.data) / 1024:.0f} KiB)")
+        report("full response", lambda: client.get(path).data, repeat=50)
+        report("If-None-Match → 304", lambda: client.get(path, headers={"If-None-Match": etag}).data, repeat=50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Account export: streamed zip (app/export.py) vs building it in memory.
+
+The in-memory baseline is the obvious implementation: load every row
+through the ORM, dump each table to one string and write a zip into a
+BytesIO. Peak memory is measured with tracemalloc; the streamed export
+should stay flat as the account grows while the baseline grows with it.
+
+Usage:
+    python -m benchmarks.bench_export [--deliverables 10000 100000]
+"""
+
+import argparse
+import io
+import json
+import time
+import tracemalloc
+import zipfile
+from app.export import EXPORT_TABLES, _owned_rows, _plain, stream_export
+from app.extensions import db
+from benchmarks.common import make_app, seed_user
+
+
+def buffered_export(user_id):
+    """Every table fully loaded, then zipped into memory."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, model, columns in EXPORT_TABLES:
+            rows = db.session.execute(_owned_rows(model, columns, user_id)).all()
+            lines = [json.dumps(dict(zip(columns, map(_plain, row)))) for row in rows]
+            archive.writestr(f"{name}.ndjson", "\n".join(lines))
+    return len(buffer.getvalue())
+
+
+def streamed_export(user_id):
+    """The endpoint's generator, drained the way a WSGI server would."""
+    return sum(len(chunk) for chunk in stream_export(user_id))
+
+
+def run(label, export, user_id):
+    db.session.expire_all()
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = export(user_id)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<10} {elapsed * 1000:9.0f} ms   peak {peak / 2**20:7.1f} MiB   zip {size / 2**20:6.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deliverables", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    for n in args.deliverables:
+        app = make_app()
+        with app.app_context():
+            user_id = seed_user(n)
+            print(f"{n:,} deliverables")
+            run("buffered", buffered_export, user_id)
+            run("streamed", streamed_export, user_id)
+
+
+if __name__ == "__main__":
+    main()
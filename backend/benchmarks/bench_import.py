@@ -0,0 +1,107 @@
+"""Bulk import throughput in rows per second, by chunk size.
+
+Imports --rows deliverables (plus one project per 50 and one client per
+10 projects) from in-memory NDJSON into a fresh account. Chunk size 1 is
+one INSERT and one commit per row — what the same data costs through
+individual POSTs, minus HTTP. The POST baseline times the real endpoints
+for the first --posts rows.
+
+Usage:
+    python -m benchmarks.bench_import [--rows 20000] [--chunk-sizes 1 100 1000 5000] [--posts 1000]
+"""
+
+import argparse
+import io
+import json
+import time
+from app.extensions import db
+from app.importer import import_tables, read_rows
+from app.models import User
+from benchmarks.common import make_app
+
+
+def generate(n_deliverables):
+    """NDJSON bytes for each table, parents keyed the way an agency export would be."""
+    n_projects = max(1, n_deliverables // 50)
+    n_clients = max(1, n_projects // 10)
+    clients = [
+        {"id": f"c{i}", "name": f"Client {i}", "email": f"c{i}@example.com", "notes": "Retainer. " * 10}
+        for i in range(n_clients)
+    ]
+    projects = [
+        {"id": f"p{i}", "client_id": f"c{i % n_clients}", "title": f"Project {i}",
+         "description": "Scope notes. " * 30, "deadline": "2030-06-30"}
+        for i in range(n_projects)
+    ]
+    deliverables = [
+        {"project_id": f"p{i % n_projects}", "title": f"Deliverable {i}",
+         "description": "Acceptance criteria. " * 15, "due_date": "2030-01-15"}
+        for i in range(n_deliverables)
+    ]
+    return {
+        name: "\n".join(map(json.dumps, rows)).encode()
+        for name, rows in (("clients", clients), ("projects", projects), ("deliverables", deliverables))
+    }
+
+
+def new_user(name):
+    user = User(username=name, email=f"{name}@example.com", password_hash="!")
+    db.session.add(user)
+    db.session.commit()
+    return user.id
+
+
+def run_import(files, chunk_size):
+    user_id = new_user(f"import{chunk_size}")
+    sources = {name: read_rows(io.BytesIO(data), "ndjson") for name, data in files.items()}
+    start = time.perf_counter()
+    report = import_tables(user_id, sources, chunk_size)
+    elapsed = time.perf_counter() - start
+    rows = sum(counts["imported"] for counts in report["tables"].values())
+    print(f"  import, chunk {chunk_size:<6} {rows:>8,} rows {elapsed:8.2f} s {rows / elapsed:>10,.0f} rows/s")
+
+
+def run_posts(app, files, n_rows):
+    user_id = new_user("poster")
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = user_id
+    ids = {}
+    start = time.perf_counter()
+    count = 0
+    for name, data in files.items():
+        for line in data.splitlines():
+            if count >= n_rows:
+                break
+            row = json.loads(line)
+            key = row.pop("id", None)
+            if name == "clients":
+                ids[key] = client.post("/api/clients", json=row).get_json()["data"]["id"]
+            elif name == "projects":
+                row["client_id"] = ids[row["client_id"]]
+                ids[key] = client.post("/api/projects", json=row).get_json()["data"]["id"]
+            else:
+                client.post(f"/api/projects/{ids[row.pop('project_id')]}/deliverables", json=row)
+            count += 1
+    elapsed = time.perf_counter() - start
+    print(f"  individual POSTs    {count:>8,} rows {elapsed:8.2f} s {count / elapsed:>10,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1, 100, 1000, 5000])
+    parser.add_argument("--posts", type=int, default=1000)
+    args = parser.parse_args()
+
+    files = generate(args.rows)
+    app = make_app()
+    with app.app_context():
+        print(f"{args.rows:,} deliverables")
+        run_posts(app, files, args.posts)
+        for chunk_size in args.chunk_sizes:
+            run_import(files, chunk_size)
+
+
+if __name__ == "__main__":
+    main()
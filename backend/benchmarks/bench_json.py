@@ -0,0 +1,60 @@
+"""Encoding API payloads with the stdlib and orjson JSON providers.
+
+Payloads are dumped by the response schemas first, exactly as the views
+do, so only the JSON encoding step is timed: what app.json.response()
+spends turning a page of dicts into the response body.
+
+Usage:
+    python -m benchmarks.bench_json [--deliverables 10000]
+"""
+
+import argparse
+from app.extensions import db
+from app.json_provider import OrjsonProvider, StdlibJSONProvider
+from app.models import AgentRun, Deliverable, Project, StepRun
+from app.schemas import DeliverableResponseSchema, ProjectResponseSchema, StepRunResponseSchema
+from benchmarks.common import make_app, seed_user, report
+
+
+def _seed_step_runs(user_id, n_runs=50, steps=4):
+    for i in range(n_runs):
+        run = AgentRun(user_id=user_id, action="risk_analysis", status="completed")
+        for step in range(1, steps + 1):
+            run.steps.append(StepRun(
+                step_number=step, action="call_gemini",
+                input_data={"prompt": "Summarise the risks. " * 20, "temperature": 0.7},
+                output_data={"risks": [{"title": f"Risk {i}.{k}", "score": k / 10} for k in range(8)]},
+            ))
+        db.session.add(run)
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deliverables", type=int, default=10_000)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        user_id = seed_user(args.deliverables)
+        _seed_step_runs(user_id)
+        payloads = {
+            "200 projects": ProjectResponseSchema(many=True).dump(
+                db.session.execute(db.select(Project).limit(200)).scalars().all()),
+            "200 deliverables": DeliverableResponseSchema(many=True).dump(
+                db.session.execute(db.select(Deliverable).limit(200)).scalars().all()),
+            "200 step runs": StepRunResponseSchema(many=True).dump(
+                db.session.execute(db.select(StepRun).limit(200)).scalars().all()),
+        }
+
+        providers = {"stdlib": StdlibJSONProvider(app), "orjson": OrjsonProvider(app)}
+        for label, data in payloads.items():
+            body = {"data": data, "next_cursor": None}
+            size = len(providers["stdlib"].response(body).get_data())
+            print(f"{label} ({size / 1024:.0f} KiB)")
+            for name, provider in providers.items():
+                report(name, lambda: provider.response(body), repeat=100)
+
+
+if __name__ == "__main__":
+    main()
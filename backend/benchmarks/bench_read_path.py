@@ -0,0 +1,97 @@
+"""List reads through ORM instances vs Core rows (app/api/read_models.py).
+
+The ORM baseline is what the list endpoints did before: a Model.query
+loads instances (identity map, instance state, change tracking) that are
+serialized and thrown away. The read-model path selects the same columns
+as Core Rows. Both dump with the same compiled serializer, so the
+difference is the cost of building instances.
+
+Reported for 100k deliverables:
+- latency of one 200-row page (the endpoint's query + dump), and of the
+  dashboard counters (ORM get vs Core select);
+- time and tracemalloc peak memory to read and dump every row.
+
+Usage:
+    python -m benchmarks.bench_read_path [--deliverables 100000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from app.api.pagination import paginate
+from app.api.read_models import fetch_rows, select_rows
+from app.extensions import db
+from app.models import Deliverable, Project
+from app.models.user_stats import UserStats
+from app.schemas import DeliverableResponseSchema, ProjectResponseSchema
+from app.serializers import serializer
+from benchmarks.common import make_app, seed_user, report
+
+RESOURCES = ((Project, ProjectResponseSchema), (Deliverable, DeliverableResponseSchema))
+
+
+def orm_rows(model, user_id, limit=None):
+    query = model.query.filter_by(owner_id=user_id).order_by(model.created_at.desc(), model.id.desc())
+    return query.limit(limit).all() if limit else query.all()
+
+
+def core_rows(model, schema_cls, user_id, limit=None):
+    stmt = select_rows(schema_cls).where(model.owner_id == user_id)
+    if limit:
+        return paginate(stmt, model, limit)[0]
+    return fetch_rows(stmt.order_by(model.created_at.desc(), model.id.desc()))
+
+
+def fresh(read):
+    """Run one read in a clean session, as each request gets."""
+
+    def run():
+        try:
+            return read()
+        finally:
+            db.session.expunge_all()
+
+    return run
+
+
+def full_scan(label, read, dump):
+    db.session.expunge_all()
+    start = time.perf_counter()
+    count = len(dump.dump(read()))
+    elapsed = time.perf_counter() - start
+    db.session.expunge_all()
+
+    tracemalloc.start()
+    dump.dump(read())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.session.expunge_all()
+    print(f"  {label:<32} {count:,} rows {elapsed * 1000:8.0f} ms   peak {peak / 2**20:7.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--deliverables", type=int, default=100_000)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        user_id = seed_user(args.deliverables, deliverables_per_project=10)
+        for model, schema_cls in RESOURCES:
+            dump = serializer(schema_cls, many=True)
+            print(f"{model.__tablename__}: one page of 200")
+            report("ORM instances", fresh(lambda: dump.dump(orm_rows(model, user_id, 200))))
+            report("Core rows", fresh(lambda: dump.dump(core_rows(model, schema_cls, user_id, 200))))
+            print(f"{model.__tablename__}: every row")
+            full_scan("ORM instances", lambda: orm_rows(model, user_id), dump)
+            full_scan("Core rows", lambda: core_rows(model, schema_cls, user_id), dump)
+
+        now = datetime.now(timezone.utc)
+        print("dashboard counters")
+        report("ORM get", fresh(lambda: UserStats.for_user(user_id, now).to_dict()), repeat=200)
+        report("Core select", fresh(lambda: UserStats.counts_for(user_id, now)), repeat=200)
+
+
+if __name__ == "__main__":
+    main()
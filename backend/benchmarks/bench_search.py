@@ -0,0 +1,63 @@
+"""Search over one million indexed rows: FTS5 MATCH vs LIKE scans.
+
+The index holds --rows rows spread over --users users, and one user's
+searches are timed. The LIKE baseline is what a search endpoint without
+the index would run: a substring scan of the same columns on all three
+tables, unranked, stopping at the first 20 hits.
+
+BM25 scores every row that matches, so a term in nearly all of a user's
+rows costs time proportional to that user's row count; --users 1 shows
+that worst case.
+
+Usage:
+    python -m benchmarks.bench_search [--rows 1000000] [--users 100]
+"""
+
+import argparse
+import time
+from app.extensions import db
+from app.search import search
+from benchmarks.common import make_app, seed_user, report
+
+
+def like_search(user_id, query, limit=20):
+    """Substring search the way it would look without an index."""
+    pattern = f"%{query}%"
+    return db.session.execute(
+        db.text(
+            "SELECT 'client', id FROM clients WHERE user_id = :uid "
+            "  AND (name LIKE :p OR company LIKE :p OR notes LIKE :p) "
+            "UNION ALL SELECT 'project', id FROM projects WHERE owner_id = :uid "
+            "  AND (title LIKE :p OR description LIKE :p) "
+            "UNION ALL SELECT 'deliverable', id FROM deliverables WHERE owner_id = :uid "
+            "  AND (title LIKE :p OR description LIKE :p) "
+            "LIMIT :limit"
+        ),
+        {"uid": user_id, "p": pattern, "limit": limit},
+    ).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        start = time.perf_counter()
+        per_user = args.rows // args.users
+        user_ids = [seed_user(per_user, username=f"search{i}") for i in range(args.users)]
+        indexed = db.session.execute(db.text("SELECT count(*) FROM search_index")).scalar()
+        print(f"Indexed {indexed:,} rows for {args.users} user(s) in {time.perf_counter() - start:.1f} s")
+
+        user_id = user_ids[len(user_ids) // 2]
+        rare = str(per_user // 2)  # one deliverable title per user
+        for label, query in (("rare term", rare), ("common term", "acceptance")):
+            print(f"{label}: {query!r}")
+            report("FTS5 MATCH + bm25", lambda: search(user_id, query, 20), repeat=10)
+            report("LIKE scan", lambda: like_search(user_id, query), repeat=3, warmup=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Dumping list pages with marshmallow schemas vs compiled serializers.
+
+Rows are loaded once; only the dump step a list endpoint runs per
+request is timed, for a full page and a ?fields= page of each resource.
+
+Usage:
+    python -m benchmarks.bench_serializers [--limit 200]
+"""
+
+import argparse
+from app.extensions import db
+from app.models import Client, Deliverable, Project
+from app.schemas import ClientResponseSchema, DeliverableResponseSchema, ProjectResponseSchema
+from app.serializers import serializer
+from benchmarks.common import make_app, seed_user, report
+
+PAGES = (
+    (Client, ClientResponseSchema, frozenset({"id", "name", "email"})),
+    (Project, ProjectResponseSchema, frozenset({"id", "title", "status", "progress_percentage"})),
+    (Deliverable, DeliverableResponseSchema, frozenset({"id", "title", "status", "due_date"})),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=200)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        seed_user(args.limit * 50, n_clients=args.limit)
+        for model, schema_cls, fields in PAGES:
+            rows = db.session.execute(db.select(model).limit(args.limit)).scalars().all()
+            assert serializer(schema_cls, many=True).dump(rows) == schema_cls(many=True).dump(rows)
+            print(f"{len(rows)} {model.__tablename__}")
+            for label, only in (("all fields", None), (f"{len(fields)} fields", fields)):
+                schema = schema_cls(only=only, many=True)
+                compiled = serializer(schema_cls, only, many=True)
+                report(f"marshmallow dump, {label}", lambda: schema.dump(rows), repeat=50)
+                report(f"compiled serializer, {label}", lambda: compiled.dump(rows), repeat=50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Shared helpers for benchmarks — app setup, bulk seeding, timing."""
+
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import insert
+from app import create_app
+from app.extensions import db
+from app.models import User, Client, Project, Deliverable, DeliverableStatus
+from app.models.project_counters import recompute_project_counters
+
+STATUSES = sorted(DeliverableStatus.ALL)
+
+
+def make_app():
+    """Create an app bound to a fresh in-memory database."""
+    app = create_app("testing")
+    app.config["LOG_LEVEL"] = "WARNING"
+    return app
+
+
+def seed_user(n_deliverables, n_clients=20, deliverables_per_project=50, seed=42, username=None):
+    """Bulk-insert one user owning n_deliverables spread over clients/projects.
+
+    Uses Core executemany (not the ORM) so seeding 100k rows takes seconds.
+    Bulk inserts skip session hooks, so owner_id is set explicitly and the
+    project counters are recomputed at the end.
+
+    Returns:
+        The new user's id.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    today = date.today()
+
+    username = username or f"bench{n_deliverables}"
+    user = User(username=username, email=f"{username}@example.com")
+    user.set_password("password123")
+    db.session.add(user)
+    db.session.flush()
+
+    client_rows = [
+        {"user_id": user.id, "name": f"Client {i}", "email": f"c{i}@example.com",
+         "notes": "Long-term client. " * 20, "created_at": now, "updated_at": now}
+        for i in range(n_clients)
+    ]
+    db.session.execute(insert(Client), client_rows)
+    client_ids = [c.id for c in Client.query.filter_by(user_id=user.id)]
+
+    n_projects = max(1, n_deliverables // deliverables_per_project)
+    project_rows = [
+        {"client_id": client_ids[i % n_clients], "owner_id": user.id,
+         "title": f"Project {i}", "description": "Scope notes. " * 30,
+         "status": rng.choice(["active", "on_hold", "completed"]),
+         "deadline": today + timedelta(days=rng.randint(-30, 120)),
+         "created_at": now, "updated_at": now}
+        for i in range(n_projects)
+    ]
+    db.session.execute(insert(Project), project_rows)
+    project_ids = [p.id for p in Project.query.filter_by(owner_id=user.id)]
+
+    deliverable_rows = [
+        {"project_id": project_ids[i % n_projects], "owner_id": user.id,
+         "title": f"Deliverable {i}", "description": "Acceptance criteria. " * 15,
+         "status": rng.choice(STATUSES),
+         "due_date": today + timedelta(days=rng.randint(-60, 90)),
+         "created_at": now - timedelta(seconds=i), "updated_at": now}
+        for i in range(n_deliverables)
+    ]
+    for start in range(0, len(deliverable_rows), 10_000):
+        db.session.execute(insert(Deliverable), deliverable_rows[start:start + 10_000])
+    recompute_project_counters(project_ids)
+
+    db.session.commit()
+    return user.id
+
+
+def measure(fn, repeat=20, warmup=2):
+    """Run fn repeatedly and return (median_ms, p95_ms)."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+def report(label, fn, **kwargs):
+    """Measure fn and print one aligned result line."""
+    median, p95 = measure(fn, **kwargs)
+    print(f"  {label:<32} median {median:8.2f} ms   p95 {p95:8.2f} ms")
+    return median
@@ -12,6 +12,7 @@ from app.models.user import User
 from app.models.client import Client
 from app.models.project import Project
 from app.models.deliverable import Deliverable
+from app.models.user_stats import UserStats
 
 
 def seed():
@@ -22,6 +23,7 @@ def seed():
         Deliverable.query.delete()
         Project.query.delete()
         Client.query.delete()
+        UserStats.query.delete()  # bulk deletes bypass the counter hooks
 
         # Find or create a test user
         user = User.query.first()
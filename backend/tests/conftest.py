@@ -5,13 +5,25 @@ Design decisions:
 - App factory pattern makes it easy to create a fresh app for tests.
 - Fixtures handle database setup/teardown automatically.
 - Provides a pre-authenticated test client to reduce boilerplate.
+- seed builds the client/project/deliverable (and agent run) tree many
+  tests start from; each test passes only the field values it asserts on.
+- assert_max_queries caps the SQL a block may run, so N+1 regressions
+  fail CI instead of surfacing in production.
 
 This setup ensures every test starts with a clean slate.
 """
 
 import pytest
+from contextlib import contextmanager
+from types import SimpleNamespace
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from app import create_app
 from app.extensions import db
+from app.models import AgentRun, StepRun, User
+
+# Status transitions seed() makes to reach a deliverable's target status
+STATUS_STEPS = {"in_progress": ("in_progress",), "completed": ("in_progress", "completed")}
 
 
 @pytest.fixture(scope="session")
@@ -33,11 +45,96 @@ def client(app):
 
 
 @pytest.fixture
-def auth_client(client):
+def login():
+    """Return login(client, user_id): sign the client in as that user.
+
+    Foreign keys are enforced, so the user row is created if it is missing.
+    """
+
+    def _login(client, user_id):
+        with client.application.app_context():
+            if db.session.get(User, user_id) is None:
+                db.session.add(User(
+                    id=user_id,
+                    username=f"user{user_id}",
+                    email=f"user{user_id}@example.com",
+                    password_hash="!",
+                ))
+                db.session.commit()
+        with client.session_transaction() as sess:
+            sess["user_id"] = user_id
+        return client
+
+    return _login
+
+
+@pytest.fixture
+def auth_client(client, login):
     """A test client with an active session (user_id=1)."""
-    with client.session_transaction() as sess:
-        sess["user_id"] = 1
-    return client
+    return login(client, 1)
+
+
+@pytest.fixture
+def seed(login):
+    """Return seed(client, user_id, ...): sign in and create one client's data.
+
+    The client, projects and deliverables are created through the API, so
+    counters, stats and the search index are maintained as in production.
+
+    Args (keyword-only after user_id):
+        client_fields: Fields for the client, merged over a default name/email.
+        projects: Project field dicts; each may carry a "deliverables" list of
+            deliverable field dicts. Defaults to one project with one deliverable.
+            A deliverable's "status" ("in_progress" or "completed") is reached
+            through the status endpoint, like a user would.
+        agent_run: AgentRun field dicts (user_id is filled in), or None for no
+            run; it may carry a "steps" list of StepRun field dicts.
+
+    Returns:
+        SimpleNamespace with client_id, project_ids, deliverable_ids (in
+        creation order) and agent_run_id (None without a run).
+    """
+
+    def _seed(client, user_id, *, client_fields=None, projects=None, agent_run=None):
+        login(client, user_id)
+        client_id = client.post("/api/clients", json={
+            "name": f"Client {user_id}", "email": f"client{user_id}@example.com", **(client_fields or {}),
+        }).get_json()["data"]["id"]
+
+        if projects is None:
+            projects = [{"title": "Project", "deliverables": [{"title": "Deliverable"}]}]
+        project_ids, deliverable_ids = [], []
+        for fields in projects:
+            fields = dict(fields)
+            deliverables = fields.pop("deliverables", [])
+            project_id = client.post("/api/projects", json={"client_id": client_id, **fields}).get_json()["data"]["id"]
+            project_ids.append(project_id)
+            for deliverable in deliverables:
+                deliverable = dict(deliverable)
+                status = deliverable.pop("status", None)
+                resp = client.post(f"/api/projects/{project_id}/deliverables", json=deliverable)
+                deliverable_id = resp.get_json()["data"]["id"]
+                deliverable_ids.append(deliverable_id)
+                for step in STATUS_STEPS[status] if status else ():
+                    client.patch(f"/api/deliverables/{deliverable_id}/status", json={"status": step})
+
+        agent_run_id = None
+        if agent_run is not None:
+            fields = dict(agent_run)
+            steps = fields.pop("steps", [])
+            with client.application.app_context():
+                run = AgentRun(user_id=user_id, **fields)
+                run.steps.extend(StepRun(**step) for step in steps)
+                db.session.add(run)
+                db.session.commit()
+                agent_run_id = run.id
+
+        return SimpleNamespace(
+            client_id=client_id, project_ids=project_ids,
+            deliverable_ids=deliverable_ids, agent_run_id=agent_run_id,
+        )
+
+    return _seed
 
 
 @pytest.fixture
@@ -49,3 +146,32 @@ def db_session(app):
             db.session.execute(table.delete())
         db.session.commit()
         yield db.session
+
+
+@pytest.fixture
+def assert_max_queries():
+    """Fail if the wrapped block runs more than n SQL statements.
+
+    Usage:
+        with assert_max_queries(3):
+            client.get("/api/projects")
+    """
+
+    @contextmanager
+    def _assert_max_queries(n):
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", _record)
+        assert len(statements) <= n, (
+            f"Expected at most {n} queries, got {len(statements)}:\n"
+            + "\n".join(f"  {' '.join(s.split())}" for s in statements)
+        )
+
+    return _assert_max_queries
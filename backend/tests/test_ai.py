@@ -41,7 +41,7 @@ def mock_gemini():
     yield mock_model
 
 
-def test_structure_scope_creates_audit_logs(auth_client, db_session, mock_gemini):
+def test_structure_scope_creates_audit_logs(db_session, auth_client, mock_gemini):
     """Verify that structure_scope creates the expected audit trail."""
     raw_text = "I need a website for my bakery."
     
@@ -64,7 +64,7 @@ def test_structure_scope_creates_audit_logs(auth_client, db_session, mock_gemini
     assert gemini_step.output_data["deliverables"][0]["title"] == "Test"
 
 
-def test_analyze_risk_workflow(auth_client, db_session, mock_gemini):
+def test_analyze_risk_workflow(db_session, auth_client, mock_gemini):
     """Verify the risk analysis workflow and data flow."""
     # 1. Setup project context
     from app.models.client import Client
@@ -95,7 +95,7 @@ def test_analyze_risk_workflow(auth_client, db_session, mock_gemini):
     assert run.status == "completed"
 
 
-def test_ai_error_handling(auth_client, db_session, mock_gemini):
+def test_ai_error_handling(db_session, auth_client, mock_gemini):
     """Verify that AI errors are logged and status is marked as failed."""
     mock_gemini.generate_content.side_effect = Exception("Gemini is down")
     
@@ -289,3 +289,406 @@ class TestDashboard:
         data = resp.get_json()["data"]
         assert "client_count" in data
         assert "active_project_count" in data
+
+    def test_dashboard_counts_and_milestones(self, client, auth_token):
+        headers = auth_headers(auth_token)
+        client_id = client.post("/api/clients", headers=headers, json={
+            "name": "Dash Client", "email": "dash@example.com"
+        }).get_json()["data"]["id"]
+        project_id = client.post("/api/projects", headers=headers, json={
+            "title": "Dash Project", "client_id": client_id
+        }).get_json()["data"]["id"]
+        for title, due in [("Late", "2000-01-01"), ("Soon", "2999-01-01"), ("Later", "2999-06-01")]:
+            client.post(f"/api/projects/{project_id}/deliverables", headers=headers, json={
+                "title": title, "due_date": due
+            })
+
+        data = client.get("/api/dashboard", headers=headers).get_json()["data"]
+        assert data["client_count"] == 1
+        assert data["active_project_count"] == 1
+        assert data["pending_deliverable_count"] == 3
+        assert data["overdue_deliverable_count"] == 1
+        assert [m["title"] for m in data["upcoming_milestones"]] == ["Soon", "Later"]
+        assert data["upcoming_milestones"][0] == {
+            "type": "deliverable",
+            "id": data["upcoming_milestones"][0]["id"],
+            "title": "Soon",
+            "project_title": "Dash Project",
+            "due_date": "2999-01-01",
+        }
+
+    def test_dashboard_stats_track_writes(self, app, client, auth_token):
+        from datetime import datetime, timezone
+        from app.models import UserStats
+        from app.models.user_stats import compute_user_counts
+
+        headers = auth_headers(auth_token)
+        c1 = client.post("/api/clients", headers=headers, json={
+            "name": "S1", "email": "s1@example.com"
+        }).get_json()["data"]["id"]
+        c2 = client.post("/api/clients", headers=headers, json={
+            "name": "S2", "email": "s2@example.com"
+        }).get_json()["data"]["id"]
+        p1 = client.post("/api/projects", headers=headers, json={
+            "title": "P1", "client_id": c1
+        }).get_json()["data"]["id"]
+        client.post("/api/projects", headers=headers, json={"title": "P2", "client_id": c2})
+        d1 = client.post(f"/api/projects/{p1}/deliverables", headers=headers, json={
+            "title": "D1", "due_date": "2000-01-01"
+        }).get_json()["data"]["id"]
+        d2 = client.post(f"/api/projects/{p1}/deliverables", headers=headers, json={
+            "title": "D2"
+        }).get_json()["data"]["id"]
+
+        data = client.get("/api/dashboard", headers=headers).get_json()["data"]
+        assert (data["client_count"], data["active_project_count"]) == (2, 2)
+        assert (data["pending_deliverable_count"], data["overdue_deliverable_count"]) == (2, 1)
+
+        for status in ("in_progress", "completed"):
+            client.patch(f"/api/deliverables/{d1}/status", headers=headers, json={"status": status})
+        client.patch(f"/api/projects/{p1}/status", headers=headers, json={"status": "on_hold"})
+        client.delete(f"/api/deliverables/{d2}", headers=headers)
+        client.delete(f"/api/clients/{c2}", headers=headers)
+
+        data = client.get("/api/dashboard", headers=headers).get_json()["data"]
+        assert data["client_count"] == 1
+        assert data["active_project_count"] == 0
+        assert data["pending_deliverable_count"] == 0
+        assert data["overdue_deliverable_count"] == 0
+
+        user_id = UserStats.query.one().user_id
+        assert UserStats.query.get(user_id).to_dict() == compute_user_counts(
+            user_id, datetime.now(timezone.utc)
+        )
+
+    def test_reconcile_user_stats_reports_drift(self, app, client, auth_token):
+        from app.models import UserStats
+
+        client.post("/api/clients", headers=auth_headers(auth_token), json={
+            "name": "R", "email": "r@example.com"
+        })
+        client.get("/api/dashboard", headers=auth_headers(auth_token))
+        stats = UserStats.query.one()
+        stats.client_count = 42
+        db.session.commit()
+        stale = client.get("/api/dashboard", headers=auth_headers(auth_token))
+
+        result = app.test_cli_runner().invoke(args=["reconcile-user-stats"])
+        assert "client_count: 42 -> 1" in result.output
+        assert "fixed drift for 1 user(s)" in result.output
+        assert UserStats.query.one().client_count == 1
+        resp = client.get("/api/dashboard", headers={
+            **auth_headers(auth_token), "If-None-Match": stale.headers["ETag"]
+        })
+        assert resp.status_code == 200
+        assert resp.get_json()["data"]["client_count"] == 1
+
+    def test_stats_recompute_leaves_the_transaction_to_the_caller(self, app, client, login):
+        from app.models import User, UserStats
+
+        login(client, 1)
+        client.post("/api/clients", json={"name": "C", "email": "c@example.com"})
+        db.session.execute(db.delete(UserStats.__table__))
+        db.session.commit()
+
+        db.session.add(User(id=2, username="pending", email="p@example.com", password_hash="!"))
+        assert UserStats.for_user(1).client_count == 1
+        db.session.rollback()
+        assert db.session.get(User, 2) is None
+        assert UserStats.query.count() == 0
+
+        # The dashboard view commits what it recomputed
+        assert client.get("/api/dashboard").get_json()["data"]["client_count"] == 1
+        assert UserStats.query.count() == 1
+        db.session.execute(db.delete(User.__table__).where(User.id == 1))
+        db.session.commit()
+        assert UserStats.query.count() == 0
+
+    def test_missing_stats_row_created_concurrently(self, tmp_path, monkeypatch, login):
+        """Two first dashboard loads both miss the row; the second must not fail."""
+        from datetime import datetime, timezone
+        from sqlalchemy import event
+        from app.config import TestingConfig
+        from app.models import UserStats
+
+        monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'race.db'}")
+        app = create_app("testing")
+        client = login(app.test_client(), 1)
+        client.post("/api/clients", json={"name": "C", "email": "c@example.com"})
+        competing = []
+
+        def another_request_inserts_first(conn, cursor, statement, *args):
+            # The other request commits its row just before our INSERT runs
+            if statement.startswith("INSERT INTO user_stats") and not competing:
+                competing.append(statement)
+                with db.engine.begin() as other:
+                    other.execute(db.insert(UserStats.__table__).values(
+                        user_id=1, client_count=0, overdue_as_of=datetime.now(timezone.utc).date(),
+                    ))
+
+        with app.app_context():
+            db.session.execute(db.delete(UserStats.__table__))
+            db.session.commit()
+            event.listen(db.engine, "before_cursor_execute", another_request_inserts_first)
+            try:
+                assert client.get("/api/dashboard").get_json()["data"]["client_count"] == 1
+            finally:
+                event.remove(db.engine, "before_cursor_execute", another_request_inserts_first)
+            assert competing
+            assert UserStats.query.count() == 1
+
+
+# ─── REQUEST INSTRUMENTATION TESTS ────────────────────────────
+
+class TestRequestInstrumentation:
+    def test_query_count_and_db_time_headers(self, client, auth_token):
+        resp = client.get("/api/clients", headers=auth_headers(auth_token))
+        count = int(resp.headers["X-Query-Count"])
+        assert count > 0
+        assert resp.headers["Server-Timing"].startswith("db;dur=")
+        assert f'desc="{count} queries"' in resp.headers["Server-Timing"]
+
+    def test_request_log_includes_query_stats(self, client, auth_token, caplog):
+        with caplog.at_level("INFO", logger="app.middleware"):
+            resp = client.get("/api/projects", headers=auth_headers(auth_token))
+        record = [r for r in caplog.records if r.message == "request_completed"][-1]
+        assert record.query_count == int(resp.headers["X-Query-Count"])
+        assert record.db_time_ms >= 0
+
+    def test_list_endpoints_have_bounded_queries(self, client, auth_token, assert_max_queries):
+        headers = auth_headers(auth_token)
+        client_id = client.post("/api/clients", headers=headers, json={
+            "name": "Q", "email": "q@example.com"
+        }).get_json()["data"]["id"]
+        for i in range(5):
+            project_id = client.post("/api/projects", headers=headers, json={
+                "title": f"P{i}", "client_id": client_id
+            }).get_json()["data"]["id"]
+            client.post("/api/deliverables", headers=headers, json={
+                "title": "D", "project_id": project_id
+            })
+
+        for path in ("/api/clients", "/api/projects", "/api/deliverables",
+                     f"/api/clients/{client_id}/projects"):
+            with assert_max_queries(3):
+                client.get(path, headers=headers)
+
+
+# ─── SPARSE FIELDSET TESTS ────────────────────────────────────
+
+class TestSparseFieldsets:
+    def _seed(self, client, headers):
+        client_id = client.post("/api/clients", headers=headers, json={
+            "name": "F", "email": "f@example.com", "notes": "long notes"
+        }).get_json()["data"]["id"]
+        project_id = client.post("/api/projects", headers=headers, json={
+            "title": "P", "client_id": client_id, "description": "long description"
+        }).get_json()["data"]["id"]
+        client.post("/api/deliverables", headers=headers, json={
+            "title": "D", "project_id": project_id, "description": "long description"
+        })
+        return client_id, project_id
+
+    def test_fields_limit_columns_and_output(self, client, auth_token, assert_max_queries):
+        headers = auth_headers(auth_token)
+        self._seed(client, headers)
+
+        with assert_max_queries(3) as statements:
+            resp = client.get("/api/deliverables?fields=id,title,status,due_date", headers=headers)
+        assert resp.status_code == 200
+        assert set(resp.get_json()["data"][0]) == {"id", "title", "status", "due_date"}
+        select = next(s for s in statements if "FROM deliverables" in s)
+        assert "deliverables.description" not in select
+
+        client_resp = client.get("/api/clients?fields=name", headers=headers).get_json()["data"]
+        assert client_resp == [{"name": "F"}]
+
+    def test_computed_fields_load_their_columns(self, client, auth_token, assert_max_queries):
+        headers = auth_headers(auth_token)
+        _, project_id = self._seed(client, headers)
+
+        with assert_max_queries(2) as statements:
+            resp = client.get(f"/api/projects/{project_id}?fields=title,progress_percentage", headers=headers)
+        assert resp.get_json()["data"] == {"title": "P", "progress_percentage": 0}
+        assert "projects.description" not in statements[-1]
+
+    def test_unknown_field_is_rejected(self, client, auth_token):
+        resp = client.get("/api/projects?fields=title,owner_id", headers=auth_headers(auth_token))
+        assert resp.status_code == 400
+        error = resp.get_json()["error"]
+        assert error["code"] == "INVALID_FIELDS"
+        assert error["details"]["unknown"] == ["owner_id"]
+
+    def test_schema_instances_are_cached(self):
+        from app.api.fieldsets import response_schema
+        from app.schemas import DeliverableResponseSchema
+
+        fields = frozenset({"id", "title"})
+        schema = response_schema(DeliverableResponseSchema, fields, many=True)
+        assert response_schema(DeliverableResponseSchema, frozenset({"title", "id"}), many=True) is schema
+        assert set(schema.fields) == fields
+
+
+# ─── CONDITIONAL GET TESTS ────────────────────────────────────
+
+class TestConditionalGet:
+    def test_matching_etag_is_304_after_one_version_read(self, client, auth_token, assert_max_queries):
+        headers = auth_headers(auth_token)
+        client.post("/api/clients", headers=headers, json={"name": "E", "email": "e@example.com"})
+
+        resp = client.get("/api/clients", headers=headers)
+        etag = resp.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert resp.headers["Cache-Control"] == "private, no-cache"
+
+        with assert_max_queries(1) as statements:
+            resp = client.get("/api/clients", headers={**headers, "If-None-Match": etag})
+        assert "user_data_versions" in statements[0]
+        assert resp.status_code == 304
+        assert resp.data == b""
+        assert resp.headers["ETag"] == etag
+
+    def test_writes_and_query_strings_change_the_etag(self, client, auth_token):
+        headers = auth_headers(auth_token)
+        client_id = client.post("/api/clients", headers=headers, json={
+            "name": "E", "email": "e@example.com"
+        }).get_json()["data"]["id"]
+        project_id = client.post("/api/projects", headers=headers, json={
+            "title": "P", "client_id": client_id
+        }).get_json()["data"]["id"]
+
+        paths = ["/api/projects", f"/api/projects/{project_id}", "/api/deliverables", "/api/dashboard",
+                 f"/api/clients/{client_id}/projects", f"/api/projects/{project_id}/deliverables"]
+        etags = {path: client.get(path, headers=headers).headers["ETag"] for path in paths}
+        assert len(set(etags.values())) == len(paths)
+        assert client.get("/api/projects?fields=id", headers=headers).headers["ETag"] != etags["/api/projects"]
+        for path, etag in etags.items():
+            assert client.get(path, headers={**headers, "If-None-Match": etag}).status_code == 304
+
+        client.post("/api/deliverables", headers=headers, json={"title": "D", "project_id": project_id})
+        for path, etag in etags.items():
+            resp = client.get(path, headers={**headers, "If-None-Match": etag})
+            assert resp.status_code == 200, path
+            assert resp.headers["ETag"] != etag
+
+    def test_writes_from_another_worker_or_the_cli_change_the_etag(self, tmp_path, monkeypatch, login):
+        from app.config import TestingConfig
+        monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'shared.db'}")
+        # Two workers on one database, each with its own in-memory cache
+        worker_a, worker_b = create_app("testing"), create_app("testing")
+        a, b = login(worker_a.test_client(), 1), login(worker_b.test_client(), 1)
+
+        etag = a.get("/api/clients").headers["ETag"]
+        assert a.get("/api/dashboard").get_json()["data"]["client_count"] == 0
+        b.post("/api/clients", json={"name": "From B", "email": "b@example.com"})
+        resp = a.get("/api/clients", headers={"If-None-Match": etag})
+        assert resp.status_code == 200 and len(resp.get_json()["data"]) == 1
+        assert a.get("/api/dashboard").get_json()["data"]["client_count"] == 1
+
+        etag = resp.headers["ETag"]
+        (tmp_path / "clients.csv").write_text("id,name,email\nc1,From CLI,cli@example.com\n")
+        with worker_b.app_context():  # as the flask command provides
+            result = worker_b.test_cli_runner().invoke(
+                args=["import-data", "1", "--clients", str(tmp_path / "clients.csv")]
+            )
+        assert result.exit_code == 0, result.output
+        resp = a.get("/api/clients", headers={"If-None-Match": etag})
+        assert resp.status_code == 200 and len(resp.get_json()["data"]) == 2
+
+    def test_errors_are_not_tagged(self, client, auth_token):
+        headers = auth_headers(auth_token)
+        resp = client.get("/api/clients/999", headers=headers)
+        assert resp.status_code == 404
+        assert "ETag" not in resp.headers
+        assert client.get("/api/clients", headers={"If-None-Match": "*"}).status_code == 401
+
+    def test_etags_are_per_user(self, client, auth_token):
+        etag = client.get("/api/dashboard", headers=auth_headers(auth_token)).headers["ETag"]
+        client.post("/api/auth/signup", json={
+            "email": "other@example.com", "password": "password123", "username": "otheruser"
+        })
+        other = client.post("/api/auth/login", json={
+            "email": "other@example.com", "password": "password123"
+        }).get_json()["access_token"]
+        resp = client.get("/api/dashboard", headers={**auth_headers(other), "If-None-Match": etag})
+        assert resp.status_code == 200
+
+
+# ─── COMPRESSION TESTS ────────────────────────────────────────
+
+class TestCompression:
+    def _seed(self, client, headers, n=20):
+        for i in range(n):
+            client.post("/api/clients", headers=headers, json={
+                "name": f"Client {i}", "email": f"c{i}@example.com", "notes": "Prefers email. " * 10
+            })
+
+    def test_large_json_is_gzipped_and_logged(self, client, auth_token, caplog):
+        import gzip
+        headers = auth_headers(auth_token)
+        self._seed(client, headers)
+        plain = client.get("/api/clients", headers=headers)
+
+        with caplog.at_level("INFO", logger="app.middleware"):
+            resp = client.get("/api/clients", headers={**headers, "Accept-Encoding": "gzip, deflate"})
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["Vary"]
+        assert int(resp.headers["Content-Length"]) == len(resp.data) < len(plain.data)
+        assert gzip.decompress(resp.data) == plain.data
+        assert "compress;dur=" in resp.headers["Server-Timing"]
+
+        record = [r for r in caplog.records if r.message == "request_completed"][-1]
+        assert record.compression == "gzip"
+        assert record.bytes_in == len(plain.data) and record.bytes_out == len(resp.data)
+        assert record.compression_ratio > 1
+        assert record.compress_cpu_ms >= 0
+
+    def test_small_refused_or_disabled_responses_are_sent_as_is(self, app, client, auth_token, monkeypatch):
+        from app import middleware
+        headers = auth_headers(auth_token)
+        self._seed(client, headers)
+        monkeypatch.setitem(middleware.CODECS, "br", None)
+
+        assert "Content-Encoding" not in client.get("/api/dashboard", headers={
+            **headers, "Accept-Encoding": "gzip"}).headers  # below COMPRESSION_MIN_SIZE
+        for accept in ("identity", "gzip;q=0", "br"):
+            resp = client.get("/api/clients", headers={**headers, "Accept-Encoding": accept})
+            assert "Content-Encoding" not in resp.headers, accept
+
+        monkeypatch.setitem(app.config, "COMPRESSION_LEVELS", {})
+        resp = client.get("/api/clients", headers={**headers, "Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in resp.headers
+
+    def test_negotiation_prefers_client_quality_then_config_order(self, monkeypatch):
+        from werkzeug.datastructures import Accept
+        from werkzeug.http import parse_accept_header
+        from app import middleware
+
+        monkeypatch.setitem(middleware.CODECS, "zstd", middleware._GzipStream)
+        monkeypatch.setitem(middleware.CODECS, "br", None)
+        levels = {"zstd": 3, "br": 4, "gzip": 6}
+
+        def pick(header):
+            return middleware.negotiate_encoding(parse_accept_header(header, Accept), levels)
+
+        assert pick("gzip, zstd") == "zstd"
+        assert pick("gzip, zstd;q=0.5") == "gzip"
+        assert pick("br, gzip;q=0.1") == "gzip"
+        assert pick("*") == "zstd"
+        assert pick("br") is None
+
+    def test_streamed_responses_are_compressed_incrementally(self, app):
+        import zlib
+        from flask import Response
+
+        parts = [(f"{i}: " + "row " * 200 + "\n").encode() for i in range(3)]
+        app.add_url_rule("/stream-test", "stream_test", lambda: Response(iter(parts), mimetype="text/csv"))
+
+        resp = app.test_client().get("/stream-test", headers={"Accept-Encoding": "gzip"}, buffered=False)
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in resp.headers
+        decompressor = zlib.decompressobj(31)
+        # Each chunk is flushed, so it decompresses to its input on arrival
+        received = [decompressor.decompress(chunk) for chunk in resp.response]
+        assert received[:3] == parts
+        assert b"".join(received) == b"".join(parts)
@@ -0,0 +1,168 @@
+"""Tests for the versioned response cache and its backends."""
+
+import time
+import pytest
+from app import create_app
+from app.cache import MemoryBackend, SQLiteBackend
+from app.extensions import db
+
+
+@pytest.fixture
+def app():
+    """A fresh app per test so cache entries and ids never leak between tests."""
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def test_memory_backend_evicts_least_recently_used():
+    """Test the in-process backend keeps at most max_entries."""
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")          # "b" is now least recently used
+    backend.set("c", 3)
+    assert backend.get("a") == 1
+    assert backend.get("b") is None
+    assert backend.get("c") == 3
+
+
+def test_memory_backend_expires_entries():
+    """Test entries are not returned after their TTL."""
+    backend = MemoryBackend()
+    backend.set("k", "v", ttl=0)
+    time.sleep(0.01)
+    assert backend.get("k") is None
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    """Test two backends on the same file (two workers) see each other's writes."""
+    path = str(tmp_path / "cache.db")
+    worker_a = SQLiteBackend(path)
+    worker_b = SQLiteBackend(path)
+    worker_a.set("dashboard:1:v1", {"client_count": 3}, ttl=60)
+    assert worker_b.get("dashboard:1:v1") == {"client_count": 3}
+    worker_b.set("expired", {"x": 1}, ttl=0)
+    assert worker_a.get("expired") is None
+
+
+def test_memory_backend_counts_exactly_under_threads():
+    """Test concurrent increments are not lost."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    backend = MemoryBackend()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: backend.incr("hits"), range(2000)))
+    assert backend.counters() == {"hits": 2000, "misses": 0}
+
+
+def test_sqlite_backend_shares_counters_between_instances(tmp_path):
+    """Test two workers on the same file add to the same totals."""
+    path = str(tmp_path / "cache.db")
+    worker_a = SQLiteBackend(path)
+    worker_b = SQLiteBackend(path)
+    assert worker_a.counters() == {"hits": 0, "misses": 0}
+    worker_a.incr("hits")
+    worker_b.incr("hits")
+    worker_b.incr("misses")
+    assert worker_a.counters() == {"hits": 2, "misses": 1}
+
+
+def test_dashboard_lookups_are_counted(client, login):
+    """Test each cached GET adds one hit or one miss to the totals."""
+    from app.extensions import response_cache
+
+    login(client, 305)
+    before = response_cache.metrics()
+    client.get("/api/dashboard")
+    client.get("/api/dashboard")
+    after = response_cache.metrics()
+    assert after["hits"] - before["hits"] == 1
+    assert after["misses"] - before["misses"] == 1
+    assert after["hit_ratio"] == round(after["hits"] / (after["hits"] + after["misses"]), 4)
+
+
+def test_cache_stats_reports_totals_shared_by_workers(monkeypatch, tmp_path):
+    """Test `flask cache-stats` sums the lookups of every worker on the sqlite backend."""
+    from app.config import TestingConfig
+
+    monkeypatch.setattr(TestingConfig, "CACHE_BACKEND", "sqlite")
+    monkeypatch.setattr(TestingConfig, "CACHE_SQLITE_PATH", str(tmp_path / "cache.db"))
+    worker_a, worker_b = create_app("testing"), create_app("testing")
+    with worker_a.app_context():
+        worker_a.extensions["response_cache"]["backend"].incr("hits")
+        worker_a.extensions["response_cache"]["backend"].incr("misses")
+    with worker_b.app_context():
+        worker_b.extensions["response_cache"]["backend"].incr("hits")
+        result = worker_b.test_cli_runner().invoke(args=["cache-stats"])
+    assert result.exit_code == 0
+    assert "hits 2, misses 1, hit ratio 66.7%" in result.output
+
+
+def test_lookup_totals_are_logged_every_n_lookups(app, caplog):
+    """Test a worker logs its running totals every CACHE_METRICS_LOG_EVERY lookups."""
+    from app.extensions import response_cache
+
+    app.config["CACHE_METRICS_LOG_EVERY"] = 2
+    with app.test_request_context(), caplog.at_level("INFO", logger="app.cache"):
+        for _ in range(3):
+            response_cache.get_or_compute("test", 306, lambda: {"x": 1})
+    totals = [r for r in caplog.records if r.getMessage() == "response_cache_totals"]
+    assert len(totals) == 1
+    assert (totals[0].hits, totals[0].misses) == (1, 1)
+
+
+def test_dashboard_cache_hits_and_invalidates_on_write(client, login):
+    """Test GET /api/dashboard is served from cache until the user writes."""
+    login(client, 301)
+
+    first = client.get("/api/dashboard")
+    assert first.headers["X-Cache"] == "MISS"
+    second = client.get("/api/dashboard")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.get_json() == first.get_json()
+
+    client.post("/api/clients", json={"name": "Cached", "email": "c@c.com"})
+    third = client.get("/api/dashboard")
+    assert third.headers["X-Cache"] == "MISS"
+    assert third.get_json()["data"]["client_count"] == first.get_json()["data"]["client_count"] + 1
+
+
+def test_dashboard_cache_is_per_user(client, login):
+    """Test one user's write does not invalidate another user's entry."""
+    login(client, 302)
+    client.get("/api/dashboard")
+
+    login(client, 303)
+    client.post("/api/clients", json={"name": "Other", "email": "o@o.com"})
+
+    login(client, 302)
+    assert client.get("/api/dashboard").headers["X-Cache"] == "HIT"
+
+
+def test_dashboard_cache_expires_at_utc_midnight(client, login, monkeypatch):
+    """Test the dashboard entry is not served past the UTC date it was computed on."""
+    from datetime import datetime, timezone
+    from types import SimpleNamespace
+
+    frozen = {"now": datetime(2030, 1, 1, 23, 59, 30, tzinfo=timezone.utc), "clock": 1000.0}
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return frozen["now"]
+
+    monkeypatch.setattr("app.api.dashboard.datetime", FrozenDatetime)
+    monkeypatch.setattr("app.cache.time", SimpleNamespace(time=lambda: frozen["clock"]))
+    login(client, 304)
+
+    assert client.get("/api/dashboard").headers["X-Cache"] == "MISS"
+    frozen["now"], frozen["clock"] = datetime(2030, 1, 1, 23, 59, 50, tzinfo=timezone.utc), 1020.0
+    assert client.get("/api/dashboard").headers["X-Cache"] == "HIT"
+
+    # 30 s after the first request the UTC date has rolled over
+    frozen["now"], frozen["clock"] = datetime(2030, 1, 2, 0, 0, 1, tzinfo=timezone.utc), 1031.0
+    assert client.get("/api/dashboard").headers["X-Cache"] == "MISS"
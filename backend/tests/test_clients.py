@@ -77,3 +77,83 @@ def test_delete_client(auth_client):
     # Verify it's gone
     get_resp = auth_client.get(f"/api/clients/{client_id}")
     assert get_resp.status_code == 404
+
+
+def test_delete_client_cascades_in_database(client, login, assert_max_queries):
+    """Test deleting a client removes its projects and deliverables without loading them."""
+    from app.extensions import db
+    from app.models import Project, Deliverable
+
+    login(client, 103)
+    client_id = client.post("/api/clients", json={"name": "Big", "email": "b@b.com"}).get_json()["data"]["id"]
+    project_ids = []
+    for i in range(5):
+        pid = client.post("/api/projects", json={"client_id": client_id, "title": f"P{i}"}).get_json()["data"]["id"]
+        project_ids.append(pid)
+        for j in range(4):
+            client.post(f"/api/projects/{pid}/deliverables", json={"title": f"D{j}"})
+
+    with assert_max_queries(12) as statements:
+        assert client.delete(f"/api/clients/{client_id}").status_code == 200
+    # No child rows are loaded into the session (the stats aggregate is fine)
+    assert not [s for s in statements if s.startswith(("SELECT projects.", "SELECT deliverables."))]
+    assert sum(s.startswith("DELETE") for s in statements) == 1
+
+    assert Project.query.filter(Project.id.in_(project_ids)).count() == 0
+    assert Deliverable.query.filter(Deliverable.project_id.in_(project_ids)).count() == 0
+    db.session.remove()
+
+
+def test_list_clients_paginates_with_cursor(client, login):
+    """Test GET /api/clients walks every client exactly once via next_cursor."""
+    login(client, 101)
+    for i in range(5):
+        client.post("/api/clients", json={"name": f"Page {i}", "email": f"p{i}@p.com"})
+
+    seen = []
+    resp = client.get("/api/clients?limit=2").get_json()
+    seen += [c["name"] for c in resp["data"]]
+    while resp["next_cursor"]:
+        resp = client.get(f"/api/clients?limit=2&cursor={resp['next_cursor']}").get_json()
+        assert len(resp["data"]) <= 2
+        seen += [c["name"] for c in resp["data"]]
+
+    assert seen == [f"Page {i}" for i in reversed(range(5))]
+
+
+def test_list_clients_invalid_cursor(auth_client):
+    """Test GET /api/clients rejects malformed cursors and page sizes."""
+    response = auth_client.get("/api/clients?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.get_json()["error"]["code"] == "INVALID_CURSOR"
+
+    response = auth_client.get("/api/clients?limit=0")
+    assert response.status_code == 400
+    assert response.get_json()["error"]["code"] == "VALIDATION_ERROR"
+
+
+def test_list_clients_rejects_null_cursor_value_for_required_column(auth_client):
+    """Test a cursor with a null created_at is a 400, not an empty page."""
+    from app.api.pagination import encode_cursor
+
+    response = auth_client.get(f"/api/clients?cursor={encode_cursor('-created_at', None, 1)}")
+    assert response.status_code == 400
+    assert response.get_json()["error"]["code"] == "INVALID_CURSOR"
+
+
+def test_get_client_includes_projects(client, login, assert_max_queries):
+    """Test ?include=projects nests the client's projects, newest first."""
+    login(client, 105)
+    client_id = client.post("/api/clients", json={"name": "Inc", "email": "i@i.com"}).get_json()["data"]["id"]
+    for title in ("First", "Second"):
+        client.post("/api/projects", json={"client_id": client_id, "title": title})
+
+    # ETag version, client, projects
+    with assert_max_queries(3):
+        resp = client.get(f"/api/clients/{client_id}?include=projects")
+    data = resp.get_json()["data"]
+    assert data["name"] == "Inc"
+    assert [p["title"] for p in data["projects"]] == ["Second", "First"]
+
+    login(client, 106)
+    assert client.get(f"/api/clients/{client_id}?include=projects").status_code == 404
@@ -0,0 +1,162 @@
+"""Tests for the database engine profile (app/database.py)."""
+
+from sqlalchemy import create_engine
+from app.config import Config
+from app.database import build_engine_options, apply_sqlite_pragmas, sqlite_pragma_values
+
+
+def _config(uri, **overrides):
+    config = {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+    config["SQLALCHEMY_DATABASE_URI"] = uri
+    config.update(overrides)
+    return config
+
+
+def test_sqlite_profile_applied_to_new_connections(tmp_path):
+    """Test every new file SQLite connection runs with the configured PRAGMAs."""
+    config = _config(f"sqlite:///{tmp_path / 'app.db'}")
+    engine = create_engine(config["SQLALCHEMY_DATABASE_URI"], **build_engine_options(config))
+    apply_sqlite_pragmas(engine, config["SQLITE_PRAGMAS"])
+
+    with engine.connect() as conn:
+        values = sqlite_pragma_values(
+            conn, ["journal_mode", "synchronous", "busy_timeout", "temp_store", "cache_size"]
+        )
+    assert values == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "busy_timeout": 5000,
+        "temp_store": 2,  # MEMORY
+        "cache_size": -65536,
+    }
+    engine.dispose()
+
+
+def test_sqlite_profile_can_be_disabled(tmp_path):
+    """Test an empty SQLITE_PRAGMAS leaves SQLite's defaults alone."""
+    config = _config(f"sqlite:///{tmp_path / 'plain.db'}", SQLITE_PRAGMAS={})
+    engine = create_engine(config["SQLALCHEMY_DATABASE_URI"], **build_engine_options(config))
+    apply_sqlite_pragmas(engine, config["SQLITE_PRAGMAS"])
+
+    with engine.connect() as conn:
+        assert sqlite_pragma_values(conn, ["journal_mode", "foreign_keys"]) == {
+            "journal_mode": "delete",
+            "foreign_keys": 1,  # always on: deletes rely on ON DELETE CASCADE
+        }
+    engine.dispose()
+
+
+def test_foreign_keys_cannot_be_turned_off_by_the_profile(tmp_path):
+    """Test a profile that sets foreign_keys=OFF is overridden."""
+    config = _config(f"sqlite:///{tmp_path / 'fk.db'}", SQLITE_PRAGMAS={"foreign_keys": "OFF"})
+    engine = create_engine(config["SQLALCHEMY_DATABASE_URI"], **build_engine_options(config))
+    apply_sqlite_pragmas(engine, config["SQLITE_PRAGMAS"])
+
+    with engine.connect() as conn:
+        assert sqlite_pragma_values(conn, ["foreign_keys"]) == {"foreign_keys": 1}
+    engine.dispose()
+
+
+def test_server_database_gets_pool_sizing():
+    """Test non-SQLite URLs get pool options, and explicit options win."""
+    config = _config(
+        "postgresql://localhost/clientpilot",
+        DB_POOL_SIZE=7,
+        SQLALCHEMY_ENGINE_OPTIONS={"pool_recycle": 60},
+    )
+    options = build_engine_options(config)
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == Config.DB_MAX_OVERFLOW
+    assert options["pool_recycle"] == 60
+    assert options["pool_pre_ping"] is True
+    assert "pool_size" not in build_engine_options(_config("sqlite:///x.db"))
+
+
+def test_cascade_foreign_keys_migrates_legacy_tables():
+    """Test the migration rebuilds a table whose FK lacks ON DELETE CASCADE."""
+    from sqlalchemy.schema import CreateTable
+    from app import create_app
+    from app.commands import _missing_cascades, _rebuild_sqlite_table
+    from app.extensions import db
+    from app.models import User, Client, Project, Deliverable
+    from app.search import search
+
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        user = User(username="legacy", email="legacy@example.com", password_hash="!")
+        db.session.add(user)
+        db.session.commit()
+        client = Client(user_id=user.id, name="C", email="c@example.com")
+        project = Project(client=client, title="P")
+        db.session.add_all([client, project, Deliverable(project=project, title="D")])
+        db.session.commit()
+        user_id, client_id, project_id = user.id, client.id, project.id
+        db.session.remove()
+
+        # Recreate projects as an old database had it
+        table = Project.__table__
+        legacy_ddl = str(CreateTable(table).compile(db.engine)).replace(" ON DELETE CASCADE", "").strip()
+        with db.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            _rebuild_sqlite_table(conn, table, legacy_ddl)
+            # ... and without the search triggers, which it may predate
+            for trigger in ("insert", "delete", "update"):
+                conn.exec_driver_sql(f"DROP TRIGGER search_projects_{trigger}")
+            conn.commit()
+            conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+            assert [t.name for t, _ in _missing_cascades(conn)] == ["projects"]
+
+        result = app.test_cli_runner().invoke(args=["cascade-foreign-keys"])
+        assert "projects: ON DELETE CASCADE missing for clients" in result.output
+        assert "Migrated 1 table(s)" in result.output
+        with db.engine.connect() as conn:
+            assert _missing_cascades(conn) == []
+            triggers = conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'projects'"
+            ).scalars().all()
+        assert sorted(triggers) == [
+            "search_projects_delete", "search_projects_insert", "search_projects_update",
+        ]
+        assert db.session.get(Project, project_id).title == "P"
+
+        # Search follows writes to the rebuilt table again
+        db.session.get(Project, project_id).title = "Rocket launch"
+        db.session.add(Project(client_id=client_id, title="Rocket fuel"))
+        db.session.commit()
+        assert sorted(r["title"] for r in search(user_id, "rocket", 10)) == [
+            "<mark>Rocket</mark> fuel", "<mark>Rocket</mark> launch",
+        ]
+
+        db.session.delete(db.session.get(Client, client_id))
+        db.session.commit()
+        assert Project.query.count() == 0
+        assert Deliverable.query.count() == 0
+        db.session.remove()
+        db.drop_all()
+
+
+def test_add_insert_sentinels_upgrades_existing_tables():
+    """Test batched inserts return ids in input order once the column is added."""
+    from app import create_app
+    from app.extensions import db
+    from app.models import User, Client
+    from app.models.bulk_writes import insert_clients
+
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        with db.engine.begin() as conn:  # as a database created before the column
+            conn.exec_driver_sql("ALTER TABLE clients DROP COLUMN _sentinel")
+        db.session.add(User(id=1, username="s", email="s@example.com", password_hash="!"))
+        db.session.commit()
+
+        result = app.test_cli_runner().invoke(args=["add-insert-sentinels"])
+        assert result.output == "Added clients._sentinel\n"
+        assert app.test_cli_runner().invoke(args=["add-insert-sentinels"]).output == ""
+
+        names = [f"Client {i}" for i in range(5)]
+        ids = insert_clients(1, [{"name": name, "email": "c@example.com"} for name in names])
+        assert [db.session.get(Client, client_id).name for client_id in ids] == names
+        db.session.remove()
+        db.drop_all()
@@ -55,18 +55,16 @@ def test_deliverable_state_machine_api(auth_client):
     assert r.get_json()["error"]["code"] == "INVALID_STATE_TRANSITION"
 
 
-def test_deliverable_user_scoping(client):
+def test_deliverable_user_scoping(client, login):
     """Test that User B cannot see User A's deliverables."""
     # 1. User A creates a deliverable
-    with client.session_transaction() as sess:
-        sess["user_id"] = 1
-    client.post("/api/clients", json={"name": "A", "email": "a@a.com"})
-    client.post("/api/projects", json={"client_id": 1, "title": "P"})
-    did = client.post("/api/deliverables", json={"project_id": 1, "title": "Secret"}).get_json()["data"]["id"]
+    login(client, 1)
+    client_id = client.post("/api/clients", json={"name": "A", "email": "a@a.com"}).get_json()["data"]["id"]
+    project_id = client.post("/api/projects", json={"client_id": client_id, "title": "P"}).get_json()["data"]["id"]
+    did = client.post("/api/deliverables", json={"project_id": project_id, "title": "Secret"}).get_json()["data"]["id"]
     
     # 2. User B tries to access it
-    with client.session_transaction() as sess:
-        sess["user_id"] = 2
+    login(client, 2)
     r = client.get(f"/api/deliverables/{did}")
     assert r.status_code == 404
 
@@ -85,3 +83,207 @@ def test_delete_deliverable(auth_client):
     
     # Verify gone
     assert auth_client.get(f"/api/deliverables/{del_id}").status_code == 404
+
+
+def test_owner_id_follows_reassignment(app):
+    """Test owner_id is stamped on insert and re-derived when a client moves users."""
+    from app.extensions import db
+    from app.models import User, Client, Project, Deliverable
+
+    db.session.add_all(
+        User(id=uid, username=f"owner{uid}", email=f"owner{uid}@o.com", password_hash="!")
+        for uid in (201, 202, 203)
+    )
+    c = Client(user_id=201, name="Owner", email="o@o.com")
+    p = Project(client=c, title="P")
+    d = Deliverable(project=p, title="D")
+    db.session.add_all([c, p, d])
+    db.session.commit()
+    assert (p.owner_id, d.owner_id) == (201, 201)
+
+    c.user_id = 202
+    db.session.commit()
+    db.session.expire_all()
+    assert db.session.get(Project, p.id).owner_id == 202
+    assert db.session.get(Deliverable, d.id).owner_id == 202
+
+    other = Client(user_id=203, name="Other", email="x@x.com")
+    db.session.add(other)
+    p.client = other
+    db.session.commit()
+    db.session.expire_all()
+    assert db.session.get(Deliverable, d.id).owner_id == 203
+
+
+def _project_for(client, login, user_id):
+    login(client, user_id)
+    client_id = client.post("/api/clients", json={"name": "B", "email": "b@b.com"}).get_json()["data"]["id"]
+    return client.post("/api/projects", json={"client_id": client_id, "title": "P"}).get_json()["data"]["id"]
+
+
+def test_batch_create_deliverables(client, login, assert_max_queries):
+    """Test POST /deliverables/batch inserts every item in one statement and keeps counters in step."""
+    from app.models.project_counters import find_counter_drift
+
+    project_id = _project_for(client, login, 401)
+    items = [{"title": f"Item {i}", "due_date": "2999-01-01"} for i in range(40)]
+
+    with assert_max_queries(10) as statements:
+        resp = client.post(f"/api/projects/{project_id}/deliverables/batch", json=items)
+    assert resp.status_code == 201
+    assert sum(s.startswith("INSERT INTO deliverables") for s in statements) == 1
+
+    data = resp.get_json()["data"]
+    assert [d["title"] for d in data] == [f"Item {i}" for i in range(40)]
+    assert all(d["status"] == "planned" and d["project_id"] == project_id for d in data)
+
+    project = client.get(f"/api/projects/{project_id}").get_json()["data"]
+    assert project["deliverable_count"] == 40
+    assert client.get("/api/dashboard").get_json()["data"]["pending_deliverable_count"] == 40
+    assert find_counter_drift() == []
+
+
+def test_batch_create_is_all_or_nothing(client, login):
+    """Test one invalid item rejects the whole batch with per-item errors."""
+    project_id = _project_for(client, login, 402)
+    items = [{"title": "Fine"}, {"title": ""}, {"due_date": "not-a-date"}]
+
+    resp = client.post(f"/api/projects/{project_id}/deliverables/batch", json=items)
+    assert resp.status_code == 400
+    error = resp.get_json()["error"]
+    assert error["code"] == "VALIDATION_ERROR"
+    assert set(error["details"]) == {"1", "2"}
+    assert "title" in error["details"]["2"] and "due_date" in error["details"]["2"]
+    assert client.get(f"/api/projects/{project_id}/deliverables").get_json()["data"] == []
+
+    resp = client.post(f"/api/projects/{project_id}/deliverables/batch", json={"title": "Not a list"})
+    assert resp.get_json()["error"]["code"] == "INVALID_BATCH"
+
+
+def test_batch_create_keeps_request_order_when_ids_do_not(client, login, monkeypatch):
+    """Test the batch response follows the request even if ids are assigned out of order."""
+    from app.models import bulk_writes
+
+    insert_rows = bulk_writes._insert_rows
+
+    def insert_rows_backwards(model, rows):
+        # As a database free to number rows in any order: the last item gets the lowest id
+        return insert_rows(model, rows[::-1])[::-1]
+
+    project_id = _project_for(client, login, 905)
+    monkeypatch.setattr(bulk_writes, "_insert_rows", insert_rows_backwards)
+    items = [{"title": f"Step {i}"} for i in range(5)]
+
+    resp = client.post(f"/api/projects/{project_id}/deliverables/batch", json=items)
+    assert resp.status_code == 201
+    data = resp.get_json()["data"]
+    assert [d["title"] for d in data] == [f"Step {i}" for i in range(5)]
+    assert [d["id"] for d in data] == sorted((d["id"] for d in data), reverse=True)
+
+
+def test_batch_create_checks_ownership(client, login):
+    """Test a batch for another user's project is a 404."""
+    project_id = _project_for(client, login, 403)
+    login(client, 404)
+    resp = client.post(f"/api/projects/{project_id}/deliverables/batch", json=[{"title": "X"}])
+    assert resp.status_code == 404
+
+
+def test_bulk_transition_deliverables(client, login, assert_max_queries):
+    """Test PATCH /deliverables/status moves valid ids in one UPDATE and explains the rest."""
+    from app.models.project_counters import find_counter_drift
+
+    project_id = _project_for(client, login, 405)
+    items = [{"title": f"D{i}"} for i in range(4)]
+    ids = [d["id"] for d in client.post(
+        f"/api/projects/{project_id}/deliverables/batch", json=items
+    ).get_json()["data"]]
+    client.patch(f"/api/deliverables/{ids[0]}/status", json={"status": "in_progress"})
+
+    login(client, 406)
+    foreign = _project_for(client, login, 406)
+    foreign_id = client.post(
+        f"/api/projects/{foreign}/deliverables", json={"title": "Theirs"}
+    ).get_json()["data"]["id"]
+
+    login(client, 405)
+    with assert_max_queries(12) as statements:
+        resp = client.patch("/api/deliverables/status", json={
+            "ids": [ids[1], ids[0], ids[2], foreign_id, ids[2]], "status": "in_progress",
+        })
+    assert resp.status_code == 200
+    assert sum(s.startswith("UPDATE deliverables") for s in statements) == 1
+
+    data = resp.get_json()["data"]
+    assert data["transitioned"] == [ids[1], ids[2]]
+    assert [(r["id"], r["code"]) for r in data["rejected"]] == [
+        (ids[0], "INVALID_STATE_TRANSITION"),
+        (foreign_id, "NOT_FOUND"),
+    ]
+    assert data["rejected"][0]["details"]["valid_transitions"] == ["blocked", "completed"]
+
+    resp = client.patch("/api/deliverables/status", json={"ids": ids[:3], "status": "completed"})
+    assert resp.get_json()["data"]["transitioned"] == ids[:3]
+    project = client.get(f"/api/projects/{project_id}").get_json()["data"]
+    assert (project["deliverable_count"], project["completed_deliverable_count"]) == (4, 3)
+    assert client.get("/api/dashboard").get_json()["data"]["pending_deliverable_count"] == 1
+    assert find_counter_drift() == []
+
+
+def test_bulk_transition_validates_payload(client, login):
+    """Test an unknown status or an empty id list is a validation error."""
+    login(client, 407)
+    resp = client.patch("/api/deliverables/status", json={"ids": [], "status": "done"})
+    assert resp.status_code == 400
+    assert set(resp.get_json()["error"]["details"]) == {"ids", "status"}
+
+
+def test_list_deliverables_filters_sorts_and_facets(client, login):
+    """Test ?status=, ?due_before=, ?sort=due_date paging and ?facets=status."""
+    project_id = _project_for(client, login, 408)
+    dues = ["2030-03-01", None, "2030-01-01", "2030-02-01", None]
+    ids = [
+        client.post(f"/api/projects/{project_id}/deliverables", json={"title": f"D{i}", "due_date": due})
+        .get_json()["data"]["id"]
+        for i, due in enumerate(dues)
+    ]
+    client.patch(f"/api/deliverables/{ids[0]}/status", json={"status": "in_progress"})
+
+    # Undated rows trail in both directions, across page boundaries
+    seen, cursor = [], None
+    while True:
+        url = "/api/deliverables?sort=due_date&limit=2" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(url).get_json()
+        seen += [d["id"] for d in page["data"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [ids[2], ids[3], ids[0], ids[1], ids[4]]
+    desc = client.get("/api/deliverables?sort=-due_date").get_json()["data"]
+    assert [d["id"] for d in desc] == [ids[0], ids[3], ids[2], ids[4], ids[1]]
+
+    body = client.get(
+        "/api/deliverables?status=planned&due_before=2030-02-15&facets=status&fields=id"
+    ).get_json()
+    assert sorted(d["id"] for d in body["data"]) == [ids[2], ids[3]]
+    # The status facet ignores ?status= so every option shows its count
+    assert body["facets"]["status"] == {"blocked": 0, "completed": 0, "in_progress": 0, "planned": 2}
+
+    other = _project_for(client, login, 408)
+    client.post(f"/api/projects/{other}/deliverables", json={"title": "Elsewhere"})
+    assert len(client.get(f"/api/deliverables?project_id={other}").get_json()["data"]) == 1
+
+
+def test_list_deliverables_rejects_unknown_sort_and_stale_cursor(client, login):
+    """Test sort is whitelisted and a cursor only works for the sort it came from."""
+    project_id = _project_for(client, login, 409)
+    for i in range(3):
+        client.post(f"/api/projects/{project_id}/deliverables", json={"title": f"D{i}"})
+
+    resp = client.get("/api/deliverables?sort=description")
+    assert resp.status_code == 400
+    assert "sort" in resp.get_json()["error"]["details"]
+
+    cursor = client.get("/api/deliverables?limit=1").get_json()["next_cursor"]
+    resp = client.get(f"/api/deliverables?limit=1&sort=due_date&cursor={cursor}")
+    assert resp.get_json()["error"]["code"] == "INVALID_CURSOR"
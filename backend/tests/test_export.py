@@ -0,0 +1,110 @@
+"""Tests for the streamed account export (app/export.py, GET /api/export)."""
+
+import csv
+import io
+import json
+import zipfile
+from app.export import EXPORT_TABLES, stream_export
+from app.extensions import db
+
+
+# A comma and quotes for CSV, non-ASCII, a date and JSON in every exported table
+SEEDED = {
+    "client_fields": {"name": 'Acme, "Rockets"', "email": "a@acme.com", "notes": "Café"},
+    "projects": [{"title": "Launch", "deadline": "2030-01-01", "deliverables": [{"title": "Fuel report"}]}],
+    "agent_run": {"action": "risk_analysis", "status": "completed", "steps": [
+        {"step_number": 1, "action": "call_gemini", "input_data": {"prompt": "hi"}},
+    ]},
+}
+
+
+def _archive(resp):
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/zip"
+    return zipfile.ZipFile(io.BytesIO(resp.data))
+
+
+def test_ndjson_export_is_complete_and_scoped(client, seed):
+    """Test every table is exported with the manifest's columns, and only the user's rows."""
+    seed(client, 601, **SEEDED)
+    tree = seed(client, 602, **SEEDED)
+    client_id, (project_id,) = tree.client_id, tree.project_ids
+
+    archive = _archive(client.get("/api/export"))
+    manifest = json.loads(archive.read("manifest.json"))
+    assert archive.namelist() == ["manifest.json"] + [t["file"] for t in manifest["tables"]]
+    assert (manifest["format"], manifest["version"], manifest["encoding"]) == ("clientpilot-export", 1, "ndjson")
+
+    tables = {
+        t["name"]: [json.loads(line) for line in archive.read(t["file"]).splitlines()]
+        for t in manifest["tables"]
+    }
+    for table in manifest["tables"]:
+        for row in tables[table["name"]]:
+            assert list(row) == [c["name"] for c in table["columns"]]
+
+    assert [c["id"] for c in tables["clients"]] == [client_id]
+    assert tables["clients"][0]["notes"] == "Café"
+    assert tables["projects"][0]["client_id"] == client_id
+    assert tables["projects"][0]["deadline"] == "2030-01-01"
+    assert tables["deliverables"][0]["project_id"] == project_id
+    assert tables["step_runs"][0]["agent_run_id"] == tables["agent_runs"][0]["id"]
+    assert tables["step_runs"][0]["input_data"] == {"prompt": "hi"}
+
+
+def test_csv_export_has_header_rows(client, seed):
+    """Test CSV files start with the manifest's columns and encode NULL and JSON as text."""
+    seed(client, 603, **SEEDED)
+
+    archive = _archive(client.get("/api/export?format=csv"))
+    manifest = json.loads(archive.read("manifest.json"))
+    rows = {
+        t["name"]: list(csv.reader(io.StringIO(archive.read(t["file"]).decode())))
+        for t in manifest["tables"]
+    }
+    for table in manifest["tables"]:
+        assert rows[table["name"]][0] == [c["name"] for c in table["columns"]]
+
+    header, client_row = rows["clients"]
+    assert dict(zip(header, client_row))["name"] == 'Acme, "Rockets"'
+    assert dict(zip(header, client_row))["company"] == ""
+    header, step = rows["step_runs"]
+    assert json.loads(dict(zip(header, step))["input_data"]) == {"prompt": "hi"}
+
+    assert client.get("/api/export?format=xml").status_code == 400
+
+
+def test_export_streams_in_chunks(app, client, seed):
+    """Test the response is streamed and rows are read a chunk at a time."""
+    (project_id,) = seed(client, 604, **SEEDED).project_ids
+    client.post(f"/api/projects/{project_id}/deliverables/batch", json=[{"title": f"D{i}"} for i in range(9)])
+
+    resp = client.get("/api/export")
+    assert resp.is_streamed
+    with app.app_context():
+        chunks = list(stream_export(604, chunk_size=2))
+    assert len(chunks) > len(EXPORT_TABLES) + 5
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert len(archive.read("deliverables.ndjson").splitlines()) == 10
+
+
+def test_export_is_one_snapshot_while_writes_land(tmp_path, monkeypatch, seed):
+    """Test rows committed mid-export, on another connection, are not exported."""
+    from app import create_app
+    from app.config import TestingConfig
+    from app.models import Project
+
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'export.db'}")
+    app = create_app("testing")
+    client_id = seed(app.test_client(), 605, **SEEDED).client_id
+
+    with app.app_context():
+        chunks = stream_export(605, chunk_size=1)
+        started = [next(chunks), next(chunks)]  # manifest, then the first client rows
+        with db.engine.begin() as writer:
+            writer.execute(db.insert(Project.__table__).values(
+                client_id=client_id, owner_id=605, title="Late", status="active",
+            ))
+        archive = zipfile.ZipFile(io.BytesIO(b"".join([*started, *chunks])))
+    titles = [json.loads(line)["title"] for line in archive.read("projects.ndjson").splitlines()]
+    assert titles == ["Launch"]
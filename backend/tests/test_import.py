@@ -0,0 +1,132 @@
+"""Tests for chunked bulk import (app/importer.py, POST /api/import, flask import-data)."""
+
+import io
+import json
+from datetime import datetime, timezone
+from app.extensions import db
+from app.importer import import_tables, read_rows
+from app.models import Project, UserStats
+from app.models.project_counters import find_counter_drift
+from app.models.user_stats import COUNTER_FIELDS, compute_user_counts
+
+CLIENTS_CSV = (
+    "id,name,email,company\n"
+    "acme,Acme,ops@acme.com,Acme Corp\n"
+    "bad,Bad,not-an-email,\n"
+    "globex,Globex,hi@globex.com,\n"
+)
+PROJECTS_NDJSON = "\n".join(json.dumps(row) for row in [
+    {"id": "site", "client_id": "acme", "title": "Website", "deadline": "2030-01-01"},
+    {"id": "app", "client_id": "globex", "title": "App", "status": "completed"},
+    {"id": "lost", "client_id": "bad", "title": "Orphan"},
+])
+DELIVERABLES_CSV = (
+    "project_id,title,due_date\n"
+    "site,Wireframes,2000-01-01\n"
+    "site,Copy,\n"
+    "app,Prototype,\n"
+    "lost,Nothing,\n"
+)
+
+
+def _assert_derived_data_consistent(user_id):
+    stats = db.session.get(UserStats, user_id).to_dict()
+    expected = compute_user_counts(user_id, datetime.now(timezone.utc))
+    assert {f: stats[f] for f in COUNTER_FIELDS} == expected
+    owned = {p.id for p in Project.query.filter_by(owner_id=user_id)}
+    assert [d for d in find_counter_drift() if d[0] in owned] == []
+
+
+def test_import_files_resolves_keys_and_reports_bad_rows(app, client, login):
+    """Test per-table files import with key references, skipping invalid rows."""
+    login(client, 701)
+    resp = client.post("/api/import", content_type="multipart/form-data", data={
+        "clients": (io.BytesIO(CLIENTS_CSV.encode()), "clients.csv"),
+        "projects": (io.BytesIO(PROJECTS_NDJSON.encode()), "projects.ndjson"),
+        "deliverables": (io.BytesIO(DELIVERABLES_CSV.encode()), "deliverables.csv"),
+    })
+    assert resp.status_code == 200
+    report = resp.get_json()["data"]
+    assert report["tables"] == {
+        "clients": {"rows": 3, "imported": 2, "failed": 1},
+        "projects": {"rows": 3, "imported": 2, "failed": 1},
+        "deliverables": {"rows": 4, "imported": 3, "failed": 1},
+    }
+    assert [(e["table"], e["line"], e["key"], e["code"]) for e in report["errors"]] == [
+        ("clients", 3, "bad", "VALIDATION_ERROR"),
+        ("projects", 3, "lost", "INVALID_REFERENCE"),
+        ("deliverables", 5, None, "INVALID_REFERENCE"),
+    ]
+    assert "email" in report["errors"][0]["details"]
+
+    projects = {p["title"]: p for p in client.get("/api/projects").get_json()["data"]}
+    assert projects["App"]["status"] == "active"  # status goes through the state machine
+    assert projects["Website"]["deadline"] == "2030-01-01"
+    site = client.get(f"/api/projects/{projects['Website']['id']}?include=deliverables,client").get_json()["data"]
+    assert site["client"]["name"] == "Acme"
+    assert sorted(d["title"] for d in site["deliverables"]) == ["Copy", "Wireframes"]
+    assert client.get("/api/search?q=wireframes").get_json()["data"][0]["type"] == "deliverable"
+
+    with app.app_context():
+        _assert_derived_data_consistent(701)
+
+
+def test_import_commits_in_chunks_and_isolates_errors(app, login, client):
+    """Test chunked inserts, malformed lines and duplicate keys."""
+    login(client, 702)
+    lines = [json.dumps({"id": f"c{i}", "name": f"Client {i}", "email": f"c{i}@x.com"}) for i in range(7)]
+    lines[3] = "{not json"
+    lines.append(json.dumps({"id": "c1", "name": "Again", "email": "again@x.com"}))
+    chunks = []
+
+    with app.app_context():
+        report = import_tables(
+            702,
+            {"clients": read_rows(io.BytesIO("\n".join(lines).encode()), "ndjson")},
+            chunk_size=2,
+            progress=lambda table, counts: chunks.append(counts["imported"]),
+        )
+        assert report["tables"]["clients"] == {"rows": 8, "imported": 6, "failed": 2}
+        assert [e["code"] for e in report["errors"]] == ["INVALID_ROW", "DUPLICATE_KEY"]
+        assert chunks == [2, 4, 6, 6]
+        _assert_derived_data_consistent(702)
+
+
+def test_export_archive_round_trips(client, login):
+    """Test an export archive imports into another account with the same data."""
+    login(client, 703)
+    client_id = client.post("/api/clients", json={"name": "Acme", "email": "a@acme.com"}).get_json()["data"]["id"]
+    project_id = client.post("/api/projects", json={"client_id": client_id, "title": "Site"}).get_json()["data"]["id"]
+    client.post(f"/api/projects/{project_id}/deliverables/batch", json=[{"title": "One"}, {"title": "Two"}])
+    archive = client.get("/api/export").data
+
+    login(client, 704)
+    resp = client.post("/api/import", content_type="multipart/form-data", data={
+        "archive": (io.BytesIO(archive), "export.zip"),
+    })
+    assert resp.get_json()["data"]["errors"] == []
+    projects = client.get("/api/projects?include=deliverables").get_json()["data"]
+    assert [(p["title"], p["progress_percentage"]) for p in projects] == [("Site", 0)]
+    assert sorted(d["title"] for d in client.get("/api/deliverables").get_json()["data"]) == ["One", "Two"]
+
+    resp = client.post("/api/import", content_type="multipart/form-data", data={
+        "archive": (io.BytesIO(b"not a zip"), "export.zip"),
+    })
+    assert resp.get_json()["error"]["code"] == "INVALID_IMPORT"
+    assert client.post("/api/import", content_type="multipart/form-data", data={}).status_code == 400
+
+
+def test_import_data_command(app, login, client, tmp_path):
+    """Test the CLI imports files, prints progress and exits non-zero on bad rows."""
+    login(client, 705)
+    (tmp_path / "clients.csv").write_text(CLIENTS_CSV)
+    (tmp_path / "projects.jsonl").write_text(PROJECTS_NDJSON)
+
+    result = app.test_cli_runner().invoke(args=[
+        "import-data", "705",
+        "--clients", str(tmp_path / "clients.csv"),
+        "--projects", str(tmp_path / "projects.jsonl"),
+    ])
+    assert "clients: 3 rows, 2 imported, 1 failed" in result.output
+    assert "Imported 4 row(s)" in result.output
+    assert result.exit_code == 1
@@ -0,0 +1,109 @@
+"""Parity tests: the orjson and stdlib JSON providers must emit identical bytes."""
+
+import inspect
+from datetime import date, datetime, timezone
+import pytest
+from app import json_provider, schemas
+from app.extensions import db
+from app.json_provider import OrjsonProvider, StdlibJSONProvider, init_json_provider
+
+RESPONSE_SCHEMAS = [
+    cls for name, cls in inspect.getmembers(schemas, inspect.isclass)
+    if name.endswith("ResponseSchema")
+]
+TRICKY_TEXT = 'Café ☕ "quoted" \\ back\\slash\n\ttab \x01 ctrl   sep 🚀'
+
+
+# Unicode, escapes, floats, nested JSON and nulls in every response schema
+SEEDED = {
+    "client_fields": {
+        "name": TRICKY_TEXT[:100], "email": "p@example.com", "company": "Ünïcode GmbH",
+        "logo_url": "https://example.com/logo.png?a=1&b=2", "notes": TRICKY_TEXT * 3,
+    },
+    "projects": [{
+        "title": "Ω project", "description": TRICKY_TEXT, "deadline": "2030-02-28",
+        "deliverables": [{"title": "Spec </script>", "due_date": "2030-01-15", "status": "in_progress"}],
+    }],
+    "agent_run": {"action": "risk_analysis", "status": "failed", "error_message": TRICKY_TEXT, "steps": [{
+        "step_number": 1, "action": "call_gemini", "output_data": None, "input_data": {
+            "prompt": TRICKY_TEXT, "temperature": 0.7, "scores": [0.1, 1.5, 12.3456, 0.0001, 100.0, -3.25],
+            "nested": {"z": [True, False, None], "a": {"b": [], "c": {}}}, "big": 2**53,
+        },
+    }]},
+}
+
+
+def _assert_same_bytes(app, obj):
+    fast, stdlib = OrjsonProvider(app), StdlibJSONProvider(app)
+    assert fast.response(obj).get_data() == stdlib.response(obj).get_data()
+    for kwargs in ({"separators": (",", ":")}, {"indent": 2}):
+        assert fast.dumps(obj, **kwargs) == stdlib.dumps(obj, **kwargs)
+
+
+@pytest.mark.parametrize("schema_cls", RESPONSE_SCHEMAS, ids=lambda cls: cls.__name__)
+def test_every_response_schema_encodes_identically(app, client, seed, schema_cls):
+    """Test each response schema's dump of every stored row encodes to the same bytes."""
+    seed(client, 801, **SEEDED)
+    with app.app_context():
+        rows = db.session.execute(db.select(schema_cls.Meta.model)).scalars().all()
+        assert rows
+        payload = schema_cls(many=True).dump(rows)
+        _assert_same_bytes(app, {"data": payload, "next_cursor": None})
+        _assert_same_bytes(app, {"data": payload[0]})
+
+
+def test_endpoints_respond_identically(app, client, seed, monkeypatch):
+    """Test GET endpoints return byte-identical bodies under either provider."""
+    tree = seed(client, 801, **SEEDED)
+    client_id, (project_id,), (deliverable_id,) = tree.client_id, tree.project_ids, tree.deliverable_ids
+    paths = [
+        "/api/clients", f"/api/clients/{client_id}?include=projects",
+        "/api/projects?facets=status", f"/api/projects/{project_id}?include=client,deliverables",
+        "/api/deliverables?sort=due_date", f"/api/deliverables/{deliverable_id}",
+        "/api/dashboard", "/api/search?q=project",
+    ]
+    bodies = {}
+    for provider in (OrjsonProvider, StdlibJSONProvider):
+        monkeypatch.setattr(app, "json", provider(app))
+        bodies[provider] = [client.get(path).data for path in paths]
+    assert bodies[OrjsonProvider] == bodies[StdlibJSONProvider]
+
+
+def test_edge_cases_fall_back_or_match(app):
+    """Test dates, oversized ints and non-string keys encode the same way."""
+    _assert_same_bytes(app, {
+        "date": date(2030, 1, 2),
+        "naive": datetime(2026, 1, 2, 3, 4, 5, 6),
+        "aware": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "huge": 2**70,
+    })
+    _assert_same_bytes(app, {2: "int keys", 10: "sort as strings"})
+    assert OrjsonProvider(app).dumps({"d": date(2030, 1, 2)}, separators=(",", ":")) == '{"d":"2030-01-02"}'
+    assert OrjsonProvider(app).loads('{"n": 18446744073709551616}') == {"n": 2**64}
+
+
+def test_request_bodies_parse_with_orjson(app, client, login):
+    """Test JSON request bodies still load, and malformed ones are a 400."""
+    login(client, 802)
+    assert isinstance(app.json, OrjsonProvider)
+    resp = client.post("/api/clients", json={"name": "Zoë", "email": "z@example.com"})
+    assert resp.get_json()["data"]["name"] == "Zoë"
+    resp = client.post("/api/clients", data="{not json", content_type="application/json")
+    assert resp.status_code == 400
+
+
+def test_provider_is_selected_by_config(app, monkeypatch):
+    """Test JSON_PROVIDER picks the provider and a missing orjson falls back."""
+    monkeypatch.setitem(app.config, "JSON_PROVIDER", "stdlib")
+    monkeypatch.setattr(app, "json", app.json)
+    init_json_provider(app)
+    assert type(app.json) is StdlibJSONProvider
+
+    monkeypatch.setitem(app.config, "JSON_PROVIDER", "orjson")
+    monkeypatch.setattr(json_provider, "orjson", None)
+    init_json_provider(app)
+    assert type(app.json) is StdlibJSONProvider
+
+    monkeypatch.setitem(app.config, "JSON_PROVIDER", "ujson")
+    with pytest.raises(ValueError):
+        init_json_provider(app)
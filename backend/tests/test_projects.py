@@ -54,17 +54,15 @@ def test_project_state_machine_api(auth_client):
     assert r.get_json()["error"]["code"] == "INVALID_STATE_TRANSITION"
 
 
-def test_get_project_scoped_to_user(client):
+def test_get_project_scoped_to_user(client, login):
     """Test that User B cannot see User A's projects."""
     # 1. User A creates a project
-    with client.session_transaction() as sess:
-        sess["user_id"] = 1
+    login(client, 1)
     c_resp = client.post("/api/clients", json={"name": "A", "email": "a@a.com"})
     pid = client.post("/api/projects", json={"client_id": 1, "title": "Private"}).get_json()["data"]["id"]
     
     # 2. User B tries to access it
-    with client.session_transaction() as sess:
-        sess["user_id"] = 2
+    login(client, 2)
     r = client.get(f"/api/projects/{pid}")
     assert r.status_code == 404  # Should be 404, not 200 or 403 (security by obscurity)
 
@@ -81,3 +79,153 @@ def test_delete_project_cascades(auth_client):
     
     # Verify gone
     assert auth_client.get(f"/api/projects/{project_id}").status_code == 404
+
+
+def test_list_projects_query_count_is_constant(client, assert_max_queries, login):
+    """Test GET /api/projects does not issue per-project progress queries."""
+    login(client, 102)
+    client_id = client.post("/api/clients", json={"name": "N1", "email": "n@n.com"}).get_json()["data"]["id"]
+
+    def add_projects(n):
+        for i in range(n):
+            pid = client.post("/api/projects", json={"client_id": client_id, "title": f"P{i}"}).get_json()["data"]["id"]
+            client.post("/api/deliverables", json={"project_id": pid, "title": "D"})
+
+    add_projects(2)
+    few = int(client.get("/api/projects").headers["X-Query-Count"])
+    add_projects(8)
+    with assert_max_queries(few):
+        client.get("/api/projects")
+    data = client.get(f"/api/clients/{client_id}/projects").get_json()["data"]
+    assert len(data) == 10
+    assert all(p["progress_percentage"] == 0 for p in data)
+
+
+def test_project_progress_percentage(auth_client):
+    """Test progress_percentage reflects completed deliverables in list and detail."""
+    client_id = auth_client.post("/api/clients", json={"name": "C", "email": "c@c.com"}).get_json()["data"]["id"]
+    pid = auth_client.post("/api/projects", json={"client_id": client_id, "title": "P"}).get_json()["data"]["id"]
+    d1 = auth_client.post("/api/deliverables", json={"project_id": pid, "title": "D1"}).get_json()["data"]["id"]
+    auth_client.post("/api/deliverables", json={"project_id": pid, "title": "D2"})
+    auth_client.patch(f"/api/deliverables/{d1}/status", json={"status": "in_progress"})
+    auth_client.patch(f"/api/deliverables/{d1}/status", json={"status": "completed"})
+
+    assert auth_client.get(f"/api/projects/{pid}").get_json()["data"]["progress_percentage"] == 50
+    listed = auth_client.get(f"/api/clients/{client_id}/projects").get_json()["data"]
+    assert listed[0]["progress_percentage"] == 50
+
+
+def test_project_counters_stay_consistent(app, auth_client):
+    """Test stored deliverable counters follow creates, transitions, moves and deletes."""
+    from app.extensions import db
+    from app.models import Deliverable
+    from app.models.project_counters import find_counter_drift
+
+    client_id = auth_client.post("/api/clients", json={"name": "K", "email": "k@k.com"}).get_json()["data"]["id"]
+    p1 = auth_client.post("/api/projects", json={"client_id": client_id, "title": "P1"}).get_json()["data"]["id"]
+    p2 = auth_client.post("/api/projects", json={"client_id": client_id, "title": "P2"}).get_json()["data"]["id"]
+    ids = [
+        auth_client.post(f"/api/projects/{p1}/deliverables", json={"title": f"D{i}"}).get_json()["data"]["id"]
+        for i in range(3)
+    ]
+    for status in ("in_progress", "completed"):
+        auth_client.patch(f"/api/deliverables/{ids[0]}/status", json={"status": status})
+    auth_client.delete(f"/api/deliverables/{ids[1]}")
+
+    moved = db.session.get(Deliverable, ids[0])
+    moved.project_id = p2
+    db.session.commit()
+
+    p1_data = auth_client.get(f"/api/projects/{p1}").get_json()["data"]
+    p2_data = auth_client.get(f"/api/projects/{p2}").get_json()["data"]
+    assert (p1_data["deliverable_count"], p1_data["completed_deliverable_count"]) == (1, 0)
+    assert (p2_data["deliverable_count"], p2_data["progress_percentage"]) == (1, 100)
+    assert find_counter_drift() == []
+
+
+def test_check_project_counters_command(app, auth_client):
+    """Test the consistency checker reports and fixes drifted counters."""
+    from app.extensions import db
+    from app.models import Project
+
+    client_id = auth_client.post("/api/clients", json={"name": "Q", "email": "q@q.com"}).get_json()["data"]["id"]
+    pid = auth_client.post("/api/projects", json={"client_id": client_id, "title": "P"}).get_json()["data"]["id"]
+    auth_client.post(f"/api/projects/{pid}/deliverables", json={"title": "D"})
+    db.session.get(Project, pid).deliverable_total = 7
+    db.session.commit()
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["check-project-counters"])
+    assert result.exit_code == 1
+    assert f"project {pid}: stored 0/7, actual 0/1" in result.output
+
+    runner.invoke(args=["check-project-counters", "--fix"])
+    assert runner.invoke(args=["check-project-counters"]).exit_code == 0
+
+
+def test_bulk_transition_projects(client, login):
+    """Test PATCH /projects/status moves allowed projects and keeps the dashboard count right."""
+    login(client, 103)
+    client_id = client.post("/api/clients", json={"name": "B", "email": "b@b.com"}).get_json()["data"]["id"]
+    ids = [
+        client.post("/api/projects", json={"client_id": client_id, "title": f"P{i}"}).get_json()["data"]["id"]
+        for i in range(3)
+    ]
+    client.patch(f"/api/projects/{ids[2]}/status", json={"status": "completed"})
+
+    resp = client.patch("/api/projects/status", json={"ids": ids + [999999], "status": "on_hold"})
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data["transitioned"] == ids[:2]
+    assert [(r["id"], r["code"]) for r in data["rejected"]] == [
+        (ids[2], "INVALID_STATE_TRANSITION"),
+        (999999, "NOT_FOUND"),
+    ]
+    assert client.get(f"/api/projects/{ids[0]}").get_json()["data"]["status"] == "on_hold"
+    assert client.get("/api/dashboard").get_json()["data"]["active_project_count"] == 0
+
+
+def test_project_detail_includes_related(client, login, assert_max_queries):
+    """Test ?include= nests deliverables and client with one SELECT per relationship."""
+    login(client, 104)
+    client_id = client.post("/api/clients", json={"name": "Inc", "email": "i@i.com"}).get_json()["data"]["id"]
+    pid = client.post("/api/projects", json={"client_id": client_id, "title": "P"}).get_json()["data"]["id"]
+    for i in range(3):
+        client.post(f"/api/projects/{pid}/deliverables", json={"title": f"D{i}"})
+
+    # ETag version, project, then one SELECT per include
+    with assert_max_queries(4):
+        resp = client.get(f"/api/projects/{pid}?include=deliverables,client")
+    data = resp.get_json()["data"]
+    assert data["client"]["name"] == "Inc"
+    assert [d["title"] for d in data["deliverables"]] == ["D2", "D1", "D0"]
+
+    with assert_max_queries(3):
+        resp = client.get(f"/api/projects/{pid}?include=client&fields=title")
+    assert resp.get_json()["data"] == {"title": "P", "client": resp.get_json()["data"]["client"]}
+
+    resp = client.get(f"/api/projects/{pid}?include=owner")
+    assert resp.status_code == 400
+    assert resp.get_json()["error"]["code"] == "INVALID_INCLUDE"
+    assert "deliverables" not in client.get(f"/api/projects/{pid}").get_json()["data"]
+
+
+def test_list_projects_filters_and_facets(client, login):
+    """Test ?status= and ?client_id= filter in SQL, with per-status facet counts."""
+    login(client, 106)
+    first, second = (
+        client.post("/api/clients", json={"name": n, "email": f"{n}@f.com"}).get_json()["data"]["id"]
+        for n in ("first", "second")
+    )
+    ids = [
+        client.post("/api/projects", json={"client_id": cid, "title": f"P{i}"}).get_json()["data"]["id"]
+        for i, cid in enumerate([first, first, second])
+    ]
+    client.patch(f"/api/projects/{ids[1]}/status", json={"status": "on_hold"})
+
+    body = client.get(f"/api/projects?client_id={first}&status=active&facets=status").get_json()
+    assert [p["id"] for p in body["data"]] == [ids[0]]
+    assert body["facets"]["status"] == {"active": 1, "completed": 0, "on_hold": 1}
+    assert "facets" not in client.get("/api/projects").get_json()
+
+    assert client.get("/api/projects?status=archived").status_code == 400
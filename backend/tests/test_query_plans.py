@@ -0,0 +1,283 @@
+"""Query-plan regression suite.
+
+Every API endpoint is called against a seeded database while all SQL is
+captured. Each captured statement is then run through SQLite's
+EXPLAIN QUERY PLAN, and the test fails if a statement touching one of the
+watched tables falls back to a full SCAN instead of an index SEARCH.
+
+A failure message names the endpoint, the statement, the plan and a
+proposed composite index built from the statement's WHERE / ORDER BY
+columns, e.g.:
+
+    CREATE INDEX ix_deliverables_project_id_status_due_date
+        ON deliverables (project_id, status, due_date)
+
+Adding an endpoint without adding it to ENDPOINT_CALLS fails
+test_every_endpoint_is_covered, so new routes cannot skip the check.
+"""
+
+import io
+import re
+import pytest
+from sqlalchemy import event, insert
+from app import create_app
+from app.extensions import db
+from app.models import AgentRun, Client, User
+
+WATCHED_TABLES = ("clients", "projects", "deliverables", "agent_runs")
+
+# (method, url rule, concrete path, json body). Paths use ids from _seed().
+# A body of {part: (text, filename)} is sent as a multipart upload.
+ENDPOINT_CALLS = [
+    ("POST", "/api/auth/signup", "/api/auth/signup",
+     {"email": "new@example.com", "password": "password123", "username": "newuser"}),
+    ("POST", "/api/auth/login", "/api/auth/login",
+     {"email": "plan@example.com", "password": "password123"}),
+    ("GET", "/api/clients", "/api/clients", None),
+    ("POST", "/api/clients", "/api/clients", {"name": "New", "email": "n@example.com"}),
+    ("GET", "/api/clients/<int:client_id>", "/api/clients/{client}?include=projects", None),
+    ("PUT", "/api/clients/<int:client_id>", "/api/clients/{client}", {"name": "Renamed"}),
+    ("DELETE", "/api/clients/<int:client_id>", "/api/clients/{doomed_client}", None),
+    ("GET", "/api/clients/<int:client_id>/projects", "/api/clients/{client}/projects", None),
+    ("GET", "/api/projects", "/api/projects", None),
+    ("GET", "/api/projects",
+     "/api/projects?status=active,on_hold&due_after=2000-01-01&sort=deadline&facets=status", None),
+    ("POST", "/api/projects", "/api/projects", {"client_id": "{client}", "title": "New"}),
+    ("GET", "/api/projects/<int:project_id>", "/api/projects/{project}?include=deliverables,client",
+     None),
+    ("PUT", "/api/projects/<int:project_id>", "/api/projects/{project}", {"title": "Renamed"}),
+    ("PATCH", "/api/projects/<int:project_id>/status", "/api/projects/{project}/status",
+     {"status": "on_hold"}),
+    ("PATCH", "/api/projects/status", "/api/projects/status",
+     {"ids": ["{project}", "{other}"], "status": "active"}),
+    ("DELETE", "/api/projects/<int:project_id>", "/api/projects/{doomed_project}", None),
+    ("POST", "/api/projects/<int:project_id>/deliverables", "/api/projects/{project}/deliverables",
+     {"title": "New"}),
+    ("GET", "/api/projects/<int:project_id>/deliverables", "/api/projects/{project}/deliverables", None),
+    ("POST", "/api/projects/<int:project_id>/deliverables/batch", "/api/projects/{project}/deliverables/batch",
+     [{"title": "Batch 1"}, {"title": "Batch 2"}]),
+    ("GET", "/api/deliverables", "/api/deliverables", None),
+    ("GET", "/api/deliverables",
+     "/api/deliverables?status=planned&client_id={client}&due_before=3000-01-01&sort=-due_date&facets=status",
+     None),
+    ("POST", "/api/deliverables", "/api/deliverables", {"project_id": "{project}", "title": "New"}),
+    ("GET", "/api/deliverables/<int:deliverable_id>", "/api/deliverables/{deliverable}", None),
+    ("PUT", "/api/deliverables/<int:deliverable_id>", "/api/deliverables/{deliverable}",
+     {"title": "Renamed"}),
+    ("PATCH", "/api/deliverables/<int:deliverable_id>/status", "/api/deliverables/{deliverable}/status",
+     {"status": "in_progress"}),
+    ("PATCH", "/api/deliverables/status", "/api/deliverables/status",
+     {"ids": ["{deliverable}", "{doomed_deliverable}"], "status": "blocked"}),
+    ("DELETE", "/api/deliverables/<int:deliverable_id>", "/api/deliverables/{doomed_deliverable}", None),
+    ("GET", "/api/dashboard", "/api/dashboard", None),
+    ("GET", "/api/search", "/api/search?q=deliv", None),
+    ("GET", "/api/export", "/api/export?format=csv", None),
+    ("POST", "/api/import", "/api/import", {
+        "clients": ("id,name,email\nk,Imported,k@example.com\n", "clients.csv"),
+        "projects": ('{"id": "p", "client_id": "k", "title": "Imported"}\n', "projects.ndjson"),
+        "deliverables": ("project_id,title\np,Imported\n", "deliverables.csv"),
+    }),
+    ("POST", "/api/ai/structure-scope", "/api/ai/structure-scope", {"text": "Build a landing page"}),
+    ("POST", "/api/ai/analyze-risk", "/api/ai/analyze-risk", {"project_id": "{project}"}),
+    ("POST", "/api/ai/generate-update", "/api/ai/generate-update", {"project_id": "{project}"}),
+]
+
+
+# ── Harness ──────────────────────────────────────────────────
+
+def capture_statements(engine, fn):
+    """Run fn() and return every (statement, parameters) it executed."""
+    captured = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if executemany:
+            parameters = parameters[0] if parameters else ()
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return captured
+
+
+def explain(connection, statement, parameters):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row[3] for row in rows]
+
+
+def full_scans(plan):
+    """Tables in WATCHED_TABLES that the plan reads with a full SCAN."""
+    pattern = re.compile(rf"^SCAN ({'|'.join(WATCHED_TABLES)})\b")
+    return [m.group(1) for m in map(pattern.match, plan) if m]
+
+
+def propose_index(table, statement):
+    """Suggest a composite index for the columns a statement filters/sorts on.
+
+    Equality columns come first, then range/inequality columns, then
+    ORDER BY columns — the order SQLite can use them in.
+    """
+    sql = " ".join(statement.split())
+    where, _, order_by = sql.partition(" ORDER BY ")
+    col = rf"{table}\.(\w+)"
+    equality = re.findall(rf"{col} (?:=|IN|IS)\s", where)
+    ranges = re.findall(rf"{col} (?:<|>|<=|>=|!=)\s", where)
+    ordering = re.findall(col, order_by.split(" LIMIT ")[0])
+
+    columns = []
+    for name in equality + ranges + ordering:
+        if name not in columns and name != "id":
+            columns.append(name)
+    if not columns:
+        return None
+    return f"CREATE INDEX ix_{table}_{'_'.join(columns)} ON {table} ({', '.join(columns)})"
+
+
+def assert_no_full_scans(engine, label, fn):
+    """Run fn() and fail with index proposals if any statement full-scans."""
+    problems = []
+    statements = capture_statements(engine, fn)
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                continue
+            plan = explain(connection, statement, parameters)
+            problems.extend(
+                f"{label}: full SCAN of {table}\n"
+                f"  SQL:  {' '.join(statement.split())}\n"
+                f"  plan: {plan}\n"
+                f"  proposed: {propose_index(table, statement)}"
+                for table in full_scans(plan)
+            )
+    assert not problems, "\n\n".join(problems)
+
+
+# ── Fixtures ─────────────────────────────────────────────────
+
+def _seed(client):
+    """Create a user with a realistic spread of data; return ids by name."""
+    token = client.post("/api/auth/signup", json={
+        "email": "plan@example.com", "password": "password123", "username": "planuser"
+    }).get_json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    ids = {}
+    for name in ("client", "doomed_client"):
+        ids[name] = client.post("/api/clients", headers=headers, json={
+            "name": name, "email": f"{name}@example.com"
+        }).get_json()["data"]["id"]
+    for name, owner in (("project", "client"), ("doomed_project", "client"), ("other", "doomed_client")):
+        ids[name] = client.post("/api/projects", headers=headers, json={
+            "client_id": ids[owner], "title": name
+        }).get_json()["data"]["id"]
+    for name in ("deliverable", "doomed_deliverable"):
+        ids[name] = client.post(f"/api/projects/{ids['project']}/deliverables", headers=headers, json={
+            "title": name, "due_date": "2999-01-01"
+        }).get_json()["data"]["id"]
+
+    # Bulk rows for other users so the planner sees more than one owner
+    user_id = db.session.get(Client, ids["client"]).user_id
+    db.session.execute(insert(User), [
+        {"id": user_id + 1 + i, "username": f"other{i}", "email": f"other{i}@x.com",
+         "password_hash": "!"} for i in range(5)
+    ])
+    db.session.execute(insert(Client), [
+        {"user_id": user_id + 1 + i % 5, "name": f"C{i}", "email": f"c{i}@x.com"} for i in range(50)
+    ])
+    db.session.execute(insert(AgentRun), [
+        {"user_id": user_id + 1 + i % 5, "action": "scope_structuring"} for i in range(50)
+    ])
+    db.session.commit()
+    return headers, ids
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        client = app.test_client()
+        headers, ids = _seed(client)
+        yield app, client, headers, ids
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture(autouse=True)
+def ai_mock_mode(monkeypatch):
+    """Run AI endpoints in Mock Mode, whatever earlier tests left behind."""
+    from app.api.ai import engine
+    monkeypatch.setattr(engine, "model", None)
+
+
+def _is_upload(body):
+    return isinstance(body, dict) and bool(body) and all(isinstance(v, tuple) for v in body.values())
+
+
+def _fill(value, ids):
+    if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
+        return ids[value[1:-1]]
+    if isinstance(value, str):
+        return value.format(**ids)
+    if isinstance(value, dict):
+        return {k: _fill(v, ids) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, ids) for v in value]
+    return value
+
+
+# ── Tests ────────────────────────────────────────────────────
+
+def test_every_endpoint_is_covered(seeded):
+    """Test ENDPOINT_CALLS lists every /api route and method."""
+    app = seeded[0]
+    routes = {
+        (method, rule.rule)
+        for rule in app.url_map.iter_rules()
+        if rule.rule.startswith("/api/")
+        for method in rule.methods - {"HEAD", "OPTIONS"}
+    }
+    covered = {(method, rule) for method, rule, _, _ in ENDPOINT_CALLS}
+    assert routes - covered == set(), "Add these routes to ENDPOINT_CALLS"
+
+
+@pytest.mark.parametrize(
+    "method, rule, path, body", ENDPOINT_CALLS, ids=[f"{m} {r}" for m, r, _, _ in ENDPOINT_CALLS]
+)
+def test_endpoint_uses_indexes(seeded, method, rule, path, body):
+    """Test no statement issued by the endpoint full-scans a watched table."""
+    app, client, headers, ids = seeded
+
+    def call():
+        if _is_upload(body):
+            files = {part: (io.BytesIO(text.encode()), name) for part, (text, name) in body.items()}
+            response = client.open(_fill(path, ids), method=method, headers=headers, data=files)
+        else:
+            response = client.open(_fill(path, ids), method=method, headers=headers, json=_fill(body, ids))
+        response.get_data()  # streamed responses (/api/export) query while iterating
+        assert response.status_code < 400, response.get_json()
+
+    assert_no_full_scans(db.engine, f"{method} {rule}", call)
+
+
+def test_harness_flags_scans_and_proposes_index(seeded):
+    """Test the harness catches an unindexed filter and proposes a composite index."""
+    statement = (
+        "SELECT deliverables.id FROM deliverables "
+        "WHERE deliverables.project_id = ? AND deliverables.status = ? "
+        "AND deliverables.due_date < ? ORDER BY deliverables.due_date"
+    )
+    # NOT INDEXED forces the plan a missing index would produce
+    plan = explain(
+        db.session.connection(),
+        statement.replace("FROM deliverables", "FROM deliverables NOT INDEXED"),
+        (1, "planned", "2030-01-01"),
+    )
+    assert full_scans(plan) == ["deliverables"]
+    assert propose_index("deliverables", statement) == (
+        "CREATE INDEX ix_deliverables_project_id_status_due_date "
+        "ON deliverables (project_id, status, due_date)"
+    )
@@ -0,0 +1,88 @@
+"""List endpoints and the dashboard read Core rows, never ORM instances."""
+
+from datetime import datetime, timedelta, timezone
+from contextlib import contextmanager
+from sqlalchemy import event
+from app.api.read_models import select_rows
+from app.extensions import db
+from app.models import Client, Deliverable, Project
+from app.models.user_stats import UserStats, compute_user_counts
+from app.schemas import DeliverableResponseSchema, ProjectResponseSchema
+
+
+@contextmanager
+def _loaded_instances():
+    """Collect every ORM instance loaded from the database in the block."""
+    loaded = []
+
+    def _record(target, context):
+        loaded.append(target)
+
+    event.listen(db.Model, "load", _record, propagate=True)
+    try:
+        yield loaded
+    finally:
+        event.remove(db.Model, "load", _record)
+
+
+# Three projects; the first has five deliverables, one of them completed (20%)
+SEEDED = {"projects": [
+    {"title": "P0", "deadline": "2031-01-01", "deliverables": [
+        {"title": "D0", "due_date": "2031-02-01", "status": "completed"},
+        *({"title": f"D{i}", "due_date": "2031-02-01"} for i in range(1, 5)),
+    ]},
+    {"title": "P1", "deadline": "2031-01-01"},
+    {"title": "P2", "deadline": "2031-01-01"},
+]}
+
+
+def test_list_endpoints_build_no_orm_instances(client, seed):
+    """Test the list endpoints and the dashboard return data without loading instances."""
+    seed(client, 901, **SEEDED)
+    paths = (
+        "/api/clients", "/api/projects?facets=status&sort=deadline", "/api/deliverables?status=planned",
+        "/api/projects?fields=id,progress_percentage", "/api/deliverables?limit=2", "/api/dashboard",
+    )
+    with _loaded_instances() as loaded:
+        for path in paths:
+            resp = client.get(path)
+            assert resp.status_code == 200
+            assert resp.get_json()["data"]
+    assert loaded == []
+
+
+def test_rows_dump_like_orm_instances(app, client, seed):
+    """Test a page served from rows equals the schemas' dump of the same ORM objects."""
+    seed(client, 902, **SEEDED)
+    projects = client.get("/api/projects").get_json()["data"]
+    deliverables = client.get("/api/deliverables?sort=due_date&limit=3")
+    page = deliverables.get_json()
+    more = client.get(f"/api/deliverables?sort=due_date&limit=3&cursor={page['next_cursor']}").get_json()
+    with app.app_context():
+        orm_projects = Project.query.filter_by(owner_id=902).order_by(Project.created_at.desc(), Project.id.desc())
+        assert projects == ProjectResponseSchema(many=True).dump(orm_projects)
+        assert {item["progress_percentage"] for item in projects} == {0, 20}
+        orm_deliverables = Deliverable.query.filter_by(owner_id=902).order_by(Deliverable.due_date, Deliverable.id)
+        assert page["data"] + more["data"] == DeliverableResponseSchema(many=True).dump(orm_deliverables)
+
+
+def test_select_rows_reads_only_needed_columns(app):
+    """Test ?fields= narrows the select to the fields, their computed columns and the page key."""
+    with app.app_context():
+        stmt = select_rows(ProjectResponseSchema, frozenset({"title", "progress_percentage"}), extra=["deadline"])
+        assert [column.name for column in stmt.selected_columns] == [
+            "created_at", "deadline", "deliverable_completed", "deliverable_total", "id", "title",
+        ]
+        assert "owner_id" not in [column.name for column in select_rows(ProjectResponseSchema).selected_columns]
+
+
+def test_dashboard_counts_recompute_stale_rows(app, client, seed):
+    """Test counts_for reads the row as is today, and recomputes it on a later day."""
+    seed(client, 903, **SEEDED)
+    with app.app_context():
+        now = datetime.now(timezone.utc)
+        assert UserStats.counts_for(903, now) == compute_user_counts(903, now)
+        tomorrow = now + timedelta(days=1)
+        assert UserStats.counts_for(903, tomorrow) == compute_user_counts(903, tomorrow)
+        assert db.session.get(UserStats, 903).overdue_as_of == tomorrow.date()
+        assert Client.query.filter_by(user_id=903).count() == 1
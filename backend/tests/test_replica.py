@@ -0,0 +1,116 @@
+"""Tests for read-replica routing (app/replica.py).
+
+The replica is a read-only SQLite file copied from the in-memory primary
+with sync_sqlite_replica(), so the tests control exactly how far it lags.
+"""
+
+import pytest
+from sqlalchemy import event
+from app import create_app
+from app.config import TestingConfig
+from app.extensions import db
+from app.replica import REPLICA_BIND, sync_sqlite_replica
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """App with a file replica; stickiness is off unless a test turns it on."""
+    replica = tmp_path / "replica.db"
+    monkeypatch.setattr(
+        TestingConfig, "READ_REPLICA_URL", f"sqlite:///file:{replica}?mode=ro&uri=true", raising=False
+    )
+    monkeypatch.setattr(TestingConfig, "READ_REPLICA_STICKY_SECONDS", 0, raising=False)
+    app = create_app("testing")
+    # No app context is held across requests, so each request gets its own
+    # session and g — as in production
+    _sync(app)
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+def _sync(app):
+    with app.app_context():
+        sync_sqlite_replica(db)
+
+
+@pytest.fixture
+def replica_queries(app):
+    """Statements executed on the replica engine."""
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engines[REPLICA_BIND]
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def _create_client(client, name="C"):
+    resp = client.post("/api/clients", json={"name": name, "email": "c@example.com"})
+    assert resp.status_code == 201
+    return resp.get_json()["data"]["id"]
+
+
+def test_get_reads_from_replica(app, replica_queries, login):
+    """Test GETs hit the replica and only see data once it has been synced."""
+    client = app.test_client()
+    login(client, 1)
+    _create_client(client)
+    assert replica_queries == []
+
+    assert client.get("/api/clients").get_json()["data"] == []
+    assert replica_queries
+
+    _sync(app)
+    assert len(client.get("/api/clients").get_json()["data"]) == 1
+
+
+def test_writer_sticks_to_primary(app, replica_queries, login):
+    """Test a user's reads stay on the primary for the window after a write."""
+    app.config["READ_REPLICA_STICKY_SECONDS"] = 30
+    writer, reader = app.test_client(), app.test_client()
+    login(writer, 1)
+    login(reader, 2)
+
+    _create_client(writer)
+    assert len(writer.get("/api/clients").get_json()["data"]) == 1
+    assert replica_queries == []
+
+    reader.get("/api/clients")
+    assert replica_queries
+
+
+def test_dashboard_on_lagging_replica(app, login):
+    """Test a replica missing the stats row doesn't break the dashboard."""
+    client = app.test_client()
+    login(client, 1)
+    _create_client(client)
+
+    for _ in range(2):
+        resp = client.get("/api/dashboard")
+        assert resp.status_code == 200
+        assert resp.get_json()["data"]["client_count"] == 1
+
+
+def test_pin_holds_on_every_worker(tmp_path, monkeypatch, login):
+    """Test a write on one worker keeps the user's reads on the primary on another."""
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setattr(
+        TestingConfig, "READ_REPLICA_URL",
+        f"sqlite:///file:{tmp_path / 'replica.db'}?mode=ro&uri=true", raising=False,
+    )
+    monkeypatch.setattr(TestingConfig, "READ_REPLICA_STICKY_SECONDS", 30, raising=False)
+    # Each worker has its own in-memory response cache
+    worker_a, worker_b = create_app("testing"), create_app("testing")
+    a, b = login(worker_a.test_client(), 1), login(worker_b.test_client(), 1)
+    _sync(worker_a)
+    etag = b.get("/api/clients").headers["ETag"]
+
+    _create_client(a)  # the replica is not synced again: it lags
+    resp = b.get("/api/clients", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert len(resp.get_json()["data"]) == 1
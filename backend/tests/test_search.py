@@ -0,0 +1,73 @@
+"""Tests for full-text search (app/search.py, GET /api/search)."""
+
+from app.extensions import db
+
+
+# "rocket" is in the client's name, the project's title and only the deliverable's body
+SEEDED = {
+    "client_fields": {
+        "name": "Acme Rockets", "email": "a@acme.com", "company": "Acme Corp",
+        "notes": "Prefers <b>weekly</b> rocket updates",
+    },
+    "projects": [{
+        "title": "Rocket launch site", "description": "Landing pad work",
+        "deliverables": [{"title": "Fuel report", "description": "Compare rocket fuel suppliers"}],
+    }],
+}
+
+
+def test_search_ranks_and_highlights(client, seed):
+    """Test results span all three kinds, title matches rank first, output is escaped."""
+    tree = seed(client, 501, **SEEDED)
+    client_id, (project_id,), (deliverable_id,) = tree.client_id, tree.project_ids, tree.deliverable_ids
+
+    results = client.get("/api/search?q=rocket").get_json()["data"]
+    assert {(r["type"], r["id"]) for r in results} == {
+        ("client", client_id), ("project", project_id), ("deliverable", deliverable_id),
+    }
+    assert results[-1]["type"] == "deliverable"  # body-only match ranks last
+    assert results[0]["title"] in ("Acme <mark>Rockets</mark>", "<mark>Rocket</mark> launch site")
+    assert client.get("/api/search?q=week").get_json()["data"] == []  # prefixes are opt-in
+
+    weekly = client.get("/api/search?q=week*").get_json()["data"]
+    assert "&lt;b&gt;<mark>weekly</mark>&lt;/b&gt;" in weekly[0]["snippet"]
+
+
+def test_search_is_scoped_and_injection_safe(client, seed, login):
+    """Test other users' rows never match, whatever the query syntax."""
+    seed(client, 502, **SEEDED)
+    login(client, 503)
+    assert client.get("/api/search?q=rocket").get_json()["data"] == []
+    resp = client.get('/api/search?q=rocket" OR owner:u502 OR "x')
+    assert resp.status_code == 200
+    assert resp.get_json()["data"] == []
+    assert client.get("/api/search?q=").status_code == 400
+
+
+def test_triggers_keep_index_in_sync(client, seed):
+    """Test updates, cascaded deletes and batch inserts are reflected in results."""
+    tree = seed(client, 504, **SEEDED)
+    client_id, (project_id,) = tree.client_id, tree.project_ids
+
+    client.put(f"/api/projects/{project_id}", json={"title": "Moon base"})
+    assert [r["type"] for r in client.get("/api/search?q=moon").get_json()["data"]] == ["project"]
+
+    client.post(f"/api/projects/{project_id}/deliverables/batch", json=[{"title": "Telescope"}])
+    assert len(client.get("/api/search?q=telescope").get_json()["data"]) == 1
+
+    client.delete(f"/api/clients/{client_id}")
+    assert client.get("/api/search?q=rocket").get_json()["data"] == []
+    assert client.get("/api/search?q=telescope").get_json()["data"] == []
+
+
+def test_rebuild_search_index_command(app, client, seed):
+    """Test the rebuild command repopulates a wiped index."""
+    seed(client, 505, **SEEDED)
+    db.session.execute(db.text("DELETE FROM search_index"))
+    db.session.commit()
+    assert client.get("/api/search?q=fuel").get_json()["data"] == []
+
+    result = app.test_cli_runner().invoke(args=["rebuild-search-index"])
+    assert result.exit_code == 0
+    assert "Indexed" in result.output
+    assert len(client.get("/api/search?q=fuel").get_json()["data"]) == 1
@@ -0,0 +1,81 @@
+"""Compiled serializers must dump exactly what the marshmallow response schemas dump."""
+
+import inspect
+from datetime import datetime
+import pytest
+from marshmallow import fields
+from app import schemas
+from app.extensions import db, ma
+from app.models import Project
+from app.serializers import compile_serializer, serializer
+
+RESPONSE_SCHEMAS = [
+    cls for name, cls in inspect.getmembers(schemas, inspect.isclass)
+    if name.endswith("ResponseSchema")
+]
+
+
+# Escapes, nulls and JSON across every response schema; one project has no deliverables
+SEEDED = {
+    "client_fields": {"name": 'Zoë "Q" \\ ☕', "notes": "line\nbreak"},
+    "projects": [
+        {"title": "No deliverables"},
+        {"title": "Three deliverables", "deadline": "2031-12-31", "deliverables": [
+            {"title": "A", "due_date": "2031-01-01", "status": "completed"}, {"title": "B", "due_date": None}, {"title": "C", "due_date": None},
+        ]},
+    ],
+    "agent_run": {"action": "risk_analysis", "status": "running", "finished_at": None, "steps": [
+        {"step_number": 1, "action": "fetch", "input_data": {"k": [1, None]}, "output_data": None},
+    ]},
+}
+
+
+@pytest.mark.parametrize("schema_cls", RESPONSE_SCHEMAS, ids=lambda cls: cls.__name__)
+def test_serializer_matches_schema_dump(app, client, seed, schema_cls):
+    """Test every stored row dumps identically, for all fields and each single field."""
+    seed(client, 803, **SEEDED)
+    with app.app_context():
+        rows = db.session.execute(db.select(schema_cls.Meta.model)).scalars().all()
+        assert rows
+        expected = schema_cls(many=True).dump(rows)
+        actual = serializer(schema_cls, many=True).dump(rows)
+        assert actual == expected
+        assert [list(item) for item in actual] == [list(item) for item in expected]
+        assert serializer(schema_cls).dump(rows[0]) == schema_cls().dump(rows[0])
+        for name in schema_cls().dump_fields:
+            only = frozenset([name])
+            assert serializer(schema_cls, only, many=True).dump(rows) == schema_cls(only=only, many=True).dump(rows)
+
+
+def test_progress_percentage_from_core_rows(app, client, seed):
+    """Test a Core row (no model properties) serializes like the ORM object."""
+    tree = seed(client, 804, **SEEDED)
+    assert client.get(f"/api/projects/{tree.project_ids[0]}").get_json()["data"]["progress_percentage"] == 0
+    with app.app_context():
+        projects = db.session.execute(db.select(Project).where(Project.owner_id == 804)).scalars().all()
+        rows = db.session.execute(db.select(Project.__table__).where(Project.owner_id == 804)).all()
+        dumped = serializer(schemas.ProjectResponseSchema, many=True).dump(rows)
+        assert dumped == schemas.ProjectResponseSchema(many=True).dump(projects)
+        assert sorted(item["progress_percentage"] for item in dumped) == [0, 33]
+
+
+def test_dates_match_marshmallow_iso_format(app):
+    """Test aware and naive datetimes, and datetimes in Date fields, format alike."""
+    with app.app_context():
+        project = Project(id=1, client_id=2, title="t", status="active",
+                          deadline=datetime(2030, 5, 6, 7, 8), deliverable_total=0, deliverable_completed=0,
+                          created_at=datetime(2026, 1, 2, 3, 4, 5, 678901), updated_at=None)
+        schema_cls = schemas.ProjectResponseSchema
+        assert serializer(schema_cls).dump(project) == schema_cls().dump(project)
+        assert serializer(schema_cls).dump(project)["deadline"] == "2030-05-06"
+
+
+def test_unsupported_field_fails_at_compile_time(app):
+    """Test a field the compiler does not know is an error, not silently different output."""
+
+    class NestedResponseSchema(ma.Schema):
+        id = fields.Integer()
+        tags = fields.List(fields.String())
+
+    with pytest.raises(TypeError, match="NestedResponseSchema.tags"):
+        compile_serializer(NestedResponseSchema)
@@ -1,14 +1,17 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/services/api';
 import { toast } from 'react-hot-toast';
 
 export function useClients() {
     const queryClient = useQueryClient();
 
-    const clientsQuery = useQuery({
+    const clientsQuery = useInfiniteQuery({
         queryKey: ['clients'],
-        queryFn: api.getClients,
-        select: (response) => response.data,
+        // One page per request; fetchNextPage() follows the server's next_cursor
+        queryFn: ({ pageParam }) => api.getClients(pageParam),
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+        select: (data) => data.pages.flatMap((page) => page.data),
     });
 
     const createClientMutation = useMutation({
@@ -42,6 +45,9 @@ export function useClients() {
         clients: clientsQuery.data || [],
         isLoading: clientsQuery.isLoading,
         error: clientsQuery.error,
+        hasMore: clientsQuery.hasNextPage,
+        loadMore: clientsQuery.fetchNextPage,
+        isLoadingMore: clientsQuery.isFetchingNextPage,
         createClient: createClientMutation.mutate,
         updateClient: updateClientMutation.mutate,
         deleteClient: deleteClientMutation.mutate,
@@ -51,7 +57,8 @@ export function useClients() {
 export function useClient(id) {
     return useQuery({
         queryKey: ['clients', id],
-        queryFn: () => api.getClient(id),
+        // Same key and request as useProjects(clientId): one round-trip per page
+        queryFn: () => api.getClient(id, 'projects'),
         enabled: !!id,
         select: (response) => response.data,
     });
@@ -6,16 +6,16 @@ export function useDeliverables(projectId) {
     const queryClient = useQueryClient();
 
     const deliverablesQuery = useQuery({
-        queryKey: ['deliverables', projectId],
-        queryFn: () => api.getProjectDeliverables(projectId),
+        // Shares the useProject(projectId) query: the project detail embeds its deliverables
+        queryKey: ['project', projectId],
+        queryFn: () => api.getProject(projectId, 'deliverables'),
         enabled: !!projectId,
-        select: (response) => response.data,
+        select: (response) => response.data.deliverables,
     });
 
     const updateStatusMutation = useMutation({
         mutationFn: ({ id, status }) => api.updateDeliverableStatus(id, status),
         onSuccess: () => {
-            queryClient.invalidateQueries({ queryKey: ['deliverables', projectId] });
             queryClient.invalidateQueries({ queryKey: ['project', projectId] });
             toast.success('Status updated.');
         },
@@ -27,7 +27,6 @@ export function useDeliverables(projectId) {
     const deleteDeliverableMutation = useMutation({
         mutationFn: api.deleteDeliverable,
         onSuccess: () => {
-            queryClient.invalidateQueries({ queryKey: ['deliverables', projectId] });
             queryClient.invalidateQueries({ queryKey: ['project', projectId] });
             toast.success('Deliverable deleted.');
         },
@@ -36,7 +35,6 @@ export function useDeliverables(projectId) {
     const createDeliverableMutation = useMutation({
         mutationFn: (data) => api.createDeliverable(projectId, data),
         onSuccess: () => {
-            queryClient.invalidateQueries({ queryKey: ['deliverables', projectId] });
             queryClient.invalidateQueries({ queryKey: ['project', projectId] });
             toast.success('Deliverable created.');
         },
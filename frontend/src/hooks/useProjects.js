@@ -1,4 +1,4 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/services/api';
 import { toast } from 'react-hot-toast';
 
@@ -6,16 +6,17 @@ export function useProjects(clientId) {
     const queryClient = useQueryClient();
 
     const projectsQuery = useQuery({
-        queryKey: ['projects', 'client', clientId],
-        queryFn: () => api.getClientProjects(clientId),
+        // Shares the useClient(clientId) query: the client detail embeds its projects
+        queryKey: ['clients', clientId],
+        queryFn: () => api.getClient(clientId, 'projects'),
         enabled: !!clientId,
-        select: (response) => response.data,
+        select: (response) => response.data.projects,
     });
 
     const createProjectMutation = useMutation({
         mutationFn: api.createProject,
         onSuccess: () => {
-            queryClient.invalidateQueries({ queryKey: ['projects', 'client', clientId] });
+            queryClient.invalidateQueries({ queryKey: ['clients', clientId] });
             queryClient.invalidateQueries({ queryKey: ['projects', 'all'] });
             toast.success('Project created.');
         },
@@ -25,7 +26,7 @@ export function useProjects(clientId) {
     const deleteProjectMutation = useMutation({
         mutationFn: api.deleteProject,
         onSuccess: () => {
-            queryClient.invalidateQueries({ queryKey: ['projects', 'client', clientId] });
+            queryClient.invalidateQueries({ queryKey: ['clients', clientId] });
             queryClient.invalidateQueries({ queryKey: ['projects', 'all'] });
             toast.success('Project deleted.');
         },
@@ -40,18 +41,32 @@ export function useProjects(clientId) {
     };
 }
 
-export function useAllProjects() {
-    return useQuery({
-        queryKey: ['projects', 'all'],
-        queryFn: api.getProjects,
-        select: (response) => response.data,
+export function useAllProjects(params = {}) {
+    const projectsQuery = useInfiniteQuery({
+        queryKey: ['projects', 'all', params],
+        // Filtered server-side, e.g. { status: 'active', sort: 'deadline' };
+        // fetchNextPage() follows the server's next_cursor
+        queryFn: ({ pageParam }) => api.getProjects(params, pageParam),
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+        select: (data) => data.pages.flatMap((page) => page.data),
     });
+
+    return {
+        projects: projectsQuery.data || [],
+        isLoading: projectsQuery.isLoading,
+        error: projectsQuery.error,
+        hasMore: projectsQuery.hasNextPage,
+        loadMore: projectsQuery.fetchNextPage,
+        isLoadingMore: projectsQuery.isFetchingNextPage,
+    };
 }
 
 export function useProject(id) {
     return useQuery({
         queryKey: ['project', id],
-        queryFn: () => api.getProject(id),
+        // Same key and request as useDeliverables(id): one round-trip per page
+        queryFn: () => api.getProject(id, 'deliverables'),
         enabled: !!id,
         select: (response) => response.data,
     });
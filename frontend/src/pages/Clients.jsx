@@ -8,7 +8,10 @@ import { ClientModal } from '@/components/ClientModal';
 
 export function Clients() {
     const navigate = useNavigate();
-    const { clients, isLoading, error, createClient, updateClient, deleteClient } = useClients();
+    const {
+        clients, isLoading, error, hasMore, loadMore, isLoadingMore,
+        createClient, updateClient, deleteClient,
+    } = useClients();
     const [modalOpen, setModalOpen] = useState(false);
     const [editingClient, setEditingClient] = useState(null);
 
@@ -121,6 +124,19 @@ export function Clients() {
                 </div>
             )}
 
+            {hasMore && (
+                <div className="flex justify-center">
+                    <Button
+                        onClick={() => loadMore()}
+                        disabled={isLoadingMore}
+                        variant="ghost"
+                        className="text-neutral-400 hover:text-white"
+                    >
+                        {isLoadingMore ? 'Loading...' : 'Load more clients'}
+                    </Button>
+                </div>
+            )}
+
             <ClientModal
                 isOpen={modalOpen}
                 onClose={() => { setModalOpen(false); setEditingClient(null); }}
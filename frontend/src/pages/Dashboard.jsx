@@ -23,7 +23,13 @@ const STATUS_COLORS = {
 export function Dashboard() {
     const navigate = useNavigate();
     const { summary, isLoading: dashLoading, error: dashError } = useDashboard();
-    const { data: allProjects = [], isLoading: projLoading } = useAllProjects();
+    const {
+        projects: activeProjects,
+        isLoading: projLoading,
+        hasMore: hasMoreProjects,
+        loadMore: loadMoreProjects,
+        isLoadingMore: loadingMoreProjects,
+    } = useAllProjects({ status: 'active' });
 
     const isLoading = dashLoading || projLoading;
 
@@ -52,8 +58,6 @@ export function Dashboard() {
         { label: "Global Risk Score", value: `${riskScore}%`, icon: ShieldAlert, color: riskScore > 50 ? "text-red-400" : "text-emerald-400", glow: riskScore > 50 ? "bg-red-500" : "bg-emerald-500" },
     ];
 
-    const activeProjects = (allProjects || []).filter(p => p.status === 'active');
-
     return (
         <div className="space-y-12 pb-20">
             {/* Header */}
@@ -90,7 +94,7 @@ export function Dashboard() {
             <div className="space-y-4">
                 <div className="flex items-center justify-between border-b border-neutral-800 pb-4">
                     <h2 className="text-lg font-bold text-white tracking-tight">Active Projects</h2>
-                    <span className="text-[10px] font-bold text-neutral-600 uppercase tracking-widest">{activeProjects.length} active</span>
+                    <span className="text-[10px] font-bold text-neutral-600 uppercase tracking-widest">{activeProjects.length}{hasMoreProjects ? '+' : ''} active</span>
                 </div>
 
                 {activeProjects.length === 0 ? (
@@ -131,6 +135,19 @@ export function Dashboard() {
                         })}
                     </div>
                 )}
+
+                {hasMoreProjects && (
+                    <div className="flex justify-center">
+                        <Button
+                            onClick={() => loadMoreProjects()}
+                            disabled={loadingMoreProjects}
+                            variant="ghost"
+                            className="text-neutral-400 hover:text-white"
+                        >
+                            {loadingMoreProjects ? 'Loading...' : 'Load more projects'}
+                        </Button>
+                    </div>
+                )}
             </div>
         </div>
     );
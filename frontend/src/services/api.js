@@ -46,16 +46,20 @@ export const api = {
     signup: (data) => request('/auth/signup', { method: 'POST', body: JSON.stringify(data) }),
 
     // Clients
-    getClients: () => request('/clients'),
-    getClient: (id) => request(`/clients/${id}`),
+    // Lists are keyset-paginated: pass the previous page's next_cursor for the next page
+    getClients: (cursor) => request(`/clients${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`),
+    getClient: (id, include) => request(`/clients/${id}${include ? `?include=${include}` : ''}`),
     createClient: (data) => request('/clients', { method: 'POST', body: JSON.stringify(data) }),
     updateClient: (id, data) => request(`/clients/${id}`, { method: 'PUT', body: JSON.stringify(data) }),
     deleteClient: (id) => request(`/clients/${id}`, { method: 'DELETE' }),
 
     // Projects (nested under client)
     getClientProjects: (clientId) => request(`/clients/${clientId}/projects`),
-    getProjects: () => request('/projects'),
-    getProject: (id) => request(`/projects/${id}`),
+    getProjects: (params = {}, cursor) => {
+        const query = new URLSearchParams(cursor ? { ...params, cursor } : params).toString();
+        return request(`/projects${query ? `?${query}` : ''}`);
+    },
+    getProject: (id, include) => request(`/projects/${id}${include ? `?include=${include}` : ''}`),
     createProject: (data) => request('/projects', { method: 'POST', body: JSON.stringify(data) }),
     updateProject: (id, data) => request(`/projects/${id}`, { method: 'PUT', body: JSON.stringify(data) }),
     deleteProject: (id) => request(`/projects/${id}`, { method: 'DELETE' }),